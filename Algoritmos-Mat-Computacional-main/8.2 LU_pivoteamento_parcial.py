@@ -1,59 +1,86 @@
 # V
 
-def lu_decomposition_with_pivoting(A, b):
-    n = len(A)
-
-    # Inicialização dos vetores
-    p = list(range(n))
-
-    # Decomposição LU com pivotamento
-    for k in range(n - 1):
-        # Encontra o pivô
-        pv = abs(A[k][k])
-        r = k
-        for i in range(k + 1, n):
-            if abs(A[i][k]) > pv:
-                pv = abs(A[i][k])
-                r = i
-
-        if pv == 0:
+class LUFactorization:
+    # Fatora PA = LU uma vez; L (multiplicadores) e U ficam juntas em LU e a permutação em p
+    def __init__(self, A):
+        n = len(A)
+        self.n = n
+
+        # Copia A para não alterar a matriz de quem chamou
+        LU = [list(map(float, linha)) for linha in A]
+        p = list(range(n))
+
+        # Decomposição LU com pivotamento
+        for k in range(n - 1):
+            # Encontra o pivô
+            pv = abs(LU[k][k])
+            r = k
+            for i in range(k + 1, n):
+                if abs(LU[i][k]) > pv:
+                    pv = abs(LU[i][k])
+                    r = i
+
+            if pv == 0:
+                raise ValueError("A matriz A é singular.")
+
+            # Troca as linhas caso necessário
+            if r != k:
+                p[k], p[r] = p[r], p[k]
+                LU[k], LU[r] = LU[r], LU[k]
+
+            # Atualização da matriz LU
+            for i in range(k + 1, n):
+                m = LU[i][k] / LU[k][k]
+                LU[i][k] = m
+                for j in range(k + 1, n):
+                    LU[i][j] -= m * LU[k][j]
+
+        # O laço não passa pela última coluna, então o último pivô é conferido aqui
+        if LU[n - 1][n - 1] == 0:
             raise ValueError("A matriz A é singular.")
 
-        # Troca as linhas caso necessário
-        if r != k:
-            p[k], p[r] = p[r], p[k]
-            A[k], A[r] = A[r], A[k]
-
-        # Atualização da matriz A
-        for i in range(k + 1, n):
-            m = A[i][k] / A[k][k]
-            A[i][k] = m
-            for j in range(k + 1, n):
-                A[i][j] -= m * A[k][j]
-
-    # Substituição de Pb
-    c = [0] * n
-    for i in range(n):
-        r = p[i]
-        c[i] = b[r]
-
-    # Substituição direta Ly = c
-    y = [0] * n
-    for i in range(n):
-        soma = 0
-        for j in range(i):
-            soma += A[i][j] * y[j]
-        y[i] = c[i] - soma
-
-    # Substituição retroativa Ux = y
-    x = [0] * n
-    for i in range(n - 1, -1, -1):
-        soma = 0
-        for j in range(i + 1, n):
-            soma += A[i][j] * x[j]
-        x[i] = (y[i] - soma) / A[i][i]
-
-    return x
+        self.LU = LU
+        self.p = p
+
+    def solve(self, b):
+        n = self.n
+        A = self.LU
+
+        # Substituição de Pb
+        c = [0] * n
+        for i in range(n):
+            r = self.p[i]
+            c[i] = b[r]
+
+        # Substituição direta Ly = c
+        y = [0] * n
+        for i in range(n):
+            soma = 0
+            for j in range(i):
+                soma += A[i][j] * y[j]
+            y[i] = c[i] - soma
+
+        # Substituição retroativa Ux = y
+        x = [0] * n
+        for i in range(n - 1, -1, -1):
+            soma = 0
+            for j in range(i + 1, n):
+                soma += A[i][j] * x[j]
+            x[i] = (y[i] - soma) / A[i][i]
+
+        return x
+
+    def solve_many(self, B):
+        # B é n x k com um b por coluna (como no numpy) e a resposta é n x k com um x por coluna
+        # Cada b custa só as substituições (O(n²)), a fatoração não é refeita
+        if len(B) != self.n:
+            raise ValueError("B precisa ter n linhas, uma coluna por vetor b.")
+        solucoes = [self.solve(coluna) for coluna in zip(*B)]
+        return [list(linha) for linha in zip(*solucoes)]
+
+
+def lu_decomposition_with_pivoting(A, b):
+    return LUFactorization(A).solve(b)
 
 # Exemplo de uso:
 A = [[2, -1, -2],
@@ -63,3 +90,11 @@ b = [1, 2, 3]
 
 x = lu_decomposition_with_pivoting(A, b)
 print("Solução:", x)
+
+# Vários b com a mesma matriz: fatora uma vez só
+# B = [b | I], um b por coluna; as soluções voltam nas colunas (as três últimas formam A⁻¹)
+lu = LUFactorization(A)
+B = [[1, 1, 0, 0],
+     [2, 0, 1, 0],
+     [3, 0, 0, 1]]
+print("Soluções (colunas):", lu.solve_many(B))
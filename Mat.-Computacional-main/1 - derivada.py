@@ -1,5 +1,7 @@
 import sympy as sp
 
+from expressoes import compilar
+
 
 def menu():
     print("\nEscolha o tipo de derivada:")
@@ -65,9 +67,16 @@ def derivada_sem_sympy():
         print("Resultado da regra da cadeia:", f_prime(g_x) * g_prime(x))
 
     elif escolha == 3:  # Derivada parcial
+        # Lê e compila a expressão uma única vez (só números, x, y, z e funções matemáticas)
+        try:
+            expressao = compilar(input("Digite a função multivariada (ex: x**2 + y**2 + z**2): "),
+                                 ("x", "y", "z"))
+        except ValueError as erro:
+            print(erro)
+            return
+
         def funcao(vars):
-            x, y, z = vars
-            return eval(input("Digite a função multivariada (ex: x**2 + y**2 + z**2): "))
+            return expressao(*vars)
         ponto = list(
             map(float, input("Digite os valores das variáveis no ponto (x y z): ").split()))
         var_index = int(
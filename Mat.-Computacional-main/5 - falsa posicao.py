@@ -4,28 +4,54 @@ import sys
 e = sys.float_info.epsilon
 
 
-def posicao_falsa(f, a, b, e, max_iter=100000):
-    if f(a) * f(b) > 0:
+def fator_escala(variante, f_substituido, fc):
+    # Fator que reduz f no extremo retido duas vezes seguidas (sempre entre 0 e 1)
+    if variante == "illinois":
+        return 0.5
+    if variante == "pegasus":
+        return f_substituido / (f_substituido + fc)
+    m = 1 - fc / f_substituido  # anderson_bjorck
+    return m if m > 0 else 0.5
+
+
+def posicao_falsa(f, a, b, e, max_iter=100000, variante="classica"):
+    # variante: "classica", "illinois", "pegasus" ou "anderson_bjorck"
+    # retorna (raiz, iterações, avaliações de f)
+    if variante not in ("classica", "illinois", "pegasus", "anderson_bjorck"):
+        raise ValueError(f"Variante desconhecida: {variante}")
+
+    fa = f(a)
+    fb = f(b)
+    nfev = 2  # contador de avaliações de f
+
+    if fa * fb > 0:
         return "Intervalo inválido: f(a) e f(b) devem ter sinais opostos"
 
     iter_count = 0  # contador de iterações
+    lado_anterior = None  # extremo substituído na iteração anterior
 
     while abs(b - a) > e and iter_count < max_iter:
-        c = (a * f(b) - b * f(a)) / (f(b) - f(a))
-
-        if f(c) == 0:
-            return c
-        elif f(a) * f(c) < 0:
-            b = c
-        else:
-            a = c
-
+        c = (a * fb - b * fa) / (fb - fa)
+        fc = f(c)
+        nfev += 1
         iter_count += 1  # incrementa contador de iterações
 
-    if iter_count == max_iter:
-        return c
+        if fc == 0:
+            return c, iter_count, nfev
+        elif fa * fc < 0:
+            # a retido duas vezes seguidas: reduz f(a)
+            if variante != "classica" and lado_anterior == "b":
+                fa *= fator_escala(variante, fb, fc)
+            b, fb = c, fc
+            lado_anterior = "b"
+        else:
+            # b retido duas vezes seguidas: reduz f(b)
+            if variante != "classica" and lado_anterior == "a":
+                fb *= fator_escala(variante, fa, fc)
+            a, fa = c, fc
+            lado_anterior = "a"
 
-    return c
+    return c, iter_count, nfev
 
 
 def f1(x):
@@ -50,3 +76,7 @@ print(posicao_falsa(f2, 0.1, 2, e))
 print("-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=")
 print("Raiz da função f3(x) = x*log(x) - 1")
 print(posicao_falsa(f3, 1, 3, e))
+print("-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=")
+print("Comparação das variantes em f(x) = e^(-2x) - x^2 (raiz, iterações, avaliações)")
+for variante in ("classica", "illinois", "pegasus", "anderson_bjorck"):
+    print(variante, posicao_falsa(lambda x: math.exp(-2*x) - x**2, 0, 1, 1e-12, variante=variante))
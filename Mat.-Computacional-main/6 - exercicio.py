@@ -1,6 +1,9 @@
 import math
+from concurrent.futures import ProcessPoolExecutor
 
-# Funções de teste
+import numpy as np
+
+# Funções de teste (escritas com NumPy para aceitarem tanto números quanto vetores)
 
 
 def f1(x):
@@ -8,31 +11,133 @@ def f1(x):
 
 
 def f2(x):
-    return math.log(x + 3) - math.sin(x)  # Logaritmo + seno
+    return np.log(x + 3) - np.sin(x)  # Logaritmo + seno
 
 
 def f3(x):
-    return math.exp(-x) - x**3  # Exponencial + polinômio
+    return np.exp(-x) - x**3  # Exponencial + polinômio
 
 
 def f4(x):
-    return math.sin(x) - 0.5*x  # Seno + multiplicação
+    return np.sin(x) - 0.5*x  # Seno + multiplicação
 
 
 def f5(x):
     return 1 / (x**2 + 1) - 0.5  # Divisão + raiz
 
+# Avaliação de f em uma grade de pontos
+
+
+def avaliar_pontos(f, xs):
+    # Uma única chamada vetorizada; funções só escalares (math.*, ou que testam x em um if)
+    # e resultados que não têm um valor por ponto caem no laço
+    with np.errstate(all="ignore"):
+        try:
+            fs = np.asarray(f(xs), dtype=float)
+            if fs.shape == xs.shape:
+                return fs
+        except (TypeError, ValueError):
+            pass
+        return np.array([f(x) for x in xs], dtype=float)
+
+
+def avaliar_grade(f, a, b, step=0.1):
+    # Pontos a, a + step, ..., até passar de b (os mesmos de test_sign)
+    n = max(int(math.ceil((b - a) / step)), 1)
+    xs = a + step * np.arange(n + 1)
+    return xs, avaliar_pontos(f, xs)
+
 # Algoritmo de testagem do sinal
 
 
 def test_sign(f, a, b, step=0.1):
-    intervals = []
-    x = a
-    while x < b:
-        if f(x) * f(x + step) < 0:  # Mudança de sinal
-            intervals.append((x, x + step))
-        x += step
-    return intervals
+    # Cada ponto é avaliado uma única vez
+    xs, fs = avaliar_grade(f, a, b, step)
+    trocas = np.flatnonzero(fs[:-1] * fs[1:] < 0)  # Mudança de sinal
+    return [(float(xs[i]), float(xs[i + 1])) for i in trocas]
+
+# Varredura adaptativa
+
+
+def varredura_adaptativa(f, a, b, step=1.0, passo_minimo=1e-3, orcamento=2000, fator=2.0):
+    """
+    Começa com uma grade grossa (passo step) e divide ao meio apenas as células
+    que podem esconder uma troca de sinal. Uma célula [x0, x1] sem troca de sinal
+    é suspeita quando |f(x0)| + |f(x1)| <= L * (x1 - x0), onde L é a maior
+    inclinação estimada na célula e nas vizinhas, multiplicada por fator
+    (se f tivesse inclinação no máximo L, só assim ela poderia tocar o zero).
+    Para quando não há células suspeitas maiores que passo_minimo ou quando
+    o orçamento de avaliações acaba (as células mais suspeitas têm prioridade).
+    Retorna (xs, fs, nfev) com a grade final, não uniforme.
+    """
+    xs, fs = avaliar_grade(f, a, b, step)
+    nfev = len(xs)
+
+    while nfev < orcamento:
+        h = np.diff(xs)
+        inclinacao = np.abs(np.diff(fs)) / h
+        # Maior inclinação entre a célula e as vizinhas
+        L = inclinacao.copy()
+        L[1:] = np.maximum(L[1:], inclinacao[:-1])
+        L[:-1] = np.maximum(L[:-1], inclinacao[1:])
+        L *= fator
+
+        # Célula plana (L == 0) não pode esconder um zero: folga infinita, nunca suspeita
+        with np.errstate(divide="ignore", invalid="ignore"):
+            folga = (np.abs(fs[:-1]) + np.abs(fs[1:])) / (L * h)
+        folga[L == 0] = np.inf
+        suspeitas = (fs[:-1] * fs[1:] > 0) & (folga <= 1) & (h > passo_minimo)
+        celulas = np.flatnonzero(suspeitas)
+        if celulas.size == 0:
+            break
+
+        # Respeita o orçamento: refina primeiro as células com menor folga
+        restante = orcamento - nfev
+        if celulas.size > restante:
+            celulas = celulas[np.argsort(folga[celulas])[:restante]]
+
+        meios = (xs[celulas] + xs[celulas + 1]) / 2
+        f_meios = avaliar_pontos(f, meios)
+        nfev += len(meios)
+
+        ordem = np.argsort(np.concatenate((xs, meios)), kind="stable")
+        xs = np.concatenate((xs, meios))[ordem]
+        fs = np.concatenate((fs, f_meios))[ordem]
+
+    return xs, fs, nfev
+
+
+def test_sign_adaptativo(f, a, b, step=1.0, passo_minimo=1e-3, orcamento=2000):
+    # Mesmo resultado de test_sign, mas com a grade adaptativa; retorna (intervalos, nfev)
+    xs, fs, nfev = varredura_adaptativa(f, a, b, step, passo_minimo, orcamento)
+    trocas = np.flatnonzero(fs[:-1] * fs[1:] < 0)
+    return [(float(xs[i]), float(xs[i + 1])) for i in trocas], nfev
+
+# Detecção de intervalos candidatos a raiz
+
+
+def detectar_intervalos(xs, fs):
+    """
+    Retorna uma lista de (a, b, tipo):
+    - tipo "sinal": f troca de sinal em [a, b]
+    - tipo "exato": f(a) == 0 em um ponto da grade (a == b)
+    - tipo "minimo": |f| tem um mínimo local em [a, b] sem troca de sinal,
+      que pode esconder uma raiz dupla
+    """
+    intervalos = []
+    for i in np.flatnonzero(fs == 0):
+        intervalos.append((float(xs[i]), float(xs[i]), "exato"))
+    for i in np.flatnonzero(fs[:-1] * fs[1:] < 0):
+        intervalos.append((float(xs[i]), float(xs[i + 1]), "sinal"))
+
+    # Mínimos locais de |f| em pontos interiores com o mesmo sinal dos vizinhos
+    absf = np.abs(fs)
+    meio = slice(1, -1)
+    minimos = (absf[meio] < absf[:-2]) & (absf[meio] <= absf[2:])
+    minimos &= (fs[:-2] * fs[meio] > 0) & (fs[meio] * fs[2:] > 0)
+    for i in np.flatnonzero(minimos) + 1:
+        intervalos.append((float(xs[i - 1]), float(xs[i + 1]), "minimo"))
+    return intervalos
 
 # Método da Bisseção
 
@@ -83,3 +188,83 @@ def newton_raphson(f, df, x0, tol, max_iter=100):
 
 def df1(x):
     return 6*x**5 - 8*x**3 + 1
+
+# Refinamento de um intervalo candidato
+
+
+def minimo_modulo(f, a, b, tol):
+    # Busca da seção áurea pelo mínimo de |f| em [a, b]
+    r = (math.sqrt(5) - 1) / 2
+    c = b - r * (b - a)
+    d = a + r * (b - a)
+    fc, fd = abs(f(c)), abs(f(d))
+    while abs(b - a) > tol:
+        if fc < fd:
+            b, d, fd = d, c, fc
+            c = b - r * (b - a)
+            fc = abs(f(c))
+        else:
+            a, c, fc = c, d, fd
+            d = a + r * (b - a)
+            fd = abs(f(d))
+    return (a + b) / 2
+
+
+def refinar(args):
+    # Recebe uma tupla para poder ser usada com ProcessPoolExecutor.map
+    f, a, b, tipo, tol, tol_f = args
+    if tipo == "exato":
+        return a
+    if tipo == "sinal":
+        return bisection(f, a, b, tol)[0]
+    # Mínimo de |f|: só é raiz se |f| chegar perto de zero
+    x = minimo_modulo(f, a, b, tol)
+    return x if abs(f(x)) < tol_f else None
+
+# Busca de todas as raízes em um intervalo
+
+
+def encontrar_raizes(f, a, b, step=0.1, tol=1e-10, tol_f=1e-10, processos=None, orcamento=None):
+    """
+    Encontra todas as raízes de f em [a, b]:
+    1. avalia f na grade com uma chamada vetorizada (ou, se orcamento for
+       dado, na grade adaptativa de varredura_adaptativa com passo inicial step);
+    2. detecta trocas de sinal e mínimos de |f| perto de zero (raízes duplas);
+    3. refina cada intervalo em paralelo com um pool de processos.
+
+    f precisa ser uma função definida no nível do módulo (não lambda) para
+    ser enviada aos processos; com processos=1 tudo roda no processo atual.
+    Retorna a lista ordenada de raízes.
+    """
+    if orcamento is None:
+        xs, fs = avaliar_grade(f, a, b, step)
+    else:
+        xs, fs, _ = varredura_adaptativa(f, a, b, step, orcamento=orcamento)
+    tarefas = [(f, xa, xb, tipo, tol, tol_f) for xa, xb, tipo in detectar_intervalos(xs, fs)]
+
+    if processos == 1 or len(tarefas) <= 1:
+        raizes = list(map(refinar, tarefas))
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as pool:
+            raizes = list(pool.map(refinar, tarefas))
+
+    return sorted(float(x) for x in raizes if x is not None)
+
+
+def f6(x):
+    return (x - 1)**2 * (x + 2)  # Raiz dupla em x = 1, sem troca de sinal
+
+
+def f7(x):
+    return np.sin(x) + 0.999  # Pares de raízes muito próximas (distância ~0.09)
+
+
+if __name__ == "__main__":
+    for f in (f1, f2, f3, f4, f5, f6):
+        print(f.__name__, encontrar_raizes(f, -10, 10))
+
+    # Grade uniforme densa x grade adaptativa em um intervalo largo
+    densa = test_sign(f7, -100, 100, step=0.01)
+    adaptativa, nfev = test_sign_adaptativo(f7, -100, 100, step=1.0)
+    print(f"f7 uniforme: {len(densa)} trocas de sinal com {len(avaliar_grade(f7, -100, 100, 0.01)[0])} avaliações")
+    print(f"f7 adaptativa: {len(adaptativa)} trocas de sinal com {nfev} avaliações")
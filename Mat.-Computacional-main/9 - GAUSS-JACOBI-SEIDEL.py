@@ -1,41 +1,121 @@
 import numpy as np
 
+from monitor_convergencia import MonitorConvergencia
+
+# Os tres metodos retornam um ResultadoIterativo (x, iteracoes, motivo da parada, historico,
+# taxa de contracao): o monitor para cedo se o metodo divergir ou estagnar
+
 def gauss_jacobi(A, b, x0, tol=1e-5, max_iter=1000):
-    n = len(b)
-    x = x0.copy()
+    # A = D + R: D^-1 e R montados uma vez, cada iteracao e um unico produto R @ x
+    A = np.asarray(A, dtype=float)
+    D_inv = 1.0 / np.diag(A)
+    R = A.copy()
+    np.fill_diagonal(R, 0.0)
+
+    # Dois vetores pre-alocados que se alternam entre "atual" e "novo"
+    x = np.array(x0, dtype=float)
+    x_new = np.empty_like(x)
+    monitor = MonitorConvergencia(tol, max_iter)
     for k in range(max_iter):
-        x_new = np.zeros_like(x)
-        for i in range(n):
-            sum_ = np.dot(A[i, :], x) - A[i, i] * x[i]
-            x_new[i] = (b[i] - sum_) / A[i, i]
-        
-        if np.linalg.norm(x_new - x, ord=np.inf) < tol:
-            return x_new, k + 1
-        x = x_new
+        np.dot(R, x, out=x_new)
+        np.subtract(b, x_new, out=x_new)
+        x_new *= D_inv
+
+        motivo = monitor.registrar(np.linalg.norm(x_new - x, ord=np.inf))
+        if motivo:
+            return monitor.resultado(x_new, k + 1, motivo, "Gauss-Jacobi")
+        x, x_new = x_new, x
     
-    return x, max_iter
+    return monitor.resultado(x, max_iter, None, "Gauss-Jacobi")
 
 
-def gauss_seidel(A, b, x0, tol=1e-5, max_iter=1000):
+def gauss_seidel(A, b, x0, tol=1e-5, max_iter=1000, verificar_a_cada=1):
+    # Com verificar_a_cada=1 (padrao) o residuo verdadeiro ||A x - b|| e calculado a cada
+    # varredura e a varredura e o Gauss-Seidel de sempre.
+    # Com verificar_a_cada=k > 1 a varredura guarda o residuo da linha i no momento em que ela
+    # e atualizada (b[i] - A[i, :] x, com os valores ja novos de x[:i]; x[i] muda exatamente
+    # residuo[i] / A[i, i]) e o residuo verdadeiro so e calculado a cada k varreduras ou quando
+    # essa estimativa, reduzida pela contracao observada, fica abaixo de tol. A estimativa fica
+    # atrasada, entao a parada pode vir uma (ou ate k - 1) varreduras depois, em troca de um
+    # produto A @ x a menos por varredura.
+    # O monitor recebe o residuo verdadeiro a cada vez que ele e calculado.
     n = len(b)
     x = x0.copy()
+    estimar = verificar_a_cada > 1
+    residuo = np.empty(n)
+    estimativa_anterior = np.inf
+    monitor = MonitorConvergencia(tol, max_iter)
     for k in range(max_iter):
-        for i in range(n):
-            sum_ = np.dot(A[i, :], x) - A[i, i] * x[i]
-            x[i] = (b[i] - sum_) / A[i, i]
-        
-        if np.linalg.norm(np.dot(A, x) - b, ord=np.inf) < tol:
-            return x, k + 1
+        if estimar:
+            for i in range(n):
+                residuo[i] = b[i] - np.dot(A[i, :], x)
+                x[i] += residuo[i] / A[i, i]
+
+            estimativa = np.max(np.abs(residuo))
+            contracao = min(estimativa / estimativa_anterior, 1.0) if estimativa_anterior > 0 else 0.0
+            estimativa_anterior = estimativa
+            verificar = estimativa * contracao < tol or (k + 1) % verificar_a_cada == 0
+        else:
+            for i in range(n):
+                x[i] += (b[i] - np.dot(A[i, :], x)) / A[i, i]
+            verificar = True
+
+        if verificar:
+            motivo = monitor.registrar(np.linalg.norm(np.dot(A, x) - b, ord=np.inf))
+            if motivo:
+                return monitor.resultado(x, k + 1, motivo, "Gauss-Seidel")
     
-    return x, max_iter
+    return monitor.resultado(x, max_iter, None, "Gauss-Seidel")
+
+def gradiente_conjugado(A, b, x0, tol=1e-5, max_iter=1000, precondicionador=None):
+    # Para A simetrica positiva definida; precondicionador="jacobi" usa M = diag(A)
+    # Para como o gauss_seidel: ||A x - b|| (norma infinito) < tol; o historico guarda essa norma
+    if precondicionador not in (None, "jacobi"):
+        raise ValueError(f"Pre-condicionador desconhecido: {precondicionador!r}. Use None ou 'jacobi'.")
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    M_inv = 1.0 / np.diag(A) if precondicionador == "jacobi" else np.ones(len(b))
+
+    x = np.array(x0, dtype=float)
+    metodo = "CG" if precondicionador is None else "PCG"
+    monitor = MonitorConvergencia(tol, max_iter)
+    if not b.any():
+        # Sistema homogeneo: com A invertivel a solucao e x = 0
+        return monitor.resultado(np.zeros_like(x), 0, monitor.registrar(0.0), metodo)
+    r = b - A @ x
+    z = M_inv * r
+    p = z.copy()
+    rz = r @ z
+    motivo = monitor.registrar(np.linalg.norm(r, ord=np.inf))
+    for k in range(max_iter):
+        if motivo:
+            return monitor.resultado(x, k, motivo, metodo)
+        Ap = A @ p
+        alfa = rz / (p @ Ap)
+        x += alfa * p
+        r -= alfa * Ap
+        motivo = monitor.registrar(np.linalg.norm(r, ord=np.inf))
+        z = M_inv * r
+        rz_novo = r @ z
+        p = z + (rz_novo / rz) * p
+        rz = rz_novo
+
+    return monitor.resultado(x, max_iter, motivo, metodo)
 
 def comparar_metodos(A, b, x0, tol=1e-5):
 
-    x_jacobi, it_jacobi = gauss_jacobi(A, b, x0, tol)
-    print(f"Gauss-Jacobi: {x_jacobi} em {it_jacobi} iterações")
+    jacobi = gauss_jacobi(A, b, x0, tol)
+    print(f"Gauss-Jacobi: {jacobi.x} em {jacobi.iteracoes} iterações ({jacobi})")
+
+    seidel = gauss_seidel(A, b, x0, tol)
+    print(f"Gauss-Seidel: {seidel.x} em {seidel.iteracoes} iterações ({seidel})")
+
+    # A do exemplo é simétrica positiva definida: o CG termina em no máximo n iterações
+    cg = gradiente_conjugado(A, b, x0, tol)
+    print(f"Gradiente conjugado: {cg.x} em {cg.iteracoes} iterações (resíduos: {np.round(cg.historico, 6)})")
 
-    x_seidel, it_seidel = gauss_seidel(A, b, x0, tol)
-    print(f"Gauss-Seidel: {x_seidel} em {it_seidel} iterações")
+    pcg = gradiente_conjugado(A, b, x0, tol, precondicionador="jacobi")
+    print(f"Gradiente conjugado com pré-condicionador de Jacobi: {pcg.x} em {pcg.iteracoes} iterações")
 
 A = np.array([[4, -1, 0, 0],
               [-1, 4, -1, 0],
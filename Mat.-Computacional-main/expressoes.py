@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Compilador Seguro de Expressões Matemáticas
+==========================================
+
+Este módulo transforma a expressão digitada pelo usuário (por exemplo, "(9*x - 3) ** (1/3)")
+em uma função Python, analisando e compilando o texto uma única vez.
+
+Antes, as calculadoras faziam g = lambda x: eval(texto, {...}), o que analisava e compilava
+a string a cada avaliação (o custo dominante para funções baratas) e permitia executar
+qualquer código Python digitado pelo usuário.
+
+Aqui a expressão é convertida em uma árvore sintática (AST) e só são aceitos:
+- números, as variáveis declaradas e as operações + - * / // % ** e sinais;
+- chamadas às funções matemáticas permitidas (sin, exp, log10, ...), também na forma math.sin;
+- as constantes pi, e, tau e inf.
+Qualquer outra coisa (atributos, índices, lambdas, nomes desconhecidos, __import__...) é rejeitada.
+
+Funcionalidades:
+1. Função compilar(texto, variaveis) que retorna uma ExpressaoCompilada (com cache por texto).
+2. ExpressaoCompilada é chamável como uma função comum: g(x) ou f(x, y, z).
+3. Versão vetorizada com NumPy (g.vetorizada(xs)), gerada a partir do mesmo código compilado.
+4. Espaço de nomes trocável (com_funcoes), por exemplo para avaliar com números duais.
+"""
+
+import ast  # Análise sintática da expressão
+import functools  # Cache das expressões já compiladas
+import math  # Implementação escalar das funções permitidas
+
+# Funções e constantes que a expressão pode usar, com a implementação escalar (módulo math)
+FUNCOES_MATH = {
+    "sin": math.sin, "cos": math.cos, "tan": math.tan,
+    "asin": math.asin, "acos": math.acos, "atan": math.atan, "atan2": math.atan2,
+    "sinh": math.sinh, "cosh": math.cosh, "tanh": math.tanh,
+    "exp": math.exp, "log": math.log, "log10": math.log10, "log2": math.log2,
+    "sqrt": math.sqrt, "fabs": math.fabs, "floor": math.floor, "ceil": math.ceil,
+    "pow": math.pow, "hypot": math.hypot, "factorial": math.factorial,
+    "abs": abs, "min": min, "max": max,
+    "pi": math.pi, "e": math.e, "tau": math.tau, "inf": math.inf,
+}
+
+# Nomes equivalentes no NumPy, usados na versão vetorizada
+_NOMES_NUMPY = {
+    "asin": "arcsin", "acos": "arccos", "atan": "arctan", "atan2": "arctan2",
+    "pow": "power", "abs": "abs",
+}
+
+# Operadores aceitos na expressão
+_OPERADORES = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.UAdd, ast.USub)
+
+
+class _Validador(ast.NodeTransformer):
+    """
+    Percorre a AST da expressão, rejeitando o que não é permitido e trocando math.nome por nome.
+    """
+
+    def __init__(self, variaveis):
+        self.permitidos = set(variaveis) | set(FUNCOES_MATH)
+
+    def generic_visit(self, no):
+        # Só os tipos de nó tratados explicitamente abaixo são aceitos
+        if not isinstance(no, (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Load) + _OPERADORES):
+            raise ValueError(f"Construção não permitida na expressão: {type(no).__name__}.")
+        return super().generic_visit(no)
+
+    def visit_BinOp(self, no):
+        if isinstance(no.op, ast.BitXor):
+            raise ValueError("Use ** para potência (o operador ^ não é permitido).")
+        return self.generic_visit(no)
+
+    def visit_Constant(self, no):
+        if type(no.value) not in (int, float):
+            raise ValueError(f"Constante não permitida na expressão: {no.value!r}.")
+        return no
+
+    def visit_Name(self, no):
+        if no.id not in self.permitidos:
+            raise ValueError(f"Nome desconhecido na expressão: {no.id}.")
+        return no
+
+    def visit_Attribute(self, no):
+        # Aceita apenas math.nome, reescrito como nome para usar o espaço de nomes escolhido
+        if not (isinstance(no.value, ast.Name) and no.value.id == "math" and no.attr in FUNCOES_MATH):
+            raise ValueError(f"Atributo não permitido na expressão: {ast.unparse(no)}.")
+        return ast.copy_location(ast.Name(id=no.attr, ctx=ast.Load()), no)
+
+    def visit_Call(self, no):
+        # Só chamadas diretas a funções permitidas, sem argumentos nomeados
+        funcao = self.visit(no.func)
+        if not isinstance(funcao, ast.Name) or not callable(FUNCOES_MATH.get(funcao.id)):
+            raise ValueError(f"Chamada não permitida na expressão: {ast.unparse(no.func)}.")
+        if no.keywords:
+            raise ValueError("Argumentos nomeados não são permitidos na expressão.")
+        no.func = funcao
+        no.args = [self.visit(argumento) for argumento in no.args]
+        return no
+
+
+class ExpressaoCompilada:
+    """
+    Expressão validada e compilada uma única vez, chamável como uma função Python.
+
+    Atributos:
+        texto (str): Expressão original digitada pelo usuário.
+        variaveis (tuple of str): Nomes das variáveis, na ordem dos argumentos.
+        codigo (code): Código compilado de lambda variaveis: expressão.
+    """
+
+    __slots__ = ("texto", "variaveis", "codigo", "_funcao", "_vetorizada")
+
+    def __init__(self, texto, variaveis, codigo):
+        self.texto = texto
+        self.variaveis = variaveis
+        self.codigo = codigo
+        self._funcao = self.com_funcoes(FUNCOES_MATH)
+        self._vetorizada = None
+
+    def __call__(self, *valores):
+        return self._funcao(*valores)
+
+    def __repr__(self):
+        return f"ExpressaoCompilada({self.texto!r}, variaveis={self.variaveis})"
+
+    def com_funcoes(self, funcoes):
+        """
+        Cria a função Python da expressão usando outro espaço de nomes para as funções.
+
+        Parâmetros:
+            funcoes (dict): Nome -> implementação (por exemplo, as funções de
+                            diferenciacao_automatica para avaliar com números duais).
+
+        Retorna:
+            function: Função de aridade len(variaveis).
+        """
+        # O código compilado é o de uma lambda; executá-lo só cria o objeto função
+        return eval(self.codigo, {"__builtins__": {}, **funcoes})
+
+    def vetorizada(self, *valores):
+        """
+        Avalia a expressão elemento a elemento em arrays NumPy, em uma única chamada.
+
+        Retorna:
+            numpy.ndarray: Valores da expressão em cada ponto.
+
+        Levanta:
+            ImportError: Se o NumPy não estiver instalado.
+        """
+        import numpy as np  # Dependência opcional, só necessária para a versão vetorizada
+
+        if self._vetorizada is None:
+            funcoes = {nome: getattr(np, _NOMES_NUMPY.get(nome, nome), valor) for nome, valor in FUNCOES_MATH.items()}
+            funcoes["factorial"] = np.vectorize(math.factorial, otypes=[float])
+            # np.minimum e np.maximum recebem só dois argumentos: min(x, 1, 2) é dobrado par a par
+            funcoes["min"] = lambda *argumentos: functools.reduce(np.minimum, argumentos)
+            funcoes["max"] = lambda *argumentos: functools.reduce(np.maximum, argumentos)
+            self._vetorizada = self.com_funcoes(funcoes)
+        return self._vetorizada(*(np.asarray(valor, dtype=float) for valor in valores))
+
+
+@functools.lru_cache(maxsize=128)
+def compilar(texto, variaveis=("x",)):
+    """
+    Analisa, valida e compila a expressão do usuário uma única vez.
+
+    Parâmetros:
+        texto (str): Expressão matemática, por exemplo "(9*x - 3) ** (1/3)" ou "x - 1.3*(x*math.log10(x) - 1)".
+        variaveis (tuple of str): Variáveis que a expressão pode usar, na ordem dos argumentos.
+
+    Retorna:
+        ExpressaoCompilada: Expressão chamável, por exemplo g = compilar("10 ** (1/x)"); g(2.0).
+
+    Levanta:
+        ValueError: Se a expressão tiver erro de sintaxe ou usar algo não permitido.
+    """
+    try:
+        arvore = ast.parse(texto.strip(), mode="eval")
+    except SyntaxError as erro:
+        raise ValueError(f"Erro de sintaxe na expressão: {erro.msg}.") from None
+    arvore = _Validador(variaveis).visit(arvore)
+
+    # Monta "lambda variaveis: expressão" e compila uma única vez
+    argumentos = ast.arguments(posonlyargs=[], args=[ast.arg(arg=nome) for nome in variaveis],
+                               kwonlyargs=[], kw_defaults=[], defaults=[])
+    lambda_ = ast.Expression(body=ast.Lambda(args=argumentos, body=arvore.body))
+    codigo = compile(ast.fix_missing_locations(lambda_), "<expressão>", "eval")
+    return ExpressaoCompilada(texto, tuple(variaveis), codigo)
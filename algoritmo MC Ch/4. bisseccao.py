@@ -11,12 +11,15 @@ Funcionalidades:
 3. Definição da precisão desejada.
 4. Exibição detalhada de cada iteração do método.
 5. Retorno da raiz aproximada com a precisão especificada.
+6. Modo em lote (bisseccao_lote) para resolver milhares de intervalos de uma vez com NumPy.
 
 
 """
 
 import math  # Importa a biblioteca matemática para funções como logaritmo e seno
 
+import numpy as np  # Importa o NumPy para o modo em lote (vetorizado) da Bissecção
+
 def f(x):
     """
     Define a função f(x) cuja raiz será buscada.
@@ -133,6 +136,93 @@ def bisseccao(a, b, e, max_iter=1000):
     # Retorna a raiz aproximada encontrada e o número de iterações
     return (raiz_aproximada, iteracao - 1)
 
+def bisseccao_lote(f, a, b, e, params=(), max_iter=1000):
+    """
+    Método da Bissecção em lote: resolve vários intervalos [a, b] ao mesmo tempo.
+
+    Todos os intervalos são divididos ao meio em conjunto (uma única chamada vetorizada
+    de f por iteração) e as "pistas" que já convergiram são retiradas do lote, de forma
+    que f só é avaliada nos intervalos que ainda estão ativos.
+
+    Parâmetros:
+        f (function): Função vetorizada f(x, *params) que aceita arrays NumPy.
+        a (array_like): Limites inferiores dos intervalos.
+        b (array_like): Limites superiores dos intervalos.
+        e (float): Precisão desejada para o cálculo.
+        params (tuple of array_like): Parâmetros extras repassados a f, um valor por intervalo.
+        max_iter (int): Número máximo de iterações permitidas.
+
+    Retorna:
+        tuple: (raízes aproximadas, número de iterações, convergiu), três arrays com o
+        mesmo formato de a e b. Intervalos em que f(a) e f(b) não têm sinais opostos
+        recebem raiz NaN, 0 iterações e convergiu = False.
+
+    Exemplo:
+        >>> k = np.linspace(1, 10, 10000)
+        >>> raizes, iters, ok = bisseccao_lote(lambda x, k: x**2 - k, 0, 4, 1e-10, params=(k,))
+    """
+    # Coloca a, b e os parâmetros no mesmo formato e trabalha com vetores 1D
+    a, b, *params = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float),
+                                        *[np.asarray(p) for p in params])
+    formato = a.shape
+    a = a.ravel().copy()  # Limites inferiores atuais
+    b = b.ravel().copy()  # Limites superiores atuais
+    params = [p.ravel() for p in params]
+
+    # Vetores de resultado
+    raizes = np.full(a.size, np.nan)
+    iteracoes = np.zeros(a.size, dtype=int)
+    convergiu = np.zeros(a.size, dtype=bool)
+
+    # Calcula f(a) e f(b) para todos os intervalos de uma vez
+    fa = np.asarray(f(a, *params), dtype=float)
+    fb = np.asarray(f(b, *params), dtype=float)
+
+    # Um dos extremos já é raiz exata
+    raiz_em_a = fa == 0
+    raiz_em_b = (fb == 0) & ~raiz_em_a
+    raizes[raiz_em_a] = a[raiz_em_a]
+    raizes[raiz_em_b] = b[raiz_em_b]
+    convergiu |= raiz_em_a | raiz_em_b
+
+    # Intervalos válidos: f(a) e f(b) com sinais opostos
+    validos = np.signbit(fa) != np.signbit(fb)
+    validos &= ~convergiu
+
+    # Intervalos que já começam menores que a precisão
+    estreitos = validos & (np.abs(b - a) <= e)
+    raizes[estreitos] = (a[estreitos] + b[estreitos]) / 2
+    convergiu |= estreitos
+
+    # Índices das pistas que ainda precisam iterar
+    ativos = np.flatnonzero(validos & ~estreitos)
+    iteracao = 1
+
+    # Loop principal: divide todos os intervalos ativos ao meio em conjunto
+    while ativos.size and iteracao <= max_iter:
+        ai = a[ativos]
+        bi = b[ativos]
+        ci = (ai + bi) / 2  # Ponto médio de cada intervalo ativo
+        fci = np.asarray(f(ci, *[p[ativos] for p in params]), dtype=float)
+        iteracoes[ativos] = iteracao
+        raizes[ativos] = ci  # Última aproximação de cada pista ativa
+
+        # Pistas que convergiram nesta iteração (mesmo critério de bisseccao)
+        terminou = (fci == 0) | ((bi - ai) / 2 < e)
+        convergiu[ativos[terminou]] = True
+
+        # Atualiza os limites com uma máscara: a raiz está em [ai, ci] ou em [ci, bi]
+        esquerda = np.signbit(fa[ativos]) != np.signbit(fci)
+        b[ativos] = np.where(esquerda, ci, bi)
+        a[ativos] = np.where(esquerda, ai, ci)
+        fa[ativos] = np.where(esquerda, fa[ativos], fci)
+
+        # Retira do lote as pistas que já convergiram
+        ativos = ativos[~terminou]
+        iteracao += 1
+
+    return raizes.reshape(formato), iteracoes.reshape(formato), convergiu.reshape(formato)
+
 def main():
     """
     Função principal que controla o fluxo do programa.
@@ -11,6 +11,7 @@ Funcionalidades:
 3. Definição dos critérios de precisão.
 4. Exibição detalhada de cada iteração do método.
 5. Retorno da raiz aproximada com a precisão especificada.
+6. Variantes modificadas (Illinois, Pegasus e Anderson-Björck) que evitam a estagnação de um extremo.
 
 
 """
@@ -31,8 +32,32 @@ def f(x):
     """
     return e**(-2*x) - x**2  # Exemplo de função. Modifique conforme necessário.
 
+# Variantes aceitas pelo método da posição falsa
+VARIANTES = ("classica", "illinois", "pegasus", "anderson_bjorck")
+
+# Define o fator de escala aplicado ao extremo que ficou parado
+def fator_escala(variante, f_substituido, fx):
+    """
+    Calcula o fator m que multiplica f do extremo retido pela segunda vez seguida.
+
+    Parâmetros:
+        variante (str): "illinois", "pegasus" ou "anderson_bjorck".
+        f_substituido (float): Valor de f no extremo que acabou de ser substituído por x.
+        fx (float): Valor de f no novo ponto x.
+
+    Retorna:
+        float: Fator m, sempre entre 0 e 1, o que preserva a troca de sinal do intervalo.
+    """
+    if variante == "illinois":
+        return 0.5  # Illinois: divide f do extremo retido por 2
+    if variante == "pegasus":
+        return f_substituido / (f_substituido + fx)  # Pegasus
+    # Anderson-Björck: usa 1 - f(x)/f(substituído), com Illinois como salvaguarda
+    m = 1 - fx / f_substituido
+    return m if m > 0 else 0.5
+
 # Define a função que implementa o método da posição falsa
-def posicao_falsa(a, b, e1, e2):
+def posicao_falsa(a, b, e1, e2, variante="classica"):
     """
     Método da posição falsa para encontrar a raiz de uma função f(x) no intervalo [a, b].
 
@@ -41,17 +66,27 @@ def posicao_falsa(a, b, e1, e2):
         b (float): Limite superior do intervalo inicial.
         e1 (float): Critério de parada baseado na largura do intervalo.
         e2 (float): Critério de parada baseado na proximidade de f(x) de 0.
+        variante (str): "classica" (padrão), "illinois", "pegasus" ou "anderson_bjorck".
+            Nas variantes modificadas, quando o mesmo extremo é retido duas vezes seguidas
+            o valor de f nesse extremo é reduzido, o que evita a convergência lenta da
+            posição falsa clássica em funções convexas.
 
     Retorna:
-        float: Raiz aproximada de f(x) no intervalo [a, b].
+        tuple: (raiz aproximada, número de iterações, número de avaliações de f)
 
     Levanta:
-        ValueError: Se f(a) * f(b) >= 0, indicando que não há garantia de raiz no intervalo.
+        ValueError: Se f(a) * f(b) >= 0, indicando que não há garantia de raiz no intervalo,
+                    ou se a variante for desconhecida.
     """
 
+    # Verifica se a variante pedida existe
+    if variante not in VARIANTES:
+        raise ValueError(f"Variante desconhecida: {variante}. Use uma de {VARIANTES}.")
+
     # Calcula f(a) e f(b) para verificar a condição inicial
     fa = f(a)  # Valor da função no limite inferior
     fb = f(b)  # Valor da função no limite superior
+    nfev = 2   # Contador de avaliações de f
 
     # Exibe os valores iniciais de f(a) e f(b)
     print(f"Verificando o intervalo inicial:")
@@ -69,6 +104,7 @@ def posicao_falsa(a, b, e1, e2):
     # Exibe os valores iniciais do intervalo
     print("\nIniciando o Método da Posição Falsa:")
     print(f"Função definida: f(x) = e^(-2x) - x^2")
+    print(f"Variante: {variante}")
     print(f"Intervalo inicial: [{a}, {b}]")
     print(f"Critérios de parada:")
     print(f"  - Largura do intervalo < {e1}")
@@ -80,18 +116,21 @@ def posicao_falsa(a, b, e1, e2):
         if abs(fa) < e2:
             print("O intervalo inicial já atende aos critérios de parada.")
             print(f"Raiz aproximada: {a}\n")
-            return a
+            return a, 0, nfev
         # Se o valor de f(b) for suficientemente próximo de 0, retorna b como a raiz
         elif abs(fb) < e2:
             print("O intervalo inicial já atende aos critérios de parada.")
             print(f"Raiz aproximada: {b}\n")
-            return b
+            return b, 0, nfev
         # Caso contrário, retorna o ponto médio do intervalo como aproximação da raiz
         else:
             x_medio = (a + b) / 2
             print("O intervalo inicial já atende ao critério de largura, mas |f(x)| >= e2.")
             print(f"Raiz aproximada (ponto médio): {x_medio}\n")
-            return x_medio
+            return x_medio, 0, nfev
+
+    # Guarda qual extremo foi substituído na iteração anterior ("a" ou "b")
+    lado_anterior = None
 
     # Loop para executar o método da posição falsa até atingir os critérios de parada
     while True:
@@ -103,6 +142,7 @@ def posicao_falsa(a, b, e1, e2):
 
         # Calcula f(x)
         fx = f(x)  # Valor da função no ponto x
+        nfev += 1  # Conta a avaliação de f(x)
 
         # Exibe os detalhes da iteração atual
         print(f"Iteração {k}:")
@@ -116,18 +156,30 @@ def posicao_falsa(a, b, e1, e2):
             # Se sim, retorna x como a raiz encontrada
             print(f"  |f(x{k})| < {e2}. Critério de parada atendido.\n")
             print(f"Raiz aproximada após {k} iterações: {x}\n")
-            return x
+            return x, k, nfev
 
         # Atualiza os limites do intervalo [a, b] com base no sinal de f(x)
         if fa * fx > 0:
             # Se f(a) e f(x) têm o mesmo sinal, a raiz está no intervalo [x, b]
+            # Se b foi retido pela segunda vez seguida, as variantes reduzem f(b)
+            if variante != "classica" and lado_anterior == "a":
+                m = fator_escala(variante, fa, fx)
+                fb *= m
+                print(f"  Extremo b retido novamente: f(b) multiplicado por {m}")
             a = x  # Atualiza o limite inferior para x
             fa = fx  # Atualiza f(a) para f(x)
+            lado_anterior = "a"
             print(f"  f(a) * f(x{k}) > 0. A raiz está no intervalo [{a}, {b}].\n")
         else:
             # Caso contrário, a raiz está no intervalo [a, x]
+            # Se a foi retido pela segunda vez seguida, as variantes reduzem f(a)
+            if variante != "classica" and lado_anterior == "b":
+                m = fator_escala(variante, fb, fx)
+                fa *= m
+                print(f"  Extremo a retido novamente: f(a) multiplicado por {m}")
             b = x  # Atualiza o limite superior para x
             fb = fx  # Atualiza f(b) para f(x)
+            lado_anterior = "b"
             print(f"  f(a) * f(x{k}) <= 0. A raiz está no intervalo [{a}, {b}].\n")
 
         # Verifica se a largura do intervalo é menor que e1 (critérios de parada)
@@ -135,7 +187,7 @@ def posicao_falsa(a, b, e1, e2):
             # Se sim, retorna x como a raiz aproximada
             print(f"  Largura do intervalo < {e1}. Critério de parada atendido.\n")
             print(f"Raiz aproximada após {k} iterações: {x}\n")
-            return x
+            return x, k, nfev
 
         # Incrementa o contador de iterações
         k += 1
@@ -150,9 +202,10 @@ def main():
     2. Informa ao usuário sobre a função definida.
     3. Solicita ao usuário os limites do intervalo [a, b].
     4. Solicita ao usuário os critérios de precisão e1 e e2.
-    5. Executa o Método da Posição Falsa para encontrar a raiz.
-    6. Exibe o resultado final.
-    7. Termina o programa.
+    5. Solicita ao usuário a variante do método.
+    6. Executa o Método da Posição Falsa para encontrar a raiz.
+    7. Exibe o resultado final.
+    8. Termina o programa.
     """
     # Exibe uma mensagem de boas-vindas e informações iniciais
     print("===========================================")
@@ -216,12 +269,32 @@ def main():
             # Trata casos onde a entrada não é um número válido
             print("Entrada inválida. Por favor, digite números válidos.\n")
 
+    # Solicita ao usuário a variante do método
+    print("\nEscolha a variante do método:")
+    print("[1] Clássica")
+    print("[2] Illinois")
+    print("[3] Pegasus")
+    print("[4] Anderson-Björck")
+    while True:
+        try:
+            escolha = int(input("Digite o número correspondente à sua escolha (padrão 1): ") or 1)
+            if escolha not in [1, 2, 3, 4]:
+                print("Opção inválida. Por favor, escolha um número entre 1 e 4.\n")
+                continue
+            break
+        except ValueError:
+            # Trata casos onde a entrada não é um número válido
+            print("Entrada inválida. Por favor, digite um número inteiro.\n")
+    variante = VARIANTES[escolha - 1]
+
     # Executa o Método da Posição Falsa para encontrar a raiz
     try:
         # Chama a função posicao_falsa com os parâmetros fornecidos
-        raiz = posicao_falsa(a, b, e1, e2)
+        raiz, iteracoes, nfev = posicao_falsa(a, b, e1, e2, variante)
         # Exibe a raiz aproximada encontrada
         print(f"A raiz aproximada de f(x) no intervalo [{a}, {b}] é: {raiz}")
+        print(f"Número de iterações realizadas: {iteracoes}")
+        print(f"Número de avaliações de f(x): {nfev}\n")
     except ValueError as ve:
         # Trata erros levantados pela função posicao_falsa
         print(f"Erro: {ve}")
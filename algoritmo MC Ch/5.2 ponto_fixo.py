@@ -11,6 +11,8 @@ Funcionalidades:
 3. Definição do critério de precisão.
 4. Exibição detalhada de cada iteração do método.
 5. Retorno da raiz aproximada com a precisão especificada.
+6. Aceleração opcional por Aitken Δ² ou pelo método de Steffensen (convergência quadrática).
+7. Estimativa do fator de contração |g'(x)| durante as iterações, abortando as que divergem.
 
 Autor: ChatGPT
 Data: 2025-01-27
@@ -18,6 +20,9 @@ Data: 2025-01-27
 
 import math  # Importa o módulo math para funções matemáticas adicionais, se necessário
 
+# Compilador seguro das expressões digitadas pelo usuário (sem eval a cada iteração)
+from expressoes import compilar
+
 def f(x):
     """
     Define a função f(x) cuja raiz será buscada.
@@ -31,7 +36,22 @@ def f(x):
     """
     return x**3 - 9*x + 3  # Exemplo de função. Modifique conforme necessário.
 
-def ponto_fixo(g, x0, erro, max_iter=1000):
+ACELERACOES = (None, "aitken", "steffensen")
+
+def aitken(x0, x1, x2):
+    """
+    Extrapolação Δ² de Aitken a partir de três iterados consecutivos x0, x1 = g(x0), x2 = g(x1).
+
+    Retorna:
+        float: x0 - (x1 - x0)^2 / (x2 - 2*x1 + x0), ou x2 se o denominador for nulo
+               (a sequência já estacionou e não há o que extrapolar).
+    """
+    denominador = x2 - 2*x1 + x0
+    if denominador == 0:
+        return x2
+    return x0 - (x1 - x0)**2 / denominador
+
+def ponto_fixo(g, x0, erro, max_iter=1000, accelerate=None, fator_maximo=1.0, janela=5):
     """
     Implementa o Método de Ponto Fixo para encontrar a raiz de uma função f(x).
 
@@ -40,33 +60,85 @@ def ponto_fixo(g, x0, erro, max_iter=1000):
         x0 (float): Ponto inicial para iniciar as iterações.
         erro (float): Critério de parada baseado na diferença entre iterações consecutivas.
         max_iter (int): Número máximo de iterações para evitar loops infinitos.
+        accelerate (str or None): Aceleração da convergência:
+            - None: iteração simples x(k+1) = g(x(k)), convergência linear.
+            - "aitken": aplica Aitken Δ² sobre a sequência simples; o critério de parada passa a
+              ser a diferença entre valores extrapolados consecutivos (uma avaliação de g por iteração).
+            - "steffensen": recomeça cada passo a partir do valor extrapolado por Aitken, o que dá
+              convergência quadrática sem derivadas (duas avaliações de g por iteração).
+        fator_maximo (float): Limite para a razão entre passos consecutivos |x(k+1) - x(k)| / |x(k) - x(k-1)|.
+            Na iteração simples essa razão estima o fator de contração |g'(x)|, e o método só converge
+            se ele for menor que 1.
+        janela (int): Número de iterações consecutivas com a razão acima de fator_maximo para abortar.
 
     Retorna:
         float: Raiz aproximada de f(x) no ponto fixo.
     
     Levanta:
-        ValueError: Se o método não converge dentro do número máximo de iterações.
+        ValueError: Se a aceleração for desconhecida, se a estimativa do fator de contração indicar
+                    divergência, ou se o método não convergir dentro do número máximo de iterações.
     """
+    if accelerate not in ACELERACOES:
+        raise ValueError(f"Aceleração desconhecida: {accelerate}. Use uma de {ACELERACOES}.")
+
     i = 0  # Inicializa o contador de iterações
     x = x0  # Define o ponto inicial
+    avaliacoes = 0  # Número de avaliações de g(x)
+    passo_anterior = None  # |x(k) - x(k-1)|, usado para estimar o fator de contração
+    acima = 0  # Iterações consecutivas com fator estimado acima de fator_maximo
+    extrapolados = [x0]  # Últimos iterados da sequência simples (apenas para Aitken)
+    x_acelerado = None  # Último valor extrapolado por Aitken
     
     print("\nIniciando o Método de Ponto Fixo...")
     print(f"Ponto inicial: x0 = {x0}")
     print(f"Critério de parada (erro): {erro}")
+    print(f"Aceleração: {accelerate or 'nenhuma'}")
     print(f"Máximo de iterações: {max_iter}\n")
     
     while i < max_iter:
-        x_novo = g(x)  # Calcula o próximo ponto usando a função g(x)
+        if accelerate == "steffensen":
+            # Um passo de Steffensen: duas avaliações de g e uma extrapolação de Aitken
+            x1 = g(x)
+            x2 = g(x1)
+            avaliacoes += 2
+            x_novo = aitken(x, x1, x2)
+        else:
+            x_novo = g(x)  # Calcula o próximo ponto usando a função g(x)
+            avaliacoes += 1
         diff = abs(x_novo - x)  # Calcula a diferença entre x_novo e x atual
-        
-        # Exibe os detalhes da iteração atual
-        print(f"Iteração {i}: x = {x:.10f}, g(x) = {x_novo:.10f}, |g(x) - x| = {diff:.10f}")
+
+        # Estima o fator de contração pela razão entre passos consecutivos
+        fator = diff / passo_anterior if passo_anterior else None
+        passo_anterior = diff
+        texto_fator = f"{fator:.4f}" if fator is not None else "-"
+
+        if accelerate == "aitken":
+            # Extrapola a partir dos três últimos iterados da sequência simples
+            extrapolados = (extrapolados + [x_novo])[-3:]
+            if len(extrapolados) == 3:
+                x_anterior, x_acelerado = x_acelerado, aitken(*extrapolados)
+                diff = abs(x_acelerado - x_anterior) if x_anterior is not None else math.inf
+                print(f"Iteração {i}: x = {x:.10f}, g(x) = {x_novo:.10f}, Aitken = {x_acelerado:.10f}, "
+                      f"|Δ Aitken| = {diff:.10f}, fator ≈ {texto_fator}")
+            else:
+                diff = math.inf  # Ainda não há três iterados para extrapolar
+                print(f"Iteração {i}: x = {x:.10f}, g(x) = {x_novo:.10f}, fator ≈ {texto_fator}")
+        else:
+            # Exibe os detalhes da iteração atual
+            print(f"Iteração {i}: x = {x:.10f}, g(x) = {x_novo:.10f}, |g(x) - x| = {diff:.10f}, fator ≈ {texto_fator}")
         
         # Verifica se a diferença está dentro da precisão desejada
         if diff < erro:
+            raiz = x_acelerado if accelerate == "aitken" else x_novo
             print("\nCritério de parada atendido.")
-            print(f"Raiz aproximada: {x_novo:.10f}\n")
-            return x_novo  # Retorna a raiz encontrada
+            print(f"Raiz aproximada: {raiz:.10f} ({avaliacoes} avaliações de g)\n")
+            return raiz  # Retorna a raiz encontrada
+
+        # Aborta se a razão entre passos ficou acima do limite por 'janela' iterações seguidas
+        acima = acima + 1 if fator is not None and fator > fator_maximo else 0
+        if acima >= janela:
+            raise ValueError(f"O método de ponto fixo está divergindo: fator de contração estimado ≈ {fator:.4f} "
+                             f"> {fator_maximo} em {janela} iterações seguidas ({avaliacoes} avaliações de g).")
         
         x = x_novo  # Atualiza o valor de x para a próxima iteração
         i += 1  # Incrementa o contador de iterações
@@ -82,7 +154,7 @@ def main():
     1. Exibe uma mensagem de boas-vindas.
     2. Solicita ao usuário a definição da função g(x).
     3. Solicita ao usuário o ponto inicial x0.
-    4. Solicita ao usuário o critério de precisão.
+    4. Solicita ao usuário o critério de precisão e a aceleração da convergência.
     5. Executa o Método de Ponto Fixo para encontrar a raiz.
     6. Exibe o resultado final.
     7. Termina o programa.
@@ -139,13 +211,12 @@ def main():
         # Permite ao usuário definir uma função personalizada
         print("\nVocê escolheu definir uma função personalizada.")
         print("Por favor, insira a expressão de g(x) usando Python.")
-        print("Use 'x' como a variável.")
+        print("Use 'x' como a variável e apenas funções matemáticas (sin, exp, log10, sqrt, ... ou math.sin, ...).")
         print("Exemplo: (9*x - 3) ** (1/3)")
         func_str = input("Digite a expressão de g(x): ")
         try:
-            # Define a função g(x) a partir da expressão fornecida
-            # Usa eval em um ambiente seguro com apenas o módulo math disponível
-            g = lambda x: eval(func_str, {"math": math, "x": x, "e": math.e})
+            # Compila a expressão uma única vez, aceitando só números, x e funções matemáticas
+            g = compilar(func_str)
             # Testa a função com um valor inicial para garantir que está correta
             teste = g(1)
             print(f"\nFunção g(x) definida como: g(x) = {func_str}")
@@ -173,9 +244,25 @@ def main():
         except ValueError:
             print("Entrada inválida. Por favor, digite um número válido.")
     
+    # Solicita ao usuário a aceleração da convergência
+    print("\nEscolha a aceleração da convergência:")
+    print("[1] Nenhuma (iteração simples)")
+    print("[2] Aitken Δ²")
+    print("[3] Steffensen (convergência quadrática)")
+    while True:
+        try:
+            opcao = int(input("Digite o número correspondente à sua escolha: "))
+            if opcao not in [1, 2, 3]:
+                print("Opção inválida. Por favor, escolha um número entre 1 e 3.")
+                continue
+            break
+        except ValueError:
+            print("Entrada inválida. Por favor, digite um número inteiro.")
+    accelerate = ACELERACOES[opcao - 1]
+
     # Executa o Método de Ponto Fixo para encontrar a raiz
     try:
-        raiz = ponto_fixo(g, x0, erro)
+        raiz = ponto_fixo(g, x0, erro, accelerate=accelerate)
         print(f"Resultado: A raiz aproximada de f(x) pelo Método de Ponto Fixo é: {raiz:.10f}")
     except ValueError as ve:
         # Trata erros levantados pelo método de ponto fixo, como falta de convergência
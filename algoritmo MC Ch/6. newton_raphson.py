@@ -7,16 +7,21 @@ Este programa encontra a raiz de uma função contínua utilizando o Método de
 
 Funcionalidades:
 1. Definição interativa da função f(x).
-2. Definição da derivada f'(x).
+2. Derivada f'(x) calculada automaticamente (números duais) ou passada em df.
 3. Entrada do chute inicial x0.
 4. Definição dos critérios de precisão e1 e e2.
 5. Exibição detalhada de cada iteração do método.
 6. Retorno da raiz aproximada com a precisão especificada.
+7. Métodos de ordem mais alta: Halley (cúbico) e Householder de ordem qualquer.
 
 
 """
 
 import math  # Importa o módulo math para funções matemáticas adicionais, se necessário
+import sys  # Usado para obter o épsilon da máquina na estimativa da ordem
+
+# Funções log, sin, cos... que aceitam números duais, para derivar f automaticamente
+from diferenciacao_automatica import coeficientes_taylor, derivar, log, sin
 
 def f(x):
     """
@@ -28,31 +33,23 @@ def f(x):
     Nota:
         - Modifique esta função conforme necessário para buscar a raiz de diferentes funções.
         - Por exemplo, para f(x) = x^3 - 9x + 3, defina como abaixo.
+        - Use log, sin, cos, exp... de diferenciacao_automatica (e não de math) para que
+          a derivada possa ser calculada automaticamente.
     """
-    return x ** math.log(x) + x**2 - x**3 * math.sin(x)  # Exemplo de função. Modifique conforme necessário.
-
-def df(x):
-    """
-    Define a derivada da função f(x).
+    return x ** log(x) + x**2 - x**3 * sin(x)  # Exemplo de função. Modifique conforme necessário.
 
-    Retorna:
-        float: Valor da derivada f'(x)
-
-    Nota:
-        - Modifique esta função conforme a derivada de f(x) definido acima.
-        - Por exemplo, para f(x) = x^3 - 9x + 3, a derivada é f'(x) = 3x^2 - 9.
-    """
-    return 2 * (math.log(x)) * (x)**(math.log(x)-1) - (x**(3)) * (math.cos(x)) - (3*x**(2) * math.sin(x)) + 2 * x # Derivada da função f(x) = x^2 - 2. Modifique conforme necessário.
-
-def newton_raphson(x0, e1, e2, max_iter=500):
+def newton_raphson(f, x0, e1, e2, max_iter=500, df=None):
     """
     Implementa o método de Newton-Raphson para encontrar a raiz de uma função f(x).
 
     Parâmetros:
+        f (function): Função cuja raiz será buscada.
         x0 (float): Chute inicial para a raiz.
         e1 (float): Precisão desejada para o valor da função, ou seja, |f(x)| < e1.
         e2 (float): Precisão desejada para a diferença entre iterações consecutivas, ou seja, |x1 - x0| < e2.
         max_iter (int): Número máximo de iterações para evitar loops infinitos.
+        df (function, opcional): Derivada de f. Se não for passada, f(x) e f'(x) são
+            calculadas juntas, em uma única avaliação de f, por diferenciação automática.
 
     Retorna:
         float: Raiz aproximada de f(x).
@@ -61,8 +58,17 @@ def newton_raphson(x0, e1, e2, max_iter=500):
         ValueError: Se a derivada for zero em algum ponto durante as iterações.
         RuntimeError: Se o método não convergir dentro do número máximo de iterações.
     """
+    # Define como obter f(x) e f'(x) em cada ponto
+    if df is None:
+        avaliar = lambda x: derivar(f, x)  # f e f' em uma única passagem (números duais)
+    else:
+        avaliar = lambda x: (f(x), df(x))  # Derivada fornecida pelo usuário
+
+    # Calcula f(x0) e f'(x0) uma única vez
+    fx0, dfx0 = avaliar(x0)
+
     # Verifica se o chute inicial já é uma solução suficientemente boa
-    if abs(f(x0)) < e1:
+    if abs(fx0) < e1:
         # Se o valor absoluto de f(x0) for menor que e1, x0 já é considerado uma boa aproximação para a raiz
         print(f"Chute inicial x0 = {x0} já satisfaz |f(x0)| < {e1}.")
         print(f"Raiz aproximada: {x0}\n")
@@ -78,9 +84,6 @@ def newton_raphson(x0, e1, e2, max_iter=500):
     print(f"Máximo de iterações: {max_iter}\n")
 
     while k < max_iter:
-        fx0 = f(x0)  # Calcula f(x0)
-        dfx0 = df(x0)  # Calcula f'(x0)
-
         # Exibe os valores atuais de x0, f(x0) e f'(x0)
         print(f"Iteração {k}:")
         print(f"  x{k} = {x0}")
@@ -95,9 +98,12 @@ def newton_raphson(x0, e1, e2, max_iter=500):
         x1 = x0 - fx0 / dfx0
         print(f"  Próximo x = {x1}\n")
 
+        # Calcula f(x1) e f'(x1), reaproveitados na próxima iteração
+        fx1, dfx1 = avaliar(x1)
+
         # Verifica o critério de parada 1: |f(x1)| < e1
-        if abs(f(x1)) < e1:
-            print(f"Critério de parada atendido: |f(x1)| = {abs(f(x1))} < {e1}")
+        if abs(fx1) < e1:
+            print(f"Critério de parada atendido: |f(x1)| = {abs(fx1)} < {e1}")
             print(f"Raiz aproximada: {x1}\n")
             return x1  # Retorna x1 como a raiz encontrada
 
@@ -107,13 +113,136 @@ def newton_raphson(x0, e1, e2, max_iter=500):
             print(f"Raiz aproximada: {x1}\n")
             return x1  # Retorna x1 como a raiz encontrada
 
-        # Atualiza x0 para a próxima iteração
-        x0 = x1
+        # Atualiza x0, f(x0) e f'(x0) para a próxima iteração
+        x0, fx0, dfx0 = x1, fx1, dfx1
         k += 1  # Incrementa o contador de iterações
 
     # Se o método não convergir dentro do número máximo de iterações, levanta um erro
     raise RuntimeError(f"O método de Newton-Raphson não convergiu após {max_iter} iterações.")
 
+class ResultadoRaiz:
+    """
+    Resultado comum dos métodos de refinamento de ordem qualquer.
+
+    Atributos:
+        raiz (float): Raiz aproximada.
+        iteracoes (int): Número de iterações realizadas.
+        avaliacoes (int): Número de avaliações (passagens de f ou chamadas das derivadas).
+        ordem (float or None): Ordem de convergência estimada nas últimas iterações.
+        convergiu (bool): True se o critério de parada foi atendido.
+        metodo (str): Nome do método utilizado.
+    """
+
+    __slots__ = ("raiz", "iteracoes", "avaliacoes", "ordem", "convergiu", "metodo")
+
+    def __init__(self, raiz, iteracoes, avaliacoes, ordem, convergiu, metodo):
+        self.raiz = raiz
+        self.iteracoes = iteracoes
+        self.avaliacoes = avaliacoes
+        self.ordem = ordem
+        self.convergiu = convergiu
+        self.metodo = metodo
+
+    def __repr__(self):
+        ordem = "?" if self.ordem is None else f"{self.ordem:.2f}"
+        return (f"{self.metodo}: raiz = {self.raiz}, iterações = {self.iteracoes}, "
+                f"avaliações = {self.avaliacoes}, ordem estimada = {ordem}, convergiu = {self.convergiu}")
+
+def estimar_ordem(passos, x=1.0):
+    """
+    Estima a ordem de convergência p a partir dos últimos três passos |x(k+1) - x(k)|.
+
+    Usa p ≈ ln(d2 / d1) / ln(d1 / d0), que vale quando d(k+1) ≈ C * d(k)^p. Passos da ordem
+    do erro de arredondamento em torno de x são descartados, pois não refletem o método.
+
+    Retorna:
+        float or None: Ordem estimada, ou None se não houver passos suficientes.
+    """
+    piso = 1e3 * sys.float_info.epsilon * max(1.0, abs(x))
+    d = [p for p in passos if p > piso]
+    if len(d) < 3 or d[-2] == d[-3]:
+        return None
+    return math.log(d[-1] / d[-2]) / math.log(d[-2] / d[-3])
+
+def householder(f, x0, ordem=2, tol=1e-12, max_iter=100, derivadas=None):
+    """
+    Método de Householder de ordem d para encontrar a raiz de f(x).
+
+    A iteração é x(k+1) = x(k) + d * (1/f)^(d-1)(x(k)) / (1/f)^(d)(x(k)), que converge com
+    ordem d + 1: d = 1 é Newton-Raphson, d = 2 é Halley (cúbico), d = 3 é de ordem 4, etc.
+    Usando os coeficientes g da série de Taylor de 1/f, o passo é simplesmente g[d-1] / g[d].
+
+    Parâmetros:
+        f (function): Função cuja raiz será buscada.
+        x0 (float): Chute inicial para a raiz.
+        ordem (int): Ordem d do método (número de derivadas usadas).
+        tol (float): Precisão desejada para |x1 - x0|.
+        max_iter (int): Número máximo de iterações.
+        derivadas (list of function, opcional): [f', f'', ..., f^(d)] fornecidas pelo usuário.
+            Se não forem passadas, as derivadas vêm da diferenciação automática no modo Taylor,
+            com uma única passagem de f por iteração.
+
+    Retorna:
+        ResultadoRaiz: Raiz, iterações, avaliações e ordem de convergência estimada.
+
+    Levanta:
+        ValueError: Se a ordem for menor que 1, se faltarem derivadas, ou se o passo não
+                    puder ser calculado (por exemplo, f'(x) = 0).
+    """
+    if ordem < 1:
+        raise ValueError("A ordem do método de Householder deve ser pelo menos 1.")
+    if derivadas is not None and len(derivadas) < ordem:
+        raise ValueError(f"São necessárias {ordem} derivadas para o método de ordem {ordem}.")
+
+    # Define como obter os coeficientes de Taylor de f em cada ponto
+    if derivadas is None:
+        coeficientes = lambda x: coeficientes_taylor(f, x, ordem)  # Uma passagem de f
+        custo = 1
+    else:
+        coeficientes = lambda x: [f(x)] + [derivadas[k - 1](x) / math.factorial(k) for k in range(1, ordem + 1)]
+        custo = ordem + 1  # f e cada derivada são chamadas uma vez
+
+    nomes = {1: "Newton-Raphson", 2: "Halley"}
+    metodo = nomes.get(ordem, f"Householder (ordem {ordem})")
+
+    x = x0
+    passos = []
+    avaliacoes = 0
+    for k in range(1, max_iter + 1):
+        c = coeficientes(x)
+        avaliacoes += custo
+        if c[0] == 0:
+            return ResultadoRaiz(x, k - 1, avaliacoes, estimar_ordem(passos, x), True, metodo)
+
+        # Coeficientes de 1/f: g[0] = 1/c[0] e g[k] = -(soma c[j] * g[k-j]) / c[0]
+        g = [1 / c[0]]
+        for i in range(1, ordem + 1):
+            g.append(-sum(c[j] * g[i - j] for j in range(1, i + 1)) / c[0])
+        if g[ordem] == 0:
+            raise ValueError(f"Passo indefinido em x = {x:.6f} (derivada nula). Método falhou.")
+
+        x_novo = x + g[ordem - 1] / g[ordem]
+        passos.append(abs(x_novo - x))
+        x = x_novo
+        if passos[-1] < tol:
+            return ResultadoRaiz(x, k, avaliacoes, estimar_ordem(passos, x), True, metodo)
+
+    return ResultadoRaiz(x, max_iter, avaliacoes, estimar_ordem(passos, x), False, metodo)
+
+def halley(f, x0, tol=1e-12, max_iter=100, df=None, d2f=None):
+    """
+    Método de Halley (convergência cúbica): Householder de ordem 2.
+
+    Parâmetros:
+        df, d2f (function, opcional): Primeira e segunda derivadas. Se não forem passadas
+            as duas, são calculadas por diferenciação automática.
+
+    Retorna:
+        ResultadoRaiz: Raiz, iterações, avaliações e ordem de convergência estimada.
+    """
+    derivadas = [df, d2f] if df is not None and d2f is not None else None
+    return householder(f, x0, 2, tol, max_iter, derivadas)
+
 def main():
     """
     Função principal que controla o fluxo do programa.
@@ -124,7 +253,7 @@ def main():
     3. Solicita ao usuário os critérios de precisão e1 e e2.
     4. Solicita ao usuário o chute inicial x0.
     5. Executa o Método de Newton-Raphson para encontrar a raiz.
-    6. Exibe o resultado final.
+    6. Exibe o resultado final e a comparação com Halley e Householder.
     7. Termina o programa.
     """
     # Exibe uma mensagem de boas-vindas e informações iniciais
@@ -133,11 +262,11 @@ def main():
     print("===========================================\n")
 
     # Informa ao usuário sobre a função definida
-    print("Por favor, defina a função f(x) e sua derivada f'(x) no código.")
+    print("Por favor, defina a função f(x) no código.")
     print("Atualmente, a função está definida como:")
-    print("f(x) = x^2 - 2")
-    print("f'(x) = 2x")
-    print("Se desejar modificar a função ou sua derivada, edite as funções f(x) e df(x) diretamente no código.\n")
+    print("f(x) = x^ln(x) + x^2 - x^3 * sin(x)")
+    print("A derivada f'(x) é calculada automaticamente (diferenciação automática).")
+    print("Se desejar modificar a função, edite a função f(x) diretamente no código.\n")
 
     # Solicita ao usuário o chute inicial x0
     while True:
@@ -176,8 +305,14 @@ def main():
 
     # Executa o Método de Newton-Raphson para encontrar a raiz
     try:
-        raiz = newton_raphson(x0, e1, e2)  # Chama a função newton_raphson com os parâmetros fornecidos
+        raiz = newton_raphson(f, x0, e1, e2)  # Chama a função newton_raphson com os parâmetros fornecidos
         print(f"Resultado: A raiz aproximada de f(x) é: {raiz}\n")  # Exibe a raiz aproximada encontrada
+
+        # Compara Newton-Raphson com os métodos de ordem mais alta a partir do mesmo chute
+        print("Comparação com métodos de ordem mais alta (derivadas automáticas):")
+        for ordem in (1, 2, 3):
+            print(f"  {householder(f, x0, ordem, tol=e2)}")
+        print()
     except ValueError as ve:
         # Trata erros levantados pela função newton_raphson, como derivada zero
         print(f"Erro: {ve}\n")
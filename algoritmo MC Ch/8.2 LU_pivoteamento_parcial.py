@@ -12,22 +12,31 @@ onde P é a matriz de permutação devido ao pivotamento. Após a decomposição
 Funcionalidades:
 1. Definição da matriz de coeficientes A e do vetor de constantes b.
 2. Fatoração LU com Pivotamento Parcial para decompor a matriz A.
-3. Substituição para Frente para resolver Ly = Pb.
+3. Substituição para Frente para resolver Ly = Pb, com L e U compactadas numa única matriz
+   e a permutação P guardada como vetor de índices.
 4. Substituição para Trás para resolver Ux = y.
 5. Validação e tratamento de erros, como matrizes singulares ou não quadradas.
 6. Saída detalhada do processo de fatoração e substituição.
+7. Objeto LUFactorization: fatora A uma única vez (O(n³)) e resolve quantos vetores b
+   forem necessários (O(n²) cada), com L e U guardadas numa única matriz.
 
 Autor: ChatGPT
 Data: 2025-01-27
 """
 
-def fatoracao_LU_pivot(A, b):
+def fatoracao_LU_pivot(A, b, sobrescrever=False):
     """
     Resolve um sistema linear Ax = b utilizando a decomposição LU com pivotamento parcial.
 
+    L e U são guardadas compactadas numa única matriz: abaixo da diagonal ficam os
+    multiplicadores de L (a diagonal de 1s fica implícita) e, da diagonal para cima, U.
+    As trocas de linha ficam no vetor de índices p, aplicado diretamente em b.
+
     Parâmetros:
         A (list of list of floats): Matriz de coeficientes (n x n).
         b (list of floats): Vetor de constantes (tamanho n).
+        sobrescrever (bool): Se True, a própria A recebe L e U (nenhuma cópia é feita);
+            se False, a fatoração é feita numa cópia de A, que fica intacta.
 
     Retorna:
         x (list of floats): Vetor solução x.
@@ -35,91 +44,141 @@ def fatoracao_LU_pivot(A, b):
     Levanta:
         ValueError: Se a matriz não for quadrada ou se for singular.
     """
-    n = len(A)  # Obtém o número de linhas da matriz A
-
-    # Verificação se a matriz A é quadrada (n x n)
-    for idx, row in enumerate(A):
-        if len(row) != n:
-            raise ValueError(f"A matriz deve ser quadrada. Linha {idx + 1} tem {len(row)} colunas.")
-
-    # Inicializando as matrizes L e U com zeros
-    # L será a matriz triangular inferior (com 1s na diagonal principal)
-    # U será a matriz triangular superior
-    L = [[0.0] * n for _ in range(n)]  # Cria uma matriz n x n com zeros para L
-    U = [[0.0] * n for _ in range(n)]  # Cria uma matriz n x n com zeros para U
-
-    # Inicialização do vetor de permutação p (representa a troca de linhas durante o pivotamento)
-    p = list(range(n))  # p é uma lista que armazena os índices das linhas de A após o pivotamento
-
-    # Decomposição LU com pivotamento parcial: PA = LU
-    for k in range(n):
-        # Encontrar o pivô na coluna k (maior valor absoluto para estabilidade numérica)
-        pivot = abs(A[k][k])  # Inicializa o pivô com o valor absoluto de A[k][k]
-        r = k  # Inicializa r como o índice da linha k
-
-        for i in range(k + 1, n):
-            if abs(A[i][k]) > pivot:
-                pivot = abs(A[i][k])  # Atualiza o pivô com um valor maior
-                r = i  # Atualiza o índice da linha do pivô
-
-        if pivot == 0:
-            raise ValueError("A matriz A é singular e não pode ser decomposta em LU.")
-
-        # Troca as linhas k e r na matriz A e no vetor de permutação p
-        if r != k:
-            A[k], A[r] = A[r], A[k]  # Troca as linhas na matriz A
-            p[k], p[r] = p[r], p[k]  # Troca os índices no vetor de permutação p
-
-        # Preenche a matriz U (triangular superior)
-        for j in range(k, n):
-            sum_U = 0.0  # Inicializa a soma dos produtos L[k][m] * U[m][j]
-            for m in range(k):
-                sum_U += L[k][m] * U[m][j]  # Soma L[k][m] * U[m][j] para m de 0 a k-1
-            U[k][j] = A[k][j] - sum_U  # Calcula o elemento U[k][j]
-
-        # Preenche a matriz L (triangular inferior)
-        for i in range(k, n):
-            if i == k:
-                L[k][k] = 1.0  # Define 1 na diagonal principal de L
-            else:
-                sum_LU = 0.0  # Inicializa a soma dos produtos L[i][m] * U[m][k]
-                for m in range(k):
-                    sum_LU += L[i][m] * U[m][k]  # Soma L[i][m] * U[m][k] para m de 0 a k-1
-                L[i][k] = (A[i][k] - sum_LU) / U[k][k]  # Calcula o elemento L[i][k]
-
-    # Exibe as matrizes L e U após a decomposição
+    # A fatoração é a de LUFactorization (única implementação do algoritmo neste arquivo)
+    fatoracao = LUFactorization(A, sobrescrever=sobrescrever)
+    n, LU, p = fatoracao.n, fatoracao.LU, fatoracao.p
+
+    # Exibe as matrizes L e U após a decomposição (montadas só na hora de imprimir)
     print("\n=== DECOMPOSIÇÃO LU CONCLUÍDA COM PIVOTAMENTO ===")
     print("\nMatriz L (Triangular Inferior):")
-    for row in L:
-        print(["{0:.4f}".format(num) for num in row])  # Formata os números para 4 casas decimais
+    for i, row in enumerate(LU):
+        print(["{0:.4f}".format(row[j] if j < i else float(j == i)) for j in range(n)])  # Formata os números para 4 casas decimais
 
     print("\nMatriz U (Triangular Superior):")
-    for row in U:
-        print(["{0:.4f}".format(num) for num in row])  # Formata os números para 4 casas decimais
-
-    # Substituição para Frente: Resolver Ly = Pb (triangular inferior)
-    y = [0.0] * n  # Inicializa o vetor y com zeros
-    print("\n=== SUBSTITUIÇÃO PARA FRENTE ===")
-    for i in range(n):
-        sum_Ly = 0.0  # Inicializa a soma dos produtos L[i][j] * y[j]
-        for j in range(i):
-            sum_Ly += L[i][j] * y[j]  # Soma L[i][j] * y[j] para j de 0 a i-1
-        y[i] = b[p[i]] - sum_Ly  # Calcula y[i] subtraindo a soma de b[p[i]] - sum_Ly
-        print(f"y[{i + 1}] = {y[i]:.6f}")  # Exibe y[i] com 6 casas decimais
-
-    # Substituição para Trás: Resolver Ux = y (triangular superior)
-    x = [0.0] * n  # Inicializa o vetor solução x com zeros
-    print("\n=== SUBSTITUIÇÃO PARA TRÁS ===")
-    for i in range(n - 1, -1, -1):
-        sum_Ux = 0.0  # Inicializa a soma dos produtos U[i][j] * x[j]
-        for j in range(i + 1, n):
-            sum_Ux += U[i][j] * x[j]  # Soma U[i][j] * x[j] para j de i+1 a n-1
-        if U[i][i] == 0:
-            raise ValueError(f"Divisão por zero detectada na posição U[{i}][{i}]. Sistema sem solução única.")
-        x[i] = (y[i] - sum_Ux) / U[i][i]  # Calcula x[i] dividindo a diferença y[i] - sum_Ux por U[i][i]
-        print(f"x[{i + 1}] = ({y[i]} - {sum_Ux}) / {U[i][i]} = {x[i]:.6f}")  # Exibe x[i] com 6 casas decimais
-
-    return x  # Retorna o vetor solução x
+    for i, row in enumerate(LU):
+        print(["{0:.4f}".format(row[j] if j >= i else 0.0) for j in range(n)])  # Formata os números para 4 casas decimais
+
+    print(f"\nVetor de permutação p: {p}")
+
+    # Substituições para frente (Ly = Pb) e para trás (Ux = y), exibindo cada passo
+    return fatoracao.solve(b, detalhar=True)  # Retorna o vetor solução x
+
+class LUFactorization:
+    """
+    Fatoração PA = LU com pivotamento parcial, calculada uma vez e reutilizada para vários b.
+
+    As matrizes L e U são guardadas compactadas numa única matriz LU: abaixo da diagonal
+    ficam os multiplicadores de L (a diagonal de 1s de L fica implícita) e, da diagonal
+    para cima, os elementos de U. A permutação é guardada no vetor p: a linha i de PA é a
+    linha p[i] de A, de modo que Pb = [b[p[0]], b[p[1]], ..., b[p[n-1]]].
+
+    Atributos:
+        n (int): Ordem da matriz.
+        LU (list of list of floats): Matriz com L e U compactadas.
+        p (list of int): Vetor de permutação das linhas.
+    """
+
+    def __init__(self, A, sobrescrever=False):
+        """
+        Fatora a matriz A com eliminação de Gauss e pivotamento parcial.
+
+        Parâmetros:
+            A (list of list of floats): Matriz de coeficientes (n x n).
+            sobrescrever (bool): Se True, a própria A passa a ser a matriz LU,
+                sem cópia; se False, A não é alterada.
+
+        Levanta:
+            ValueError: Se a matriz não for quadrada ou se for singular.
+        """
+        n = len(A)  # Obtém o número de linhas da matriz A
+
+        # Verificação se a matriz A é quadrada (n x n)
+        for idx, row in enumerate(A):
+            if len(row) != n:
+                raise ValueError(f"A matriz deve ser quadrada. Linha {idx + 1} tem {len(row)} colunas.")
+
+        self.n = n
+        # A própria A ou uma cópia dela receberá L e U
+        self.LU = A if sobrescrever else [[float(valor) for valor in row] for row in A]
+        self.p = list(range(n))  # Vetor de permutação, começa com a identidade
+        LU = self.LU
+
+        for k in range(n):
+            # Pivô: maior valor absoluto da coluna k, da diagonal para baixo (já atualizada)
+            r = max(range(k, n), key=lambda i: abs(LU[i][k]))
+            if LU[r][k] == 0:
+                raise ValueError("A matriz A é singular e não pode ser decomposta em LU.")
+
+            # Troca as linhas inteiras, levando junto os multiplicadores já calculados
+            if r != k:
+                LU[k], LU[r] = LU[r], LU[k]
+                self.p[k], self.p[r] = self.p[r], self.p[k]
+
+            # Elimina abaixo do pivô, guardando cada multiplicador no lugar do zero criado
+            linha_pivo = LU[k]
+            for i in range(k + 1, n):
+                linha = LU[i]
+                m = linha[k] / linha_pivo[k]
+                linha[k] = m
+                for j in range(k + 1, n):
+                    linha[j] -= m * linha_pivo[j]
+
+    def solve(self, b, detalhar=False):
+        """
+        Resolve Ax = b reaproveitando a fatoração: Ly = Pb e depois Ux = y, em O(n²).
+
+        Parâmetros:
+            b (list of floats): Vetor de constantes (tamanho n).
+            detalhar (bool): Se True, exibe cada passo das substituições para frente e para trás.
+
+        Retorna:
+            list of floats: Vetor solução x.
+        """
+        n, LU = self.n, self.LU
+
+        # Substituição para frente (L tem diagonal 1), já aplicando a permutação em b
+        y = [0.0] * n
+        if detalhar:
+            print("\n=== SUBSTITUIÇÃO PARA FRENTE ===")
+        for i in range(n):
+            linha = LU[i]
+            y[i] = b[self.p[i]] - sum((linha[j] * y[j] for j in range(i)), 0.0)
+            if detalhar:
+                print(f"y[{i + 1}] = {y[i]:.6f}")  # Exibe y[i] com 6 casas decimais
+
+        # Substituição para trás
+        x = [0.0] * n
+        if detalhar:
+            print("\n=== SUBSTITUIÇÃO PARA TRÁS ===")
+        for i in range(n - 1, -1, -1):
+            linha = LU[i]
+            soma = sum((linha[j] * x[j] for j in range(i + 1, n)), 0.0)
+            x[i] = (y[i] - soma) / linha[i]
+            if detalhar:
+                print(f"x[{i + 1}] = ({y[i]} - {soma}) / {linha[i]} = {x[i]:.6f}")  # Exibe x[i] com 6 casas decimais
+        return x
+
+    def solve_many(self, B):
+        """
+        Resolve Ax = b para vários vetores b com a mesma fatoração.
+
+        Segue a convenção do NumPy (np.linalg.solve): B é uma matriz n x k em que cada coluna
+        é um vetor de constantes, e a solução de cada coluna fica na mesma coluna do resultado.
+
+        Parâmetros:
+            B (list of list of floats): Matriz n x k, uma coluna por vetor de constantes.
+
+        Retorna:
+            list of list of floats: Matriz n x k; a coluna j é a solução de Ax = (coluna j de B).
+
+        Levanta:
+            ValueError: Se B não tiver n linhas.
+        """
+        if len(B) != self.n:
+            raise ValueError(f"B precisa ter {self.n} linhas, uma coluna por vetor de constantes.")
+        # Resolve coluna por coluna e monta o resultado de volta com as soluções nas colunas
+        solucoes = [self.solve(coluna) for coluna in zip(*B)]
+        return [list(linha) for linha in zip(*solucoes)]
 
 def main():
     """
@@ -131,6 +190,7 @@ def main():
     3. Executa a fatoração LU com pivotamento parcial para decompor a matriz A.
     4. Executa a substituição retroativa para encontrar as soluções das variáveis.
     5. Exibe o vetor solução x.
+    6. Reutiliza uma única fatoração (LUFactorization) para resolver vários vetores b.
     """
     # Exemplo de sistema linear 3x3:
     # 2x1 - 1x2 - 2x3 = 1
@@ -154,6 +214,9 @@ def main():
         eq = eq.rstrip(" + ") + f" = {b[i]}"  # Remove o último " + " e adiciona "= b[i]"
         print(eq)  # Imprime a equação
 
+    # Fatoração reutilizável para resolver outros vetores b no final
+    fatoracao = LUFactorization(A)
+
     # Chama a função de decomposição LU com pivotamento para resolver o sistema linear
     try:
         x = fatoracao_LU_pivot(A, b)  # x será o vetor solução calculado pela decomposição LU com pivotamento
@@ -168,6 +231,16 @@ def main():
         # Trata quaisquer outros erros inesperados
         print(f"\nOcorreu um erro inesperado: {e}")
 
+    # Resolve outros vetores b com a mesma matriz, sem fatorar A novamente
+    print("\n=== VÁRIOS VETORES b COM A MESMA FATORAÇÃO ===")
+    # B = [b | I]: cada coluna é um vetor de constantes (as três últimas dão as colunas de A⁻¹)
+    B = [[b[i]] + [1 if j == i else 0 for j in range(len(b))] for i in range(len(b))]
+    X = fatoracao.solve_many(B)
+    for k in range(len(B[0])):  # k percorre as colunas de B e de X
+        b_k = [linha[k] for linha in B]
+        x_k = [linha[k] for linha in X]
+        print(f"b = {b_k} -> x = {['{0:.6f}'.format(num) for num in x_k]}")
+
     print("\n=== FIM DA RESOLUÇÃO ===")
 
 # Verifica se o script está sendo executado diretamente
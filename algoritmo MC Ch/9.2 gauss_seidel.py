@@ -13,11 +13,24 @@ Funcionalidades:
 3. Execução do Método de Gauss-Seidel com exibição detalhada de cada iteração.
 4. Validação e tratamento de erros, como matrizes não quadradas ou divisão por zero.
 5. Exibição da solução aproximada após convergência ou término das iterações.
+6. Ordenação multicor (gauss_seidel_multicor): as equações são agrupadas por cores de um
+   grafo (equações da mesma cor não dependem umas das outras), e cada cor é atualizada
+   de uma vez com NumPy. A coloração é calculada uma vez, antes das iterações.
+7. Comparação de iterações e tempo entre a ordem natural e a multicor (comparar_ordenacoes).
+8. As versões vetorizadas (gauss_seidel_multicor e gauss_seidel_natural) acompanham a convergência
+   com o MonitorConvergencia: param cedo ao detectar divergência ou estagnação e retornam um
+   ResultadoIterativo (solução, iterações, motivo da parada, taxa de contração estimada).
 
 Autor: ChatGPT
 Data: 2025-01-27
 """
 
+import time  # Medição do tempo na comparação das ordenações
+
+import numpy as np  # Atualização vetorizada de cada cor
+
+from monitor_convergencia import MonitorConvergencia  # Parada por convergência, divergência ou estagnação
+
 def gauss_seidel(A, b, e, max_i):
     """
     Método iterativo de Gauss-Seidel para resolver um sistema linear Ax = b.
@@ -98,6 +111,155 @@ def gauss_seidel(A, b, e, max_i):
     print(f"Solução após {max_i} iterações: {x_novo}\n")
     return x_novo  # Retorna a última aproximação encontrada.
 
+def colorir_grafo(A):
+    """
+    Agrupa as equações de A em cores: duas equações i e j têm cores diferentes sempre que
+    A[i][j] != 0 ou A[j][i] != 0, então as equações de uma mesma cor podem ser atualizadas juntas.
+    A coloração é gulosa, na ordem das equações, e custa O(n²) com A densa, o mesmo que uma
+    iteração; por isso é calculada uma vez por chamada de gauss_seidel_multicor, sem cache
+    (a própria chave de um cache, o padrão de A, já custaria O(n²) para ser montada).
+
+    Parâmetros:
+        A (list of list of floats ou numpy.ndarray): Matriz de coeficientes (n x n).
+
+    Retorna:
+        tuple of tuple of int: Para cada cor, os índices das equações dessa cor.
+    """
+    A = np.asarray(A, dtype=float)
+    n = len(A)
+
+    # Vizinhos de i: j aparece na linha i ou i aparece na linha j (as duas direções)
+    ligadas = (A != 0) | (A.T != 0)
+    np.fill_diagonal(ligadas, False)
+    vizinhos = [np.flatnonzero(linha).tolist() for linha in ligadas]
+
+    cor = [-1] * n  # Cor de cada equação (-1 = ainda sem cor)
+    for i in range(n):
+        usadas = {cor[j] for j in vizinhos[i]}  # Cores já usadas pelos vizinhos
+        c = 0
+        while c in usadas:  # Menor cor livre
+            c += 1
+        cor[i] = c
+
+    return tuple(tuple(i for i in range(n) if cor[i] == c) for c in range(max(cor) + 1))
+
+
+def gauss_seidel_multicor(A, b, e, max_i):
+    """
+    Método de Gauss-Seidel com ordenação multicor: as equações de cada cor são atualizadas
+    todas de uma vez (operações do NumPy), usando os valores novos das cores anteriores.
+    Para matrizes de malhas (como a do problema de Poisson) bastam duas cores ("red-black").
+
+    Parâmetros:
+        A (list of list of floats ou numpy.ndarray): Matriz de coeficientes (n x n).
+        b (list of floats): Vetor de constantes (tamanho n).
+        e (float): Precisão desejada (mesmo critério de gauss_seidel: soma das variações).
+        max_i (int): Número máximo de iterações permitidas.
+
+    Retorna:
+        ResultadoIterativo: Solução (x), número de iterações (iteracoes), motivo da parada
+            ("convergiu", "divergiu", "estagnou" ou "max_iter"), histórico da soma das variações
+            e taxa de contração estimada.
+
+    Levanta:
+        ZeroDivisionError: Se algum elemento da diagonal for zero.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    diagonal = np.diag(A)
+    if np.any(diagonal == 0):
+        raise ZeroDivisionError("A diagonal de A tem elemento zero. Método falhou.")
+
+    # Preparação feita uma vez: cores, linhas de A sem a diagonal e termos de cada cor
+    cores = [np.array(linhas) for linhas in colorir_grafo(A)]
+    R = A.copy()
+    np.fill_diagonal(R, 0.0)
+    blocos = [(linhas, R[linhas], b[linhas], diagonal[linhas]) for linhas in cores]
+
+    x = np.zeros(len(b))  # Mesmo chute inicial de gauss_seidel
+    monitor = MonitorConvergencia(e, max_i)  # Para em e_total < e, ou antes se divergir ou estagnar
+    for k in range(1, max_i + 1):
+        e_total = 0.0
+        for linhas, R_cor, b_cor, d_cor in blocos:
+            novo = (b_cor - R_cor @ x) / d_cor  # Todas as equações da cor de uma vez
+            e_total += np.abs(novo - x[linhas]).sum()
+            x[linhas] = novo
+        motivo = monitor.registrar(e_total)
+        if motivo:
+            return monitor.resultado(x, k, motivo, "Gauss-Seidel multicor")
+    return monitor.resultado(x, max_i, None, "Gauss-Seidel multicor")
+
+
+def gauss_seidel_natural(A, b, e, max_i):
+    """
+    Mesmo método de gauss_seidel (ordem natural, uma equação por vez, mesmo critério de parada),
+    sem mensagens e com NumPy em cada equação: é a referência da comparação com o multicor.
+
+    Retorna:
+        ResultadoIterativo: Mesmos campos de gauss_seidel_multicor.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    n = len(b)
+    x = np.zeros(n)
+    monitor = MonitorConvergencia(e, max_i)
+    for k in range(1, max_i + 1):
+        e_total = 0.0
+        for i in range(n):
+            novo = (b[i] - A[i] @ x + A[i, i] * x[i]) / A[i, i]  # Usa os x[j] já atualizados
+            e_total += abs(novo - x[i])
+            x[i] = novo
+        motivo = monitor.registrar(e_total)
+        if motivo:
+            return monitor.resultado(x, k, motivo, "Gauss-Seidel natural")
+    return monitor.resultado(x, max_i, None, "Gauss-Seidel natural")
+
+
+def matriz_poisson(m):
+    """
+    Matriz do problema de Poisson em uma malha m x m (5 pontos): 4 na diagonal e -1 para
+    cada vizinho da malha. É um caso típico em que o grafo tem só duas cores.
+
+    Parâmetros:
+        m (int): Número de pontos em cada direção (a matriz é m² x m²).
+
+    Retorna:
+        numpy.ndarray: Matriz (m² x m²).
+    """
+    T = 4 * np.eye(m) - np.eye(m, k=1) - np.eye(m, k=-1)  # Acoplamento dentro de uma linha da malha
+    return np.kron(np.eye(m), T) - np.kron(np.eye(m, k=1) + np.eye(m, k=-1), np.eye(m))
+
+
+def comparar_ordenacoes(tamanhos=(5, 10, 15), e=1e-6, max_i=10000):
+    """
+    Compara o Gauss-Seidel na ordem natural (gauss_seidel_natural) com o multicor
+    (gauss_seidel_multicor) em matrizes de Poisson, em iterações e tempo.
+
+    Parâmetros:
+        tamanhos (tuple of int): Lados m das malhas (sistemas m² x m²).
+        e (float): Precisão desejada.
+        max_i (int): Número máximo de iterações.
+    """
+    print(f"{'n':>6} {'cores':>6} {'it. natural':>12} {'t natural (s)':>14} {'it. multicor':>13} {'t multicor (s)':>15}")
+    for m in tamanhos:
+        A = matriz_poisson(m)
+        b = np.ones(m * m)
+
+        inicio = time.perf_counter()
+        natural = gauss_seidel_natural(A, b, e, max_i)
+        tempo_natural = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        multicor = gauss_seidel_multicor(A, b, e, max_i)
+        tempo_multicor = time.perf_counter() - inicio
+
+        diferenca = np.abs(natural.x - multicor.x).max()
+        print(f"{m * m:>6} {len(colorir_grafo(A)):>6} {natural.iteracoes:>12} {tempo_natural:>14.4f} "
+              f"{multicor.iteracoes:>13} {tempo_multicor:>15.4f}   (diferença entre as soluções: {diferenca:.1e})")
+        # Taxa de contração estimada pelo monitor (na matriz de Poisson as duas ordens têm a mesma)
+        print(f"{'':>6} {natural}\n{'':>6} {multicor}")
+
+
 def main():
     """
     Função principal que controla o fluxo do programa.
@@ -161,6 +323,10 @@ def main():
         # Trata quaisquer outros erros inesperados.
         print(f"\nOcorreu um erro inesperado: {e}\n")
     
+    # Compara a ordem natural com a multicor em sistemas maiores
+    print("\n=== GAUSS-SEIDEL: ORDEM NATURAL x MULTICOR (malhas de Poisson) ===\n")
+    comparar_ordenacoes()
+
     print("\n=== FIM DA RESOLUÇÃO ===")
 
 # Verifica se o script está sendo executado diretamente
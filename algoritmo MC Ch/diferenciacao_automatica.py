@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""
+Diferenciação Automática no Modo Direto (Números Duais e Séries de Taylor)
+=========================================================================
+
+Este módulo calcula f(x) e as suas derivadas ao mesmo tempo, sem precisar escrever as
+derivadas à mão.
+
+Um número dual guarda um valor e a sua derivada: x = valor + derivada * ε, com ε² = 0.
+Ao avaliar f em Dual(x, 1), as regras de derivação (soma, produto, quociente, cadeia)
+são aplicadas automaticamente em cada operação, e o resultado traz f(x) e f'(x).
+
+Para derivadas de ordem mais alta, a classe Taylor guarda os coeficientes da série de
+Taylor truncada c0 + c1*h + ... + cd*h^d, com f^(k)(x) = k! * ck. Uma única avaliação de
+f em Taylor.variavel(x, d) traz f(x), f'(x), ..., f^(d)(x).
+
+Funcionalidades:
+1. Classe Dual com os operadores aritméticos (+, -, *, /, **) sobrecarregados.
+2. Classe Taylor (modo Taylor, derivadas de qualquer ordem) com os mesmos operadores.
+3. Funções matemáticas (exp, log, log10, sqrt, sin, cos, tan) que aceitam floats, Duais e Taylor.
+4. Função derivar(f, x) que retorna (f(x), f'(x)) em uma única avaliação de f.
+5. Funções coeficientes_taylor(f, x, ordem) e derivadas(f, x, ordem) para ordens mais altas.
+
+Uso:
+    As funções f(x) devem usar as funções deste módulo no lugar das do módulo math
+    (por exemplo, log(x) em vez de math.log(x)). Para floats elas se comportam
+    exatamente como as funções de math.
+"""
+
+import math  # Importa o módulo math para as funções aplicadas aos valores
+
+
+class Dual:
+    """
+    Número dual: valor + derivada * ε, com ε² = 0.
+
+    Atributos:
+        valor (float): Valor da expressão no ponto.
+        derivada (float): Derivada da expressão em relação à variável independente.
+    """
+
+    __slots__ = ("valor", "derivada")  # Evita o dicionário por instância (objetos mais leves e rápidos)
+
+    def __init__(self, valor, derivada=0.0):
+        self.valor = valor
+        self.derivada = derivada
+
+    def __repr__(self):
+        return f"Dual({self.valor}, {self.derivada})"
+
+    # Soma: (u + v)' = u' + v'
+    def __add__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor + outro.valor, self.derivada + outro.derivada)
+        return Dual(self.valor + outro, self.derivada)
+
+    __radd__ = __add__
+
+    # Subtração: (u - v)' = u' - v'
+    def __sub__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor - outro.valor, self.derivada - outro.derivada)
+        return Dual(self.valor - outro, self.derivada)
+
+    def __rsub__(self, outro):
+        return Dual(outro - self.valor, -self.derivada)
+
+    # Produto: (u * v)' = u' * v + u * v'
+    def __mul__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor * outro.valor,
+                        self.derivada * outro.valor + self.valor * outro.derivada)
+        return Dual(self.valor * outro, self.derivada * outro)
+
+    __rmul__ = __mul__
+
+    # Quociente: (u / v)' = (u' * v - u * v') / v²
+    def __truediv__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor / outro.valor,
+                        (self.derivada * outro.valor - self.valor * outro.derivada) / outro.valor**2)
+        return Dual(self.valor / outro, self.derivada / outro)
+
+    def __rtruediv__(self, outro):
+        return Dual(outro / self.valor, -outro * self.derivada / self.valor**2)
+
+    # Potência: (u^n)' = n * u^(n-1) * u'  e  (u^v)' = u^v * (v' * ln(u) + v * u' / u)
+    def __pow__(self, expoente):
+        if isinstance(expoente, (int, float)) and expoente == 0:
+            # u^0 = 1 e (u^0)' = 0, mesmo com u = 0 (a fórmula geral teria 0 * 0^(-1))
+            return Dual(1.0, 0.0)
+        if isinstance(expoente, Dual):
+            valor = self.valor ** expoente.valor
+            return Dual(valor, valor * (expoente.derivada * math.log(self.valor)
+                                        + expoente.valor * self.derivada / self.valor))
+        return Dual(self.valor ** expoente, expoente * self.valor ** (expoente - 1) * self.derivada)
+
+    # Base numérica: (c^v)' = c^v * ln(c) * v'
+    def __rpow__(self, base):
+        valor = base ** self.valor
+        return Dual(valor, valor * math.log(base) * self.derivada)
+
+    def __neg__(self):
+        return Dual(-self.valor, -self.derivada)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self if self.valor >= 0 else -self
+
+    # Comparações usam apenas o valor (permite testes como "if x <= 0" dentro de f)
+    def __eq__(self, outro):
+        return self.valor == (outro.valor if isinstance(outro, Dual) else outro)
+
+    def __lt__(self, outro):
+        return self.valor < (outro.valor if isinstance(outro, Dual) else outro)
+
+    def __le__(self, outro):
+        return self.valor <= (outro.valor if isinstance(outro, Dual) else outro)
+
+    def __gt__(self, outro):
+        return self.valor > (outro.valor if isinstance(outro, Dual) else outro)
+
+    def __ge__(self, outro):
+        return self.valor >= (outro.valor if isinstance(outro, Dual) else outro)
+
+    __hash__ = None  # Objetos mutáveis com __eq__ não devem ser usados como chave
+
+    def __float__(self):
+        return float(self.valor)
+
+
+class Taylor:
+    """
+    Série de Taylor truncada: c[0] + c[1]*h + ... + c[d]*h^d.
+
+    As operações seguem as recorrências clássicas da diferenciação automática
+    no modo Taylor, com custo O(d²) por operação.
+
+    Atributos:
+        c (list of float): Coeficientes da série; f^(k)(x) = k! * c[k].
+    """
+
+    __slots__ = ("c",)
+
+    def __init__(self, c):
+        self.c = c
+
+    @classmethod
+    def variavel(cls, x, ordem):
+        """Variável independente x + h, truncada na ordem dada."""
+        return cls([x, 1.0] + [0.0] * (ordem - 1)) if ordem >= 1 else cls([x])
+
+    def __repr__(self):
+        return f"Taylor({self.c})"
+
+    def _constante(self, valor):
+        # Converte um número em série de Taylor constante da mesma ordem
+        return Taylor([valor] + [0.0] * (len(self.c) - 1))
+
+    def __add__(self, outro):
+        if isinstance(outro, Taylor):
+            return Taylor([u + v for u, v in zip(self.c, outro.c)])
+        return Taylor([self.c[0] + outro] + self.c[1:])
+
+    __radd__ = __add__
+
+    def __sub__(self, outro):
+        if isinstance(outro, Taylor):
+            return Taylor([u - v for u, v in zip(self.c, outro.c)])
+        return Taylor([self.c[0] - outro] + self.c[1:])
+
+    def __rsub__(self, outro):
+        return Taylor([outro - self.c[0]] + [-u for u in self.c[1:]])
+
+    # Produto de Cauchy: w[k] = soma u[j] * v[k-j]
+    def __mul__(self, outro):
+        if isinstance(outro, Taylor):
+            u, v = self.c, outro.c
+            return Taylor([sum(u[j] * v[k - j] for j in range(k + 1)) for k in range(len(u))])
+        return Taylor([u * outro for u in self.c])
+
+    __rmul__ = __mul__
+
+    # Quociente: w[k] = (u[k] - soma_{j>=1} v[j] * w[k-j]) / v[0]
+    def __truediv__(self, outro):
+        if not isinstance(outro, Taylor):
+            return Taylor([u / outro for u in self.c])
+        u, v = self.c, outro.c
+        w = []
+        for k in range(len(u)):
+            w.append((u[k] - sum(v[j] * w[k - j] for j in range(1, k + 1))) / v[0])
+        return Taylor(w)
+
+    def __rtruediv__(self, outro):
+        return self._constante(outro) / self
+
+    def __pow__(self, expoente):
+        if isinstance(expoente, Taylor):
+            return (expoente * self.log()).exp()
+        if isinstance(expoente, int) and expoente >= 0:
+            # Expoente inteiro: multiplicações sucessivas (funciona mesmo com u[0] = 0)
+            resultado = self._constante(1.0)
+            for _ in range(expoente):
+                resultado = resultado * self
+            return resultado
+        # w = u^a: w[k] = 1/(k u[0]) * soma_{j=1..k} ((a + 1) j - k) u[j] w[k-j]
+        u = self.c
+        w = [u[0] ** expoente]
+        for k in range(1, len(u)):
+            w.append(sum(((expoente + 1) * j - k) * u[j] * w[k - j] for j in range(1, k + 1)) / (k * u[0]))
+        return Taylor(w)
+
+    def __rpow__(self, base):
+        return (self * math.log(base)).exp()
+
+    def __neg__(self):
+        return Taylor([-u for u in self.c])
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self if self.c[0] >= 0 else -self
+
+    # Comparações usam apenas o valor (coeficiente de ordem 0)
+    def __eq__(self, outro):
+        return self.c[0] == (outro.c[0] if isinstance(outro, Taylor) else outro)
+
+    def __lt__(self, outro):
+        return self.c[0] < (outro.c[0] if isinstance(outro, Taylor) else outro)
+
+    def __le__(self, outro):
+        return self.c[0] <= (outro.c[0] if isinstance(outro, Taylor) else outro)
+
+    def __gt__(self, outro):
+        return self.c[0] > (outro.c[0] if isinstance(outro, Taylor) else outro)
+
+    def __ge__(self, outro):
+        return self.c[0] >= (outro.c[0] if isinstance(outro, Taylor) else outro)
+
+    __hash__ = None
+
+    def __float__(self):
+        return float(self.c[0])
+
+    # w = e^u: w[k] = (1/k) soma_{j=1..k} j u[j] w[k-j]
+    def exp(self):
+        u = self.c
+        w = [math.exp(u[0])]
+        for k in range(1, len(u)):
+            w.append(sum(j * u[j] * w[k - j] for j in range(1, k + 1)) / k)
+        return Taylor(w)
+
+    # w = ln u: w[k] = (u[k] - (1/k) soma_{j=1..k-1} j w[j] u[k-j]) / u[0]
+    def log(self):
+        u = self.c
+        w = [math.log(u[0])]
+        for k in range(1, len(u)):
+            w.append((u[k] - sum(j * w[j] * u[k - j] for j in range(1, k)) / k) / u[0])
+        return Taylor(w)
+
+    def log10(self):
+        return self.log() / math.log(10)
+
+    def sqrt(self):
+        return self ** 0.5
+
+    def _sin_cos(self):
+        # Recorrências acopladas de seno e cosseno
+        u = self.c
+        s = [math.sin(u[0])]
+        c = [math.cos(u[0])]
+        for k in range(1, len(u)):
+            s.append(sum(j * u[j] * c[k - j] for j in range(1, k + 1)) / k)
+            c.append(-sum(j * u[j] * s[k - j] for j in range(1, k + 1)) / k)
+        return Taylor(s), Taylor(c)
+
+    def sin(self):
+        return self._sin_cos()[0]
+
+    def cos(self):
+        return self._sin_cos()[1]
+
+    def tan(self):
+        s, c = self._sin_cos()
+        return s / c
+
+
+def _regra_da_cadeia(funcao, derivada_funcao):
+    """
+    Cria uma função que aceita floats, Duais e séries de Taylor a partir de g e g'.
+
+    Para um Dual u, retorna Dual(g(u), g'(u) * u'), ou seja, aplica a regra da cadeia.
+    Para uma série de Taylor, usa o método de mesmo nome da classe Taylor.
+    """
+    def aplicar(x):
+        if isinstance(x, Dual):
+            return Dual(funcao(x.valor), derivada_funcao(x.valor) * x.derivada)
+        if isinstance(x, Taylor):
+            return getattr(x, funcao.__name__)()
+        return funcao(x)
+    aplicar.__name__ = funcao.__name__
+    aplicar.__doc__ = f"Versão de math.{funcao.__name__} que também aceita números duais e séries de Taylor."
+    return aplicar
+
+
+# Funções matemáticas com as suas derivadas
+exp = _regra_da_cadeia(math.exp, math.exp)
+log = _regra_da_cadeia(math.log, lambda x: 1 / x)
+log10 = _regra_da_cadeia(math.log10, lambda x: 1 / (x * math.log(10)))
+sqrt = _regra_da_cadeia(math.sqrt, lambda x: 0.5 / math.sqrt(x))
+sin = _regra_da_cadeia(math.sin, math.cos)
+cos = _regra_da_cadeia(math.cos, lambda x: -math.sin(x))
+tan = _regra_da_cadeia(math.tan, lambda x: 1 / math.cos(x)**2)
+
+# Constantes, para que f(x) possa ser escrita sem importar math
+e = math.e
+pi = math.pi
+
+
+def derivar(f, x):
+    """
+    Avalia f e a sua derivada no ponto x em uma única passagem.
+
+    Parâmetros:
+        f (function): Função escrita com os operadores e as funções deste módulo.
+        x (float): Ponto de avaliação.
+
+    Retorna:
+        tuple: (f(x), f'(x))
+    """
+    resultado = f(Dual(x, 1.0))  # Semente: dx/dx = 1
+    if isinstance(resultado, Dual):
+        return resultado.valor, resultado.derivada
+    return resultado, 0.0  # f não depende de x
+
+
+def coeficientes_taylor(f, x, ordem):
+    """
+    Calcula os coeficientes da série de Taylor de f em torno de x em uma única passagem.
+
+    Parâmetros:
+        f (function): Função escrita com os operadores e as funções deste módulo.
+        x (float): Ponto de avaliação.
+        ordem (int): Maior ordem de derivada desejada.
+
+    Retorna:
+        list of float: [c0, c1, ..., c_ordem], com f^(k)(x) = k! * ck.
+    """
+    resultado = f(Taylor.variavel(x, ordem))
+    if isinstance(resultado, Taylor):
+        return list(resultado.c)
+    return [resultado] + [0.0] * ordem  # f não depende de x
+
+
+def derivadas(f, x, ordem):
+    """
+    Calcula [f(x), f'(x), ..., f^(ordem)(x)] em uma única passagem de f.
+    """
+    return [ck * math.factorial(k) for k, ck in enumerate(coeficientes_taylor(f, x, ordem))]
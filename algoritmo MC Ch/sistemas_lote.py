@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Resolução em Lote de Muitos Sistemas Lineares Pequenos
+======================================================
+
+Os métodos de Newton para sistemas não lineares (10. metodo_newton.py, 10.2 newton_modificado.py)
+e as varreduras de parâmetros geram milhões de sistemas pequenos (2x2 a 10x10). Resolver cada um
+com eliminacao_gauss ou resolver_sistema_linear custa um laço em Python por sistema.
+
+Aqui todos os m sistemas são escalonados juntos: A tem forma (m, n, n) e b tem forma (m, n).
+Em cada coluna k, o pivô de cada sistema é escolhido de uma vez (argmax ao longo do lote), as
+trocas de linha e a eliminação são feitas com operações do NumPy sobre o lote inteiro, e o laço
+em Python tem só n passos, qualquer que seja m.
+
+Funcionalidades:
+1. eliminacao_gauss_lote(A, b): eliminação de Gauss com pivotamento parcial em lote, com
+   indicação de quais sistemas são singulares (sem interromper os demais).
+2. newton_lote(F, J, X0): Método de Newton aplicado a m sistemas não lineares ao mesmo tempo.
+3. Comparação de desempenho com a resolução sistema a sistema (ao executar este arquivo).
+"""
+
+import time  # Medição do tempo na comparação de desempenho
+
+import numpy as np  # Operações vetorizadas sobre o lote de sistemas
+
+
+def eliminacao_gauss_lote(A, b, tol=0.0):
+    """
+    Resolve m sistemas lineares A[i] x[i] = b[i] ao mesmo tempo, por eliminação de Gauss
+    com pivotamento parcial.
+
+    Parâmetros:
+        A (array (m, n, n)): Matrizes dos coeficientes (não são alteradas).
+        b (array (m, n)): Vetores dos termos independentes (não são alterados).
+        tol (float): Um pivô com valor absoluto menor ou igual a tol marca o sistema como singular.
+
+    Retorna:
+        tuple: (x, singular)
+            x (array (m, n)): Soluções; as linhas dos sistemas singulares ficam com NaN.
+            singular (array (m,) de bool): True para os sistemas sem solução única.
+    """
+    A = np.array(A, dtype=float)  # Cópias de trabalho, que serão escalonadas
+    b = np.array(b, dtype=float)
+    m, n, _ = A.shape
+    lote = np.arange(m)  # Índice de cada sistema, para as trocas de linha em lote
+    singular = np.zeros(m, dtype=bool)
+
+    for k in range(n):
+        # Escolha do pivô em todos os sistemas de uma vez: maior |A[i, r, k]| com r >= k
+        linha_pivo = np.argmax(np.abs(A[:, k:, k]), axis=1) + k
+
+        # Troca as linhas k e linha_pivo em cada sistema (e em b)
+        linha_k, b_k = A[:, k].copy(), b[:, k].copy()
+        A[:, k], b[:, k] = A[lote, linha_pivo], b[lote, linha_pivo]
+        A[lote, linha_pivo], b[lote, linha_pivo] = linha_k, b_k
+
+        # Sistemas com pivô nulo são marcados; o pivô vira 1 só para não dividir por zero
+        pivo = A[:, k, k]
+        nulo = np.abs(pivo) <= tol
+        singular |= nulo
+        pivo = np.where(nulo, 1.0, pivo)
+
+        # Eliminação abaixo do pivô em todos os sistemas: uma atualização de posto 1 por sistema
+        fatores = A[:, k+1:, k] / pivo[:, None]
+        A[:, k+1:, k:] -= fatores[:, :, None] * A[:, None, k, k:]
+        b[:, k+1:] -= fatores * b[:, k, None]
+
+    # Substituição reversa em lote (os sistemas singulares recebem NaN no final)
+    x = np.zeros((m, n))
+    diagonal = np.where(singular[:, None], 1.0, np.diagonal(A, axis1=1, axis2=2))
+    for i in range(n - 1, -1, -1):
+        soma = np.einsum("ij,ij->i", A[:, i, i+1:], x[:, i+1:])
+        x[:, i] = (b[:, i] - soma) / diagonal[:, i]
+    x[singular] = np.nan
+
+    return x, singular
+
+
+def newton_lote(F, J, X0, erro=1e-10, max_iter=50):
+    """
+    Método de Newton para m sistemas não lineares F(x) = 0 resolvidos em lote
+    (por exemplo, uma varredura de chutes iniciais ou de parâmetros).
+
+    Parâmetros:
+        F (function): Recebe X (m, n) e retorna F(X) (m, n), uma linha por sistema.
+        J (function): Recebe X (m, n) e retorna as Jacobianas (m, n, n).
+        X0 (array (m, n)): Chutes iniciais.
+        erro (float): Tolerância para a norma de F(x) e para a norma do passo.
+        max_iter (int): Número máximo de iterações.
+
+    Retorna:
+        tuple: (X, iteracoes, convergiu)
+            X (array (m, n)): Aproximações finais.
+            iteracoes (array (m,) de int): Iterações feitas por cada sistema.
+            convergiu (array (m,) de bool): True se o sistema atingiu a tolerância
+                                            (False também quando a Jacobiana ficou singular).
+    """
+    X = np.array(X0, dtype=float)
+    m = X.shape[0]
+    iteracoes = np.zeros(m, dtype=int)
+    convergiu = np.zeros(m, dtype=bool)
+    ativos = np.arange(m)  # Sistemas que ainda estão iterando
+
+    for _ in range(max_iter):
+        if ativos.size == 0:
+            break
+        F_val = F(X[ativos])
+
+        # Sistemas cuja norma de F já está abaixo da tolerância param aqui
+        pronto = np.linalg.norm(F_val, axis=1) < erro
+        convergiu[ativos[pronto]] = True
+        ativos, F_val = ativos[~pronto], F_val[~pronto]
+        if ativos.size == 0:
+            break
+
+        # Um único escalonamento em lote para todos os passos de Newton: J(x) s = -F(x)
+        s, singular = eliminacao_gauss_lote(J(X[ativos]), -F_val)
+        ativos, s = ativos[~singular], s[~singular]  # Jacobiana singular: o sistema para sem convergir
+
+        X[ativos] += s
+        iteracoes[ativos] += 1
+
+        pequeno = np.linalg.norm(s, axis=1) < erro
+        convergiu[ativos[pequeno]] = True
+        ativos = ativos[~pequeno]
+
+    return X, iteracoes, convergiu
+
+
+def comparar_desempenho(m=100000, n=3, amostra=5000):
+    """
+    Compara a resolução em lote com a resolução sistema a sistema (np.linalg.solve em um laço).
+
+    Parâmetros:
+        m (int): Número de sistemas resolvidos em lote.
+        n (int): Ordem de cada sistema.
+        amostra (int): Número de sistemas resolvidos um a um (o tempo é extrapolado para m).
+    """
+    rng = np.random.default_rng(0)
+    A = rng.random((m, n, n)) + n * np.eye(n)  # Sistemas bem condicionados
+    b = rng.random((m, n))
+
+    inicio = time.perf_counter()
+    x, singular = eliminacao_gauss_lote(A, b)
+    tempo_lote = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for i in range(amostra):
+        np.linalg.solve(A[i], b[i])
+    tempo_um_a_um = (time.perf_counter() - inicio) * m / amostra
+
+    print(f"{m} sistemas {n}x{n}:")
+    print(f"  em lote:    {tempo_lote:.3f} s ({m / tempo_lote:,.0f} sistemas/s)")
+    print(f"  um a um:    {tempo_um_a_um:.3f} s ({m / tempo_um_a_um:,.0f} sistemas/s, estimado)")
+    print(f"  erro máximo em relação ao np.linalg.solve: {np.abs(x - np.linalg.solve(A, b[..., None])[..., 0]).max():.2e}")
+
+
+if __name__ == "__main__":
+    # Sistema do exemplo de 10. metodo_newton.py: x1 + x2 - 3 = 0, x1^2 + x2^2 - 9 = 0,
+    # resolvido a partir de uma grade de chutes iniciais (raízes (0, 3) e (3, 0))
+    F = lambda X: np.stack([X[:, 0] + X[:, 1] - 3, X[:, 0]**2 + X[:, 1]**2 - 9], axis=1)
+    J = lambda X: np.stack([np.stack([np.ones(len(X)), np.ones(len(X))], axis=1),
+                            2 * X], axis=1)
+
+    chutes = np.stack(np.meshgrid(np.linspace(-5, 5, 201), np.linspace(-5, 5, 201)), axis=-1).reshape(-1, 2)
+    X, iteracoes, convergiu = newton_lote(F, J, chutes)
+    print(f"Newton em lote: {len(chutes)} chutes, {convergiu.sum()} convergiram, "
+          f"média de {iteracoes[convergiu].mean():.1f} iterações")
+    raizes = np.unique(np.round(X[convergiu], 8) + 0.0, axis=0)
+    print(f"Raízes encontradas: {raizes.tolist()}\n")
+
+    # Sistemas singulares são indicados sem interromper os outros
+    A = np.array([[[1.0, 2.0], [2.0, 4.0]], [[2.0, 1.0], [1.0, 3.0]]])
+    b = np.array([[1.0, 2.0], [3.0, 4.0]])
+    x, singular = eliminacao_gauss_lote(A, b)
+    print(f"Sistemas singulares: {singular.tolist()}, soluções: {x.tolist()}\n")
+
+    comparar_desempenho()
@@ -4,27 +4,31 @@ import sys
 e = sys.float_info.epsilon
 
 def posicao_falsa(f, a, b, e, max_iter=100000):
-    if f(a) * f(b) > 0:
-        return "Intervalo inválido: f(a) e f(b) devem ter sinais opostos"
+    # f(a) e f(b) são guardados e reaproveitados, cada ponto é avaliado uma única vez
+    fa = f(a)
+    fb = f(b)
+    nfev = 2  # contador de avaliações de f
+
+    if fa * fb > 0:
+        raise ValueError("Intervalo inválido: f(a) e f(b) devem ter sinais opostos")
     
     iter_count = 0  # contador de iterações
 
     while abs(b - a) > e and iter_count < max_iter:
-        c = (a * f(b) - b * f(a)) / (f(b) - f(a))
-
-        if f(c) == 0:  
-            return c
-        elif f(a) * f(c) < 0: 
-            b = c
+        c = (a * fb - b * fa) / (fb - fa)
+        fc = f(c)
+        nfev += 1
+
+        if fc == 0:  
+            return c, nfev
+        elif fa * fc < 0: 
+            b, fb = c, fc
         else:  
-            a = c
+            a, fa = c, fc
         
         iter_count += 1  # incrementa contador de iterações
 
-    if iter_count == max_iter:
-        return c
-
-    return c  
+    return c, nfev
 
 def f1(x):
     return (x**3) - (9*x) + 3  
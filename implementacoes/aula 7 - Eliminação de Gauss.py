@@ -7,20 +7,17 @@ def eliminacao_gauss(matriz_a):
         if matriz_a[i][i] == 0:
             for j in range(i + 1, n):
                 if matriz_a[j][i] != 0:
-                    matriz_a[i], matriz_a[j] = matriz_a[j], matriz_a[i]
+                    matriz_a[[i, j]] = matriz_a[[j, i]]
                     break
 
         matriz_a[i] = matriz_a[i] / matriz_a[i][i]
         
-        for j in range(i + 1, n):
-            fator = matriz_a[j][i]
-            matriz_a[j] -= fator * matriz_a[i]
+        # zera a coluna i abaixo do pivô em todas as linhas de uma vez
+        matriz_a[i + 1:] -= np.outer(matriz_a[i + 1:, i], matriz_a[i])
     
     solucao = np.zeros(n)
     for i in range(n - 1, -1, -1):
-        solucao[i] = matriz_a[i][n]
-        for j in range(i + 1, n):
-            solucao[i] -= matriz_a[i][j] * solucao[j]
+        solucao[i] = matriz_a[i][n] - matriz_a[i, i + 1:n] @ solucao[i + 1:]
     
     return solucao
 
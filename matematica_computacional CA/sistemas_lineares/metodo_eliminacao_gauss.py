@@ -1,19 +1,10 @@
 import numpy as np
 
-def sistemaTriangularSuperior(A, b):
-    # Pegar o tamanho da matriz
-    n , _ = np.shape(A)
-    # Iniciar o vetor solução com 0
-    x = np.zeros(n)
-
-    # Resolver de trás pra frente o sistema
-    for i in range(n-1, -1, -1):
-        soma = 0
-        for j in range(i+1, n):
-            soma += A[i, j] * x[j]
-        x[i] = (b[i] - soma) / A[i, i]
+from nucleo import eliminar_coluna, pivotear, substituicao_para_tras
 
-    return x
+def sistemaTriangularSuperior(A, b):
+    # Resolver de trás pra frente o sistema, um produto escalar por linha
+    return substituicao_para_tras(A, b)
 
 
 def metodo_eliminacao_gauss(A, b):
@@ -25,13 +16,10 @@ def metodo_eliminacao_gauss(A, b):
 
     # Iteração vai até n-1
     for c in range(n-1):
-        # Candidato a pivô é o elemento da coluna c que está na diagonal principal
-        pivo = A_aumentada[c, c]
-        for l in range(c+1, n):
-            # Operações para zerar as linhas abaixo do pivô
-            fator = A_aumentada[l, c] / pivo
-            A_aumentada[l, 0:] -= fator * A_aumentada[c, 0:]
-            print(f"Escalonando coluna {c}: \n{A_aumentada}\n")
+        # Pivô é o elemento da coluna c que está na diagonal principal
+        # Zera todas as linhas abaixo do pivô de uma vez (produto externo)
+        eliminar_coluna(A_aumentada, c)
+        print(f"Escalonando coluna {c}: \n{A_aumentada}\n")
 
     print(f"Matriz triangular superior: \n{A_aumentada}\n")
     
@@ -55,11 +43,9 @@ def metodo_eliminacao_gauss_pivoteamento_parcial(A, b):
 
     # Etapas de escalonamento
     for c in range(n-1):
-        # Pivoteamento parcial: encontrar o índice do maior elemento em módulo na coluna c
-        max_index = np.argmax(np.abs(A_aumentada[c:, c])) + c
+        # Pivoteamento parcial: trocar a linha c com a do maior elemento em módulo na coluna c
+        max_index = pivotear(A_aumentada, c)
         if max_index != c:
-            # Trocar as linhas c e max_index
-            A_aumentada[[c, max_index]] = A_aumentada[[max_index, c]]
             print(f"Troca de linhas {c} e {max_index} para pivoteamento:\n{A_aumentada}\n")
 
         # Candidato a pivô é o elemento da diagonal principal
@@ -67,11 +53,9 @@ def metodo_eliminacao_gauss_pivoteamento_parcial(A, b):
         if np.abs(pivo) < 1e-12:
             raise ValueError("Sistema singular ou quase singular, pivô muito pequeno!")
 
-        for l in range(c+1, n):
-            # Operações para zerar as linhas abaixo do pivô
-            fator = A_aumentada[l, c] / pivo
-            A_aumentada[l, c:] -= fator * A_aumentada[c, c:]
-            print(f"Escalonando coluna {c}: \n{A_aumentada}\n")
+        # Zera todas as linhas abaixo do pivô de uma vez (produto externo)
+        eliminar_coluna(A_aumentada, c)
+        print(f"Escalonando coluna {c}: \n{A_aumentada}\n")
 
     print(f"Matriz triangular superior: \n{A_aumentada}\n")
 
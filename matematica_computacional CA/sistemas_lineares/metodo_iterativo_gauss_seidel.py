@@ -1,10 +1,15 @@
 import numpy as np
 
+from monitor_convergencia import MonitorConvergencia
+
 def gauss_seidel(A, b, x0, erro=1e-10, max_iter=50000):
+    # Retorna um ResultadoIterativo (resultado.x é a solução); o monitor interrompe o método
+    # assim que detecta divergência ou estagnação, sem esperar as max_iter iterações
     # Definindo o tamanho do sistema (número de equações)
     n = len(b)
     # Inicializa o vetor de soluções com o chute inicial
     x = x0.copy()
+    monitor = MonitorConvergencia(erro, max_iter)
     # Inicia o loop de iterações
     for _ in range(max_iter):
         # Cria uma cópia de x para armazenar os novos valores
@@ -18,17 +23,23 @@ def gauss_seidel(A, b, x0, erro=1e-10, max_iter=50000):
             # Atualiza x[i] para o valor calculado
             x_novo[i] = (b[i] - soma) / A[i, i]
 
-        # Verifica a convergência
-        if np.max(np.abs(x_novo - x)) < erro:
+        # Verifica a convergência (e a divergência ou estagnação)
+        motivo = monitor.registrar(np.max(np.abs(x_novo - x)))
+        if motivo == 'convergiu':
             print(f'Convergência atingida após {_+1} iterações.')
             print(x_novo)
-            return x_novo
+            return monitor.resultado(x_novo, _ + 1, motivo, 'Gauss-Seidel')
+        if motivo:
+            print(f'Método interrompido após {_+1} iterações: {motivo} '
+                  f'(taxa de contração estimada: {monitor.taxa_contracao()}).')
+            return monitor.resultado(x_novo, _ + 1, motivo, 'Gauss-Seidel')
 
         # Atualiza o vetor x para a próxima iteração
         x = x_novo
 
-    print(f'Máximo de iterações atingido: {max_iter}.')
-    return x
+    print(f'Máximo de iterações atingido: {max_iter} '
+          f'(faltariam cerca de {monitor.iteracoes_restantes()} iterações).')
+    return monitor.resultado(x, max_iter, None, 'Gauss-Seidel')
 
 
 # Exemplo de uso
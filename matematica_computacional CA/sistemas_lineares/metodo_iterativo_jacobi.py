@@ -1,31 +1,41 @@
 import numpy as np
 
-import numpy as np
+from monitor_convergencia import MonitorConvergencia
 
 def jacobi(A, b, x0, erro=1e-10, max_iter=50000):
-    # Definindo o tamanho do sistema (número de equações)
-    n, _ = np.shape(A)
+    # Retorna um ResultadoIterativo (resultado.x é a solução); o monitor interrompe o método
+    # assim que detecta divergência ou estagnação, sem esperar as max_iter iterações
+    # Separa A = D + R uma única vez: inverso da diagonal e A sem a diagonal
+    D_inv = 1.0 / np.diag(A)
+    R = np.array(A, dtype=float)
+    np.fill_diagonal(R, 0.0)
     # Inicializa o vetor de soluçòes com o chute inicial
-    x = x0.copy()
+    x = np.array(x0, dtype=float)
+    # Dois vetores pré-alocados que se alternam a cada iteração
+    x_novo = np.empty_like(x)
+    monitor = MonitorConvergencia(erro, max_iter)
     # Loop de iterações
     for _ in range(max_iter):
-        # Cria um novo vetor de soluções para esta iteração
-        x_novo = np.zeros_like(x)
-        # Calcula o valor de cada componente de x para a nova iteração
-        for i in range(n):
-            sum_ax = np.dot(A[i, :], x) - A[i, i] * x[i]  # Soma dos produtos
-            x_novo[i] = (b[i] - sum_ax) / A[i, i]  # Calcula novo valor de x[i]
-
-        # Verifica a convergência
-        if np.max(np.abs(x_novo - x)) < erro:
+        # Toda a iteração em um produto matriz-vetor: x_novo = D⁻¹ (b - R x)
+        np.dot(R, x, out=x_novo)
+        np.subtract(b, x_novo, out=x_novo)
+        x_novo *= D_inv
+
+        # Verifica a convergência (e a divergência ou estagnação)
+        motivo = monitor.registrar(np.max(np.abs(x_novo - x)))
+        x, x_novo = x_novo, x
+        if motivo == 'convergiu':
             print(f'Convergência atingida após {_+1} iterações.')
-            print(x_novo)
-            return x_novo
-
-        x = x_novo
+            print(x)
+            return monitor.resultado(x, _ + 1, motivo, 'Jacobi')
+        if motivo:
+            print(f'Método interrompido após {_+1} iterações: {motivo} '
+                  f'(taxa de contração estimada: {monitor.taxa_contracao()}).')
+            return monitor.resultado(x, _ + 1, motivo, 'Jacobi')
 
-    print(f'Máximo de iterações atingido: {max_iter}.')
-    return x
+    print(f'Máximo de iterações atingido: {max_iter} '
+          f'(faltariam cerca de {monitor.iteracoes_restantes()} iterações).')
+    return monitor.resultado(x, max_iter, None, 'Jacobi')
 
 
 A = np.array([
@@ -37,6 +47,9 @@ A = np.array([
 b = np.array([25, 141, 66], dtype=float)
 x0 = np.zeros_like(b)
 
+# Sem dominância diagonal o Jacobi diverge: o monitor para logo nas primeiras iterações
+jacobi(A, b, x0)
+
 # Exemplo de uso
 A = np.array([[10, 2, 1],
               [1, 5, 1],
@@ -1,34 +1,14 @@
 import numpy as np
 
-def sistemaTriangularSuperior(A, b):
-    # Pegar o tamanho da matriz
-    n , _ = np.shape(A)
-    # Iniciar o vetor solução com 0
-    x = np.zeros(n)
-
-    # Resolver de trás pra frente o sistema
-    for i in range(n-1, -1, -1):
-        soma = 0
-        for j in range(i+1, n):
-            soma += A[i, j] * x[j]
-        x[i] = (b[i] - soma) / A[i, i]
+from nucleo import eliminar_coluna, fatorar_lu, pivotear, substituicao_para_frente, substituicao_para_tras
 
-    return x
+def sistemaTriangularSuperior(A, b):
+    # Resolver de trás pra frente o sistema, um produto escalar por linha
+    return substituicao_para_tras(A, b)
 
 def sistemaTriangularInferior(A, b):
-    # Pegar o tamanho da matriz
-    n , _ = np.shape(A)
-    # Iniciar o vetor solução com 0
-    x = np.zeros(n)
-
-    # Resolver de frente pra trás o sistema
-    for i in range(n):
-        soma = 0
-        for j in range(i):
-            soma += A[i, j] * x[j]
-        x[i] = (b[i] - soma) / A[i, i]
-
-    return x
+    # Resolver de frente pra trás o sistema, um produto escalar por linha
+    return substituicao_para_frente(A, b)
 
 def metodo_lu(A, b):
     # Pegar quantidade de linhas e colunas (L = C)
@@ -42,15 +22,10 @@ def metodo_lu(A, b):
 
     # Iteração vai até a coluna n-1
     for c in range(n):
-        # Candidato a pivô é o elemento da coluna c que está na diagonal principal
-        pivo = U[c, c]
-        for l in range(c+1, n):
-            # Operações para zerar as linhas abaixo do pivô
-            fator = U[l, c] / pivo
-            # Preencher a matriz identidade com os fatores
-            L[l, c] = fator
-            U[l, 0:] -= fator * U[c, 0:]
-            print(f"Escalonando coluna {c}: \n{U}\n")
+        # Pivô é o elemento da coluna c que está na diagonal principal
+        # Zera as linhas abaixo do pivô de uma vez e preenche a identidade com os fatores
+        L[c+1:, c] = eliminar_coluna(U, c)
+        print(f"Escalonando coluna {c}: \n{U}\n")
 
     # Matriz U vai ser a A após o escalonamento
     # Matriz L vai ser a identidade com os fatores usados no escalonamento
@@ -67,60 +42,119 @@ def metodo_lu(A, b):
     print(f"Vetor solução X: \n{x}\n")
     return x
 
-def metodo_lu_pivoteamento(A, b):
+def metodo_lu_pivoteamento(A, b, sobrescrever=False, largura=None, detalhar=False):
+    """
+    sobrescrever: se True, A (np.ndarray de float) vira a própria matriz LU e não é feita nenhuma
+                  cópia; senão A (qualquer matriz, até de inteiros) é copiada como float
+    largura: se for dada, fatora em blocos com painéis dessa largura (bom para n grande),
+             sem mostrar cada coluna; o vetor de permutação é o mesmo da versão sem blocos
+    detalhar: se True, mostra cada troca de linhas e a matriz após cada coluna (O(n) matrizes
+              impressas, só para n pequeno)
+    L e U ficam compactadas numa matriz só e a permutação é um vetor de índices,
+    então a memória é de uma matriz n x n, e não de três (L, U e P)
+    """
     # Pegar quantidade de linhas e colunas (L = C)
     n, _ = np.shape(A)
-    # Criar uma matriz identidade (só diagonal principal com 1) de tamanho n
-    L = np.eye(n)
-    #Criar uma matriz identidade (só diagonal principal com 1) de tamanho n para armazenar as trocas 
-    P = np.eye(n)
-    # Criar a matriz U sendo cópia de A
-    U = A.copy()
-
-    print(f"Matriz A: \n{A}\n")
-
-    for c in range(n):
-        # Pivoteamento parcial: troca de linhas
-        max_row = np.argmax(abs(U[c:, c])) + c
-        if c != max_row:
-            U[[c, max_row]] = U[[max_row, c]]
-            P[[c, max_row]] = P[[max_row, c]]
-            L[[c, max_row], :c] = L[[max_row, c], :c]
-            print(f"Trocando linha {c} com {max_row}: \n{U}\n")
-
-        # Eliminação gaussiana
-        for l in range(c + 1, n):
-            factor = U[l, c] / U[c, c]
-            L[l, c] = factor
-            U[l, :] -= factor * U[c, :]
-            print(f"Escalonando coluna {c}: \n{U}\n")
-
-    # Matriz U vai ser a A após o escalonamento
-    # Matriz L vai ser a identidade com os fatores usados no escalonamento
-    print(f"Matriz L: \n{L}\n")
-    print(f"Matriz U: \n{U}\n")
-
-    Pb = np.dot(P, b)
+    if sobrescrever and not (isinstance(A, np.ndarray) and A.dtype == float):
+        raise ValueError("Para sobrescrever, A precisa ser um np.ndarray de float")
+    # Uma única matriz: fatores de L abaixo da diagonal, U da diagonal pra cima
+    LU = A if sobrescrever else np.array(A, dtype=float)
+    # Vetor de permutação: a linha i de PA é a linha p[i] de A
+    p = np.arange(n)
+
+    print(f"Matriz A: \n{LU}\n")
+
+    if largura is not None:
+        # Painéis fatorados coluna a coluna e o resto da matriz atualizado com um produto de matrizes
+        p = fatorar_lu(LU, largura=largura)
+    else:
+        for c in range(n):
+            # Pivoteamento parcial: troca de linhas (os fatores de L já calculados vão junto)
+            max_row = pivotear(LU, c, p)
+            if detalhar and c != max_row:
+                print(f"Trocando linha {c} com {max_row}: \n{LU}\n")
+
+            # Eliminação gaussiana de todas as linhas de uma vez, guardando os fatores no lugar dos zeros
+            eliminar_coluna(LU, c, guardar_fatores=True)
+            if detalhar:
+                print(f"Escalonando coluna {c}: \n{LU}\n")
+
+    # Abaixo da diagonal: L (a diagonal de 1 fica implícita), da diagonal pra cima: U
+    print(f"Matriz LU compactada: \n{LU}\n")
+    print(f"Vetor de permutação: {p}\n")
+
+    # Pb por indexação, sem montar a matriz P
+    Pb = np.asarray(b, dtype=float)[p]
 
     # PAx = b -> LUx = Pb -> Ux = y -> Ly = Pb
-    y = sistemaTriangularInferior(L, Pb)
+    y = substituicao_para_frente(LU, Pb, diagonal_unitaria=True)
     print(f"Vetor solução Y: \n{y}\n")
 
     # Ux = y
-    x = sistemaTriangularSuperior(U, y)
+    x = sistemaTriangularSuperior(LU, y)
 
     print(f"Vetor solução X: \n{x}\n")
     return x
 
 
-A = np.array([
-    [3, -4, -6],
-    [18, -21, -33],
-    [12, -10, -22]
-], dtype=float)
-
-b = np.array([25, 141, 66], dtype=float)
-
-metodo_lu(A, b)
-
-metodo_lu_pivoteamento(A, b)
+class LUFactorization:
+    """
+    Fatoração PA = LU com pivoteamento parcial, feita uma vez e reutilizada para vários b.
+
+    LU guarda L e U numa matriz só: abaixo da diagonal ficam os fatores de L (a diagonal
+    de 1 de L não é guardada) e da diagonal para cima fica U.
+    p é o vetor de permutação: a linha i de PA é a linha p[i] de A, então Pb = b[p].
+    Com sobrescrever=True a própria A (float) vira LU, sem nenhuma cópia.
+    Com largura=k a fatoração é feita em blocos de k colunas (mais rápida para n grande) e,
+    com threads=t, a atualização dos blocos é dividida em tarefas rodando em t threads.
+
+    Fatorar custa O(n³), mas cada solve depois disso custa só O(n²).
+    """
+
+    def __init__(self, A, sobrescrever=False, largura=None, threads=None):
+        n, _ = np.shape(A)
+        self.n = n
+        if sobrescrever and not (isinstance(A, np.ndarray) and A.dtype == float):
+            raise ValueError("Para sobrescrever, A precisa ser um np.ndarray de float")
+        self.LU = A if sobrescrever else np.array(A, dtype=float)
+        # Pivoteamento parcial e eliminação com o núcleo vetorizado (em blocos/tarefas se pedido)
+        self.p = fatorar_lu(self.LU, largura=largura, threads=threads)
+
+    def _substituicoes(self, Y):
+        # Ly = Pb (L tem diagonal 1) e depois Ux = y
+        y = substituicao_para_frente(self.LU, Y, diagonal_unitaria=True)
+        return substituicao_para_tras(self.LU, y)
+
+    def solve(self, b):
+        # b[p] já é uma cópia, então o b original não é alterado
+        return self._substituicoes(np.asarray(b, dtype=float)[self.p])
+
+    def solve_many(self, B):
+        """
+        B: matriz n x k, cada coluna é um lado direito (mesma convenção de np.linalg.solve)
+        retorna: matriz n x k com as soluções nas colunas (a coluna j resolve Ax = B[:, j])
+        """
+        B = np.asarray(B, dtype=float)
+        if B.shape[0] != self.n:
+            raise ValueError("B precisa ter {} linhas, uma coluna por lado direito".format(self.n))
+        return self._substituicoes(B[self.p])
+
+
+if __name__ == "__main__":
+    A = np.array([
+        [3, -4, -6],
+        [18, -21, -33],
+        [12, -10, -22]
+    ], dtype=float)
+
+    b = np.array([25, 141, 66], dtype=float)
+
+    metodo_lu(A, b)
+
+    metodo_lu_pivoteamento(A, b, detalhar=True)
+
+    # Mesma matriz com vários lados direitos: fatora uma vez e resolve cada b em O(n²)
+    fatoracao = LUFactorization(A)
+    print(f"x = {fatoracao.solve(b)}")
+    B = np.column_stack([b, [1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    print(f"Soluções (colunas): \n{fatoracao.solve_many(B)}\n")
@@ -0,0 +1,141 @@
+# Monitor de convergência e resultado comum dos métodos iterativos para sistemas lineares
+import math
+
+
+class ResultadoIterativo:
+    """
+    Resultado comum dos métodos iterativos.
+
+    Atributos:
+        x (ndarray): Última aproximação calculada.
+        iteracoes (int): Número de iterações realizadas.
+        motivo (str): "convergiu", "divergiu", "estagnou", "max_iter" ou "direto" (resolvido por um
+                      método direto porque a iteração não convergiria).
+        historico (list of float): Grandeza monitorada em cada iteração (variação entre
+                                   iterações ou norma do resíduo, conforme o método).
+        taxa_contracao (float): Fator médio de redução por iteração na janela final (None se não houver dados).
+        iteracoes_restantes (float): Previsão de iterações que ainda faltariam até a tolerância
+                                     (0 se convergiu, inf se a taxa não é menor que 1).
+        metodo (str): Nome do método.
+        extras (dict): Informações próprias de cada método (por exemplo, o histórico de omega do SOR).
+    """
+
+    __slots__ = ("x", "iteracoes", "motivo", "historico", "taxa_contracao", "iteracoes_restantes", "metodo", "extras")
+
+    def __init__(self, x, iteracoes, motivo, historico, taxa_contracao, iteracoes_restantes, metodo, extras=None):
+        self.x = x
+        self.iteracoes = iteracoes
+        self.motivo = motivo
+        self.historico = historico
+        self.taxa_contracao = taxa_contracao
+        self.iteracoes_restantes = iteracoes_restantes
+        self.metodo = metodo
+        self.extras = extras or {}
+
+    @property
+    def convergiu(self):
+        """True se a tolerância foi atingida (ou se a solução veio do método direto)."""
+        return self.motivo in ("convergiu", "direto")
+
+    def __repr__(self):
+        if self.motivo == "direto":
+            return f"{self.metodo}: solução direta"
+        taxa = "?" if self.taxa_contracao is None else f"{self.taxa_contracao:.4f}"
+        texto = f"{self.metodo}: {self.motivo} após {self.iteracoes} iterações, taxa de contração = {taxa}"
+        if not self.convergiu:
+            texto += f", iterações restantes previstas = {self.iteracoes_restantes}"
+        return texto
+
+
+class MonitorConvergencia:
+    """
+    Acompanha a grandeza de parada de um método iterativo (variação entre iterações ou norma
+    do resíduo) e decide quando parar:
+    - "convergiu": o valor ficou abaixo de tol·escala;
+    - "divergiu": o valor deixou de ser finito ou passou de fator_divergencia vezes o menor já visto;
+    - "estagnou" (ou "divergiu", se a taxa for maior que 1): o menor valor não diminui há
+      `paciencia` iterações. Aumentos passageiros, como o transiente do SOR, não interrompem o método.
+
+    A taxa de contração assintótica é a média geométrica das razões entre valores consecutivos
+    nas últimas `janela` iterações, e dela sai a previsão de iterações até a tolerância.
+
+    Atributos:
+        limite (float): Valor abaixo do qual o método para.
+        max_iter (int): Número máximo de iterações.
+        historico (list of float): Valores registrados, um por iteração.
+    """
+
+    def __init__(self, tol, max_iter, escala=1.0, janela=10, paciencia=50, fator_divergencia=1e4):
+        self.limite = tol * escala
+        self.max_iter = max_iter
+        self.janela = janela
+        self.paciencia = paciencia
+        self.fator_divergencia = fator_divergencia
+        self.historico = []
+        self._menor = math.inf
+        self._desde_menor = 0
+
+    def registrar(self, valor):
+        """
+        Registra o valor da iteração atual.
+
+        Retorno:
+            motivo (str): "convergiu", "divergiu" ou "estagnou" se o método deve parar, senão None.
+        """
+        valor = float(valor)
+        self.historico.append(valor)
+        if valor < self.limite:
+            return "convergiu"
+        if not math.isfinite(valor) or valor > self.fator_divergencia * self._menor:
+            return "divergiu"
+
+        if valor < self._menor:
+            self._menor, self._desde_menor = valor, 0
+        else:
+            self._desde_menor += 1
+            if self._desde_menor >= self.paciencia:
+                taxa = self.taxa_contracao()
+                return "divergiu" if taxa is not None and taxa > 1 else "estagnou"
+        return None
+
+    def reiniciar_referencia(self):
+        """
+        Esquece o menor valor já visto (o histórico é mantido). Para quando o método muda de
+        parâmetros durante a execução (por exemplo, o omega do SOR) e começa um novo transiente,
+        em que o valor pode crescer por algumas iterações sem que isso seja divergência.
+        """
+        self._menor = math.inf
+        self._desde_menor = 0
+
+    def taxa_contracao(self):
+        """
+        Fator médio de redução por iteração nas últimas `janela` iterações (None se ainda não há dados).
+        """
+        if len(self.historico) <= self.janela:
+            return None
+        inicio, fim = self.historico[-1 - self.janela], self.historico[-1]
+        if not (inicio > 0 and fim > 0 and math.isfinite(inicio) and math.isfinite(fim)):
+            return None
+        return (fim / inicio) ** (1.0 / self.janela)
+
+    def iteracoes_restantes(self):
+        """
+        Previsão de iterações até a tolerância, supondo que a taxa de contração atual se mantenha.
+        """
+        if not self.historico:
+            return math.inf
+        valor = self.historico[-1]
+        if valor < self.limite:
+            return 0
+        taxa = self.taxa_contracao()
+        if taxa is None or taxa >= 1 or self.limite <= 0:
+            return math.inf
+        return math.ceil(math.log(self.limite / valor) / math.log(taxa))
+
+    def resultado(self, x, iteracoes, motivo, metodo, **extras):
+        """
+        Monta o ResultadoIterativo com o histórico, a taxa e a previsão atuais.
+        """
+        return ResultadoIterativo(x, iteracoes, motivo or "max_iter", self.historico, self.taxa_contracao(),
+                                  self.iteracoes_restantes(), metodo, extras)
+
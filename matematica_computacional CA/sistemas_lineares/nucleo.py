@@ -0,0 +1,282 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Núcleo compartilhado pelos métodos diretos (eliminação de Gauss e LU) com numpy:
+# cada etapa da eliminação zera a coluna inteira abaixo do pivô com um único produto
+# externo (atualização de posto 1), em vez de um laço em Python linha por linha,
+# e as substituições usam um produto escalar por linha.
+
+
+def pivotear(M, c, p=None):
+    """
+    Pivoteamento parcial na coluna c: troca a linha c com a de maior |M[l, c]|, l >= c
+    p: vetor de permutação, trocado junto (opcional)
+    retorna: índice da linha que era o pivô
+    """
+    max_row = np.argmax(np.abs(M[c:, c])) + c
+    if M[max_row, c] == 0:
+        raise ValueError("Matriz singular, pivô nulo na coluna {}".format(c))
+    if max_row != c:
+        M[[c, max_row]] = M[[max_row, c]]
+        if p is not None:
+            p[[c, max_row]] = p[[max_row, c]]
+    return max_row
+
+
+def eliminar_coluna(M, c, guardar_fatores=False):
+    """
+    Zera M[c+1:, c] de uma vez: M[c+1:, c+1:] -= fatores (x) M[c, c+1:]
+    M pode ser a matriz aumentada [A | b] (as colunas de b são atualizadas junto)
+    guardar_fatores: se True, os fatores ficam no lugar dos zeros (LU compactada)
+    retorna: vetor de fatores
+    """
+    fatores = M[c+1:, c] / M[c, c]
+    M[c+1:, c+1:] -= np.outer(fatores, M[c, c+1:])
+    M[c+1:, c] = fatores if guardar_fatores else 0.0
+    return fatores
+
+
+def fatorar_lu(LU, pivoteamento=True, largura=None, threads=None):
+    """
+    Fatora LU (float) no próprio lugar: PA = LU com L e U compactadas
+    largura: se for dada, usa a versão em blocos (fatorar_lu_blocos) com essa largura de painel
+    threads: se for dado, usa a versão em tarefas (fatorar_lu_tarefas) com esse número de threads
+    retorna: vetor de permutação p (Pb = b[p])
+    """
+    if threads is not None:
+        return fatorar_lu_tarefas(LU, largura or 64, threads, pivoteamento)
+    if largura is not None:
+        return fatorar_lu_blocos(LU, largura, pivoteamento)
+    n, _ = np.shape(LU)
+    p = np.arange(n)
+    for c in range(n):
+        if pivoteamento:
+            pivotear(LU, c, p)
+        eliminar_coluna(LU, c, guardar_fatores=True)
+    return p
+
+
+def fatorar_lu_blocos(LU, largura=64, pivoteamento=True):
+    """
+    LU em blocos ("right-looking"): a cada passo fatora um painel de `largura` colunas
+    e atualiza todo o resto da matriz com um único produto de matrizes
+        painel:   LU[k:, k:e] fatorado coluna a coluna, com pivoteamento parcial
+        U12:      L11 U12 = A12 (substituição para frente com L11, diagonal 1)
+        restante: A22 -= L21 @ U12
+    O pivô de cada coluna é escolhido com a mesma regra da fatorar_lu (primeiro maior
+    |valor| da coluna já atualizada), então o vetor de permutação é o mesmo; só pode
+    diferir se dois candidatos a pivô empatarem até o erro de arredondamento
+    retorna: vetor de permutação p (Pb = b[p])
+    """
+    n, _ = np.shape(LU)
+    p = np.arange(n)
+    for k in range(0, n, largura):
+        e = min(k + largura, n)
+
+        # Fatora o painel; as trocas de linha levam a linha inteira (L à esquerda e A à direita)
+        for c in range(k, e):
+            if pivoteamento:
+                pivotear(LU, c, p)
+            fatores = LU[c+1:, c] / LU[c, c]
+            LU[c+1:, c+1:e] -= np.outer(fatores, LU[c, c+1:e])
+            LU[c+1:, c] = fatores
+
+        if e < n:
+            # U12 = L11^-1 A12, linha a linha (L11 tem diagonal 1)
+            for i in range(k + 1, e):
+                LU[i, e:] -= LU[i, k:i] @ LU[k:i, e:]
+            # Atualização do restante com um produto de matrizes
+            LU[e:, e:] -= LU[e:, k:e] @ LU[k:e, e:]
+    return p
+
+
+def substituicao_para_tras(U, y):
+    """
+    Resolve Ux = y (U triangular superior), y pode ser vetor ou matriz n x k
+    Só a parte de cima de U é usada, então serve para a LU compactada
+    """
+    n, _ = np.shape(U)
+    x = np.array(y, dtype=float)
+    for i in range(n-1, -1, -1):
+        x[i] = (x[i] - U[i, i+1:] @ x[i+1:]) / U[i, i]
+    return x
+
+
+def substituicao_para_frente(L, y, diagonal_unitaria=False):
+    """
+    Resolve Lx = y (L triangular inferior), y pode ser vetor ou matriz n x k
+    diagonal_unitaria: L tem 1 na diagonal (não é lida), como na LU compactada
+    """
+    n, _ = np.shape(L)
+    x = np.array(y, dtype=float)
+    for i in range(n):
+        x[i] -= L[i, :i] @ x[:i]
+        if not diagonal_unitaria:
+            x[i] /= L[i, i]
+    return x
+
+
+def fatorar_lu_tarefas(LU, largura=64, threads=None, pivoteamento=True):
+    """
+    LU em blocos em que a atualização do restante da matriz roda em várias threads
+    (o numpy solta o GIL nos produtos de matrizes, então as tarefas rodam de verdade em paralelo)
+
+    A matriz é dividida em blocos de `largura` colunas. No passo k:
+        painel P(k): fatora as colunas do bloco k (na thread principal), trocando linhas só dentro dele
+        tarefa T(k, J), para cada bloco J à direita: aplica as trocas do painel k no bloco J,
+            calcula U12 = inv(L11) @ A12 e atualiza o bloco J com A22 -= L21 @ U12
+    inv(L11) (b x b, diagonal 1) é calculada uma vez por painel na thread principal, então
+    cada tarefa só faz produtos de matrizes, em vez de uma substituição linha a linha
+    Dependências por bloco: T(k, J) precisa de P(k) e de T(k-1, J); P(k+1) precisa só de
+    T(k, k+1). Assim o próximo painel já começa enquanto os outros blocos ainda estão sendo
+    atualizados ("lookahead"). As trocas nas colunas de L à esquerda são feitas no final.
+    A escolha de pivôs é a mesma da fatorar_lu, então o vetor de permutação também é
+    threads: número de threads (padrão: número de núcleos)
+    retorna: vetor de permutação p (Pb = b[p])
+    """
+    n, _ = np.shape(LU)
+    p = np.arange(n)
+    inicios = list(range(0, n, largura))
+    blocos = [slice(k, min(k + largura, n)) for k in inicios]
+    trocas = []  # trocas (c, linha do pivô) de cada painel, na ordem
+    inversas = []  # inv(L11) de cada painel
+
+    def fatorar_painel(b):
+        k, e = blocos[b].start, blocos[b].stop
+        trocas_painel = []
+        for c in range(k, e):
+            if pivoteamento:
+                max_row = np.argmax(np.abs(LU[c:, c])) + c
+                if LU[max_row, c] == 0:
+                    raise ValueError("Matriz singular, pivô nulo na coluna {}".format(c))
+                if max_row != c:
+                    LU[[c, max_row], k:e] = LU[[max_row, c], k:e]
+                    p[[c, max_row]] = p[[max_row, c]]
+                    trocas_painel.append((c, max_row))
+            fatores = LU[c+1:, c] / LU[c, c]
+            LU[c+1:, c+1:e] -= np.outer(fatores, LU[c, c+1:e])
+            LU[c+1:, c] = fatores
+        return trocas_painel
+
+    def atualizar_bloco(b, J, anterior):
+        if anterior is not None:
+            anterior.result()  # T(k-1, J) já começou antes desta (fila FIFO), não trava
+        k, e = blocos[b].start, blocos[b].stop
+        colunas = blocos[J]
+        for c, r in trocas[b]:
+            LU[[c, r], colunas] = LU[[r, c], colunas]
+        U12 = inversas[b] @ LU[k:e, colunas]
+        LU[k:e, colunas] = U12
+        LU[e:, colunas] -= LU[e:, k:e] @ U12
+
+    with ThreadPoolExecutor(max_workers=threads or os.cpu_count()) as executor:
+        tarefas = [None] * len(blocos)  # última tarefa submetida para cada bloco de colunas
+        for b in range(len(blocos)):
+            if tarefas[b] is not None:
+                tarefas[b].result()  # o bloco do painel precisa estar atualizado até o passo anterior
+            trocas.append(fatorar_painel(b))
+            k, e = blocos[b].start, blocos[b].stop
+            inversas.append(substituicao_para_frente(LU[k:e, k:e], np.eye(e - k), diagonal_unitaria=True))
+            # O bloco logo à direita vai primeiro na fila, pois o próximo painel depende dele
+            for J in range(b + 1, len(blocos)):
+                tarefas[J] = executor.submit(atualizar_bloco, b, J, tarefas[J])
+        for tarefa in tarefas:
+            if tarefa is not None:
+                tarefa.result()
+
+    # Trocas de cada painel nas colunas de L que ficaram à esquerda dele
+    for b, trocas_painel in enumerate(trocas):
+        k = blocos[b].start
+        for c, r in trocas_painel:
+            LU[[c, r], :k] = LU[[r, c], :k]
+    return p
+
+
+def medir_vazao(tamanhos=(100, 200, 400, 800, 1600), repeticoes=3):
+    """
+    Mede a vazão da fatoração LU do núcleo para cada n (melhor de algumas repetições)
+    LU faz ~2n³/3 operações de ponto flutuante
+    retorna: lista de (n, tempo em s, GFLOP/s)
+    """
+    rng = np.random.default_rng(0)
+    resultados = []
+    for n in tamanhos:
+        A = rng.random((n, n))
+        tempo = np.inf
+        for _ in range(repeticoes):
+            LU = A.copy()
+            inicio = time.perf_counter()
+            fatorar_lu(LU)
+            tempo = min(tempo, time.perf_counter() - inicio)
+        resultados.append((n, tempo, 2 * n**3 / 3 / tempo / 1e9))
+    return resultados
+
+
+def medir_cruzamento(tamanhos=(50, 100, 200, 400, 800, 1600), largura=64, repeticoes=3):
+    """
+    Compara a LU coluna a coluna com a LU em blocos para cada n
+    retorna: lista de (n, tempo sem blocos, tempo com blocos, mesmas permutações?)
+    """
+    rng = np.random.default_rng(0)
+    resultados = []
+    for n in tamanhos:
+        A = rng.random((n, n))
+        tempos = []
+        permutacoes = []
+        for bloco in (None, largura):
+            tempo = np.inf
+            for _ in range(repeticoes):
+                LU = A.copy()
+                inicio = time.perf_counter()
+                p = fatorar_lu(LU, largura=bloco)
+                tempo = min(tempo, time.perf_counter() - inicio)
+            tempos.append(tempo)
+            permutacoes.append(p)
+        resultados.append((n, tempos[0], tempos[1], np.array_equal(*permutacoes)))
+    return resultados
+
+
+def medir_escalonamento(n=2000, largura=128, threads=None, repeticoes=2):
+    """
+    Tempo da LU em tarefas para 1, 2, 4, ... threads até o número de núcleos
+    (para medir só o paralelismo das tarefas, rode com OPENBLAS_NUM_THREADS=1, senão
+    cada produto de matrizes também usa várias threads por conta própria)
+    retorna: lista de (threads, tempo em s, aceleração em relação a 1 thread)
+    """
+    threads = threads or sorted({2**i for i in range(os.cpu_count().bit_length())} | {os.cpu_count()})
+    A = np.random.default_rng(0).random((n, n))
+    resultados = []
+    for t in threads:
+        tempo = np.inf
+        for _ in range(repeticoes):
+            LU = A.copy()
+            inicio = time.perf_counter()
+            fatorar_lu_tarefas(LU, largura, t)
+            tempo = min(tempo, time.perf_counter() - inicio)
+        resultados.append((t, tempo, resultados[0][1] / tempo if resultados else 1.0))
+    return resultados
+
+
+if __name__ == "__main__":
+    print(f"{'n':>6} {'tempo (s)':>12} {'GFLOP/s':>10}")
+    for n, tempo, gflops in medir_vazao():
+        print(f"{n:>6} {tempo:>12.4f} {gflops:>10.3f}")
+
+    largura = 64
+    print(f"\nLU sem blocos x em blocos (painel de {largura} colunas)")
+    print(f"{'n':>6} {'sem blocos':>12} {'em blocos':>12} {'ganho':>8} {'mesmo p':>8}")
+    cruzamento = None
+    for n, t_simples, t_blocos, mesmo_p in medir_cruzamento(largura=largura):
+        print(f"{n:>6} {t_simples:>12.4f} {t_blocos:>12.4f} {t_simples / t_blocos:>8.2f} {str(mesmo_p):>8}")
+        if cruzamento is None and t_blocos < t_simples:
+            cruzamento = n
+    print(f"A versão em blocos passa a ganhar a partir de n = {cruzamento}")
+
+    n = 2000
+    print(f"\nLU em tarefas, n = {n} ({os.cpu_count()} núcleos)")
+    print(f"{'threads':>8} {'tempo (s)':>12} {'aceleração':>11}")
+    for t, tempo, aceleracao in medir_escalonamento(n):
+        print(f"{t:>8} {tempo:>12.4f} {aceleracao:>11.2f}")
@@ -0,0 +1,44 @@
+class Intervalo:
+    """
+    Intervalo [a, b] que guarda f(a) e f(b) junto com os extremos,
+    para que cada ponto seja avaliado uma única vez.
+    f: função
+    a, b: extremos do intervalo
+    nfev: quantidade de avaliações de f feitas até agora
+    """
+    __slots__ = ("f", "a", "b", "fa", "fb", "nfev")
+
+    def __init__(self, f, a, b):
+        self.f = f
+        self.nfev = 0
+        self.a = a
+        self.b = b
+        self.fa = self.avaliar(a)
+        self.fb = self.avaliar(b)
+        # Um extremo que já é raiz reduz o intervalo a ele
+        if self.fa == 0:
+            self.atualizar(a, self.fa)
+        elif self.fb == 0:
+            self.atualizar(b, self.fb)
+
+    def avaliar(self, x):
+        # Toda avaliação de f passa por aqui para ser contada
+        self.nfev += 1
+        return self.f(x)
+
+    def troca_sinal(self):
+        return self.fa * self.fb < 0
+
+    def largura(self):
+        return abs(self.b - self.a)
+
+    def atualizar(self, c, fc):
+        # f(c) = 0: c é a raiz e o intervalo se reduz a ele (largura zero, os métodos param)
+        if fc == 0:
+            self.a = self.b = c
+            self.fa = self.fb = fc
+        # Mantém a troca de sinal: substitui o extremo que tem o mesmo sinal de f(c)
+        elif self.fa * fc < 0:
+            self.b, self.fb = c, fc
+        else:
+            self.a, self.fa = c, fc
@@ -1,24 +1,27 @@
 import math
 
+from intervalo import Intervalo
+
 def bisseccao(f, a, b, erro):
     """
     f: função
     a, b: intervalo para procurar uma raiz 
+    retorna: (raiz, nfev), nfev é o número de avaliações de f
     """
     i = 0
-    ai = a
-    bi = b
+    intervalo = Intervalo(f, a, b)
+    if not intervalo.troca_sinal() and intervalo.largura() > 0:
+        raise ValueError("f(a) e f(b) devem ter sinais opostos")
 
-    while abs(bi-ai) > erro:
+    while intervalo.largura() > erro:
+        ai, bi = intervalo.a, intervalo.b
         c = (ai+bi) / 2
         print(f"a{i}: {ai}, b{i}: {bi}, c: {c}")
-        if f(ai) * f(c) < 0:
-            bi = c
-        else:
-            ai = c
+        # f(a) já está guardado no intervalo, só f(c) é calculado
+        intervalo.atualizar(c, intervalo.avaliar(c))
         i += 1
     
-    return (ai+bi)/2
+    return (intervalo.a+intervalo.b)/2, intervalo.nfev
 
 # bisseccao(lambda x: x**3 - 9*x + 3, -4, -2, 1e-9)
 # bisseccao(lambda x: x ** (0.5) - 5*math.exp(-x), 1, 2, 1e-9)
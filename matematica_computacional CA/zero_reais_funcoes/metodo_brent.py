@@ -0,0 +1,80 @@
+import math
+import sys
+
+from intervalo import Intervalo
+
+
+def brent(f, a, b, erro):
+    """
+    f: função
+    a, b: intervalo para procurar uma raiz (f(a) e f(b) com sinais opostos)
+    erro: tolerância, com erro = 0 o método vai até a precisão da máquina
+    retorna: (raiz, nfev), nfev é o número de avaliações de f
+
+    Combina interpolação inversa quadrática, secante e bissecção:
+    o passo interpolado só é aceito se cair dentro do intervalo e reduzir
+    o passo o suficiente, senão faz um passo de bissecção.
+    """
+    intervalo = Intervalo(f, a, b)
+    if not intervalo.troca_sinal() and intervalo.largura() > 0:
+        raise ValueError("f(a) e f(b) devem ter sinais opostos")
+
+    eps = sys.float_info.epsilon
+    # Se um extremo já é raiz, o intervalo foi reduzido a ele
+    a, b, fa, fb = intervalo.a, intervalo.b, intervalo.fa, intervalo.fb
+    # c é o extremo oposto a b (f(b) e f(c) têm sinais opostos)
+    c, fc = a, fa
+    d = e = b - a
+    i = 0
+
+    while True:
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        # b é sempre a melhor aproximação
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2 * eps * abs(b) + 0.5 * erro
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or fb == 0:
+            return b, intervalo.nfev
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Só dois pontos distintos: secante
+                metodo = "secante"
+                p = 2 * m * s
+                q = 1 - s
+            else:
+                # Três pontos distintos: interpolação inversa quadrática
+                metodo = "interpolação inversa quadrática"
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                metodo = "bissecção"
+                d = e = m
+        else:
+            metodo = "bissecção"
+            d = e = m
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, m)
+        fb = intervalo.avaliar(b)
+        print(f"iteração {i}, {metodo}, b: {b}, f(b): {fb}, c: {c}")
+        i += 1
+
+# brent(lambda x: x**3 - 9*x + 3, -4, -2, 1e-9)
+# brent(lambda x: x ** (0.5) - 5*math.exp(-x), 1, 2, 1e-9)
+# Com erro = 0 chega à precisão da máquina com 7 avaliações (a bissecção precisa de ~50)
+brent(lambda x: x*math.log10(x) - 1, 2, 3, 0)
@@ -1,29 +1,80 @@
 import math
 
+ACELERACOES = (None, "aitken", "steffensen")
 
-def ponto_fixo(g, x0, erro):
+
+def aitken(x0, x1, x2):
+    """
+    extrapolação delta² de Aitken de três iterados seguidos
+    """
+    denominador = x2 - 2*x1 + x0
+    if denominador == 0:
+        return x2
+    return x0 - (x1 - x0)**2 / denominador
+
+
+def ponto_fixo(g, x0, erro, max_iter=1000, accelerate=None, janela=5):
     """
     g: função com o x isolado
-    a, b: intervalo para procurar uma raiz 
+    x0: chute inicial
+    accelerate: None (iteração simples), "aitken" ou "steffensen"
+    janela: iterações seguidas com |g'| estimado > 1 para desistir
+    retorna: (raiz, nfev), nfev é o número de avaliações de g; se divergir ou não convergir
+    em max_iter iterações, avisa e retorna o último x no lugar da raiz
     """
+    if accelerate not in ACELERACOES:
+        raise ValueError(f"Aceleração desconhecida: {accelerate}. Use uma de {ACELERACOES}.")
     i = 0
     x = x0
-    while True:
-        x_novo = g(x)
-        print(f"iteração {i}, x: {x}, g(x): {x_novo}")
+    nfev = 0
+    passo_anterior = None
+    acima = 0
+    ultimos = [x0]  # iterados da sequência simples, para o Aitken
+    x_aitken = None
+    while i < max_iter:
+        if accelerate == "steffensen":
+            # passo de Steffensen: aitken em cima de x, g(x), g(g(x)), convergência quadrática
+            x1 = g(x)
+            x2 = g(x1)
+            nfev += 2
+            x_novo = aitken(x, x1, x2)
+        else:
+            x_novo = g(x)
+            nfev += 1
+        passo = abs(x_novo - x)
+        # razão entre passos seguidos estima o fator de contração |g'(x)|
+        fator = passo / passo_anterior if passo_anterior else None
+        passo_anterior = passo
+        print(f"iteração {i}, x: {x}, g(x): {x_novo}, fator: {fator}")
+
+        if accelerate == "aitken":
+            ultimos = (ultimos + [x_novo])[-3:]
+            if len(ultimos) == 3:
+                x_anterior, x_aitken = x_aitken, aitken(*ultimos)
+                print(f"aitken: {x_aitken}")
+                if x_anterior is not None and abs(x_aitken - x_anterior) < erro:
+                    return x_aitken, nfev
+        elif passo < erro:
+            return x_novo, nfev
 
-        if abs(x_novo - x) < erro:
-            return x_novo
+        acima = acima + 1 if fator is not None and fator > 1 else 0
+        if acima >= janela:
+            print(f"divergindo, fator de contração estimado {fator} > 1, desistindo depois de {nfev} avaliações")
+            return x, nfev
         x = x_novo
         i += 1
+    print(f"não convergiu em {max_iter} iterações")
+    return x, nfev
 
 # f(x) = x**3 - 9*x + 3, g(x) = (9*x - 3) ** (1/3)
 # ponto_fixo(lambda x: (9*x - 3) ** (1/3), 2, 1e-9) # deu certo
 
 # f(x) = x ** (0.5) - 5*math.exp(-x), g(x) = (5*math.exp(-x))**2
-# ponto_fixo(lambda x: (5*math.exp(-x))**2, 1.5, 1e-9) # looping
+# ponto_fixo(lambda x: (5*math.exp(-x))**2, 1.5, 1e-9) # looping, agora para sozinho pelo fator de contração
+# ponto_fixo(lambda x: (5*math.exp(-x))**2, 1.5, 1e-9, accelerate="steffensen") # deu certo
 
 # f(x) = x*math.log10(x) - 1, g(x) = 1 / math.log10(x)
-# ponto_fixo(lambda x: 10 ** (1/x), 2, 1e-9) # deu certo
+# ponto_fixo(lambda x: 10 ** (1/x), 2, 1e-9) # deu certo, mas devagar
+# ponto_fixo(lambda x: 10 ** (1/x), 2, 1e-9, accelerate="steffensen") # bem mais rápido
 
 ponto_fixo(lambda x: x - 1.3*(x * math.log10(x) - 1), 2.5, 1e-9) # deu certo
\ No newline at end of file
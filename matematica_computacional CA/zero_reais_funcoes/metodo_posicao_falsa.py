@@ -1,29 +1,34 @@
 import math
 
+from intervalo import Intervalo
+
 
 def posicao_falsa(f, a, b, erro):
     """
     f: função
     a, b: intervalo para procurar uma raiz 
+    retorna: (raiz, nfev), nfev é o número de avaliações de f
     """
     i = 0
+    intervalo = Intervalo(f, a, b)
+    if not intervalo.troca_sinal() and intervalo.largura() > 0:
+        raise ValueError("f(a) e f(b) devem ter sinais opostos")
 
-    while abs(b-a) > erro:
-        x = (a * f(b) - b * f(a)) / (f(b) - f(a))
+    while intervalo.largura() > erro:
+        a, b, fa, fb = intervalo.a, intervalo.b, intervalo.fa, intervalo.fb
+        x = (a * fb - b * fa) / (fb - fa)
+        fx = intervalo.avaliar(x)
 
         print(f"a{i}: {a}, b{i}: {b}, x: {x}")
 
-        if abs(f(x)) < erro:
-            return x
+        if abs(fx) < erro:
+            return x, intervalo.nfev
 
-        if f(a) * f(x) > 0:
-            a = x
-        else:
-            b = x
+        intervalo.atualizar(x, fx)
         i += 1
 
-    return (a+b)/2
+    return (intervalo.a+intervalo.b)/2, intervalo.nfev
 
 # posicao_falsa(lambda x: x**3 - 9*x + 3, -4, -2, 1e-9)
 # posicao_falsa(lambda x: x ** (0.5) - 5*math.exp(-x), 1, 2, 1e-9)
-posicao_falsa(lambda x: x*math.log10(x) - 1, 2, 3, 1e-9)
\ No newline at end of file
+posicao_falsa(lambda x: x*math.log10(x) - 1, 2, 3, 1e-9)
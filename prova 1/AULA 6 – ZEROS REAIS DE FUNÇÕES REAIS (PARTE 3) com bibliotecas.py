@@ -36,6 +36,63 @@ def fixed_point_iteration(phi, x0, tol=1e-6, max_iter=100):
         x0 = x1
     raise ValueError("Método não convergiu em {} iterações.".format(max_iter))
 
+class RootResult:
+    """Resultado comum dos métodos de ordem mais alta: raiz, iterações, avaliações e ordem estimada."""
+
+    __slots__ = ("root", "iterations", "evaluations", "order", "converged", "method")
+
+    def __init__(self, root, iterations, evaluations, order, converged, method):
+        self.root = root
+        self.iterations = iterations
+        self.evaluations = evaluations
+        self.order = order
+        self.converged = converged
+        self.method = method
+
+    def __repr__(self):
+        order = "?" if self.order is None else f"{self.order:.2f}"
+        return (f"{self.method}: raiz = {self.root}, iterações = {self.iterations}, "
+                f"avaliações = {self.evaluations}, ordem = {order}")
+
+def estimate_order(steps, x=1.0):
+    """Estima a ordem de convergência pelos três últimos passos, ignorando passos no nível do arredondamento."""
+    floor = 1e3 * np.finfo(float).eps * max(1.0, abs(x))
+    d = [s for s in steps if s > floor]
+    if len(d) < 3 or d[-2] == d[-3]:
+        return None
+    return math.log(d[-1] / d[-2]) / math.log(d[-2] / d[-3])
+
+def householder_method(f, derivs, x0, tol=1e-6, max_iter=100):
+    """Método de Householder de ordem d = len(derivs) (d = 1: Newton, d = 2: Halley), com ordem d + 1.
+
+    derivs é a lista [f', f'', ..., f^(d)]. O passo é g[d-1] / g[d], onde g são os
+    coeficientes de Taylor de 1/f, obtidos dos coeficientes c[k] = f^(k)(x) / k!.
+    """
+    d = len(derivs)
+    method = {1: "Newton-Raphson", 2: "Halley"}.get(d, f"Householder (ordem {d})")
+    steps = []
+    evaluations = 0
+    for i in range(max_iter):
+        c = [f(x0)] + [derivs[k - 1](x0) / math.factorial(k) for k in range(1, d + 1)]
+        evaluations += d + 1
+        if c[0] == 0:
+            return RootResult(x0, i, evaluations, estimate_order(steps, x0), True, method)
+        g = [1 / c[0]]
+        for k in range(1, d + 1):
+            g.append(-sum(c[j] * g[k - j] for j in range(1, k + 1)) / c[0])
+        if abs(g[d]) < 1e-300:  # Verificar divisão por zero
+            raise ValueError("Derivada próxima de zero, método pode não convergir.")
+        x1 = x0 + g[d - 1] / g[d]
+        steps.append(abs(x1 - x0))
+        if steps[-1] < tol:
+            return RootResult(x1, i + 1, evaluations, estimate_order(steps, x1), True, method)
+        x0 = x1
+    raise ValueError("Método não convergiu em {} iterações.".format(max_iter))
+
+def halley_method(f, df, d2f, x0, tol=1e-6, max_iter=100):
+    """Método de Halley (convergência cúbica) para encontrar raízes de funções."""
+    return householder_method(f, [df, d2f], x0, tol, max_iter)
+
 # Funções para teste
 functions = [
     lambda x: x**6 - x - 1,  # Polinômio de grau > 5
@@ -53,6 +110,22 @@ derivatives = [
     lambda x: 2 * x
 ]
 
+second_derivatives = [
+    lambda x: 30 * x**4,
+    lambda x: -1 / x**2,
+    lambda x: np.exp(x),
+    lambda x: -np.sin(x),
+    lambda x: 2
+]
+
+third_derivatives = [
+    lambda x: 120 * x**3,
+    lambda x: 2 / x**3,
+    lambda x: np.exp(x),
+    lambda x: -np.cos(x),
+    lambda x: 0
+]
+
 intervals = [(1, 2), (1, 4), (0, 2), (0, np.pi), (1, 2)]
 
 # Teste dos métodos
@@ -95,3 +168,15 @@ def print_table(results):
         )
 
 print_table(results)
+
+# Comparação de Newton-Raphson com os métodos de ordem mais alta (tolerância apertada)
+print("\nNewton-Raphson x Halley x Householder (ordem 3):\n")
+for i, (f, df, d2f, d3f, interval) in enumerate(
+        zip(functions, derivatives, second_derivatives, third_derivatives, intervals)):
+    x0 = interval[1]
+    print(f"Função {i + 1}:")
+    for derivs in ([df], [df, d2f], [df, d2f, d3f]):
+        try:
+            print(f"  {householder_method(f, derivs, x0, tol=1e-14)}")
+        except ValueError as e:
+            print(f"  {e}")
@@ -25,11 +25,10 @@ def gaussian_elimination(A, b):
             A[[k, max_row]] = A[[max_row, k]]
             b[[k, max_row]] = b[[max_row, k]]
 
-        # Elimination
-        for i in range(k + 1, n):
-            m = A[i, k] / A[k, k]
-            A[i, k:] -= m * A[k, k:]
-            b[i] -= m * b[k]
+        # Elimination: all rows below the pivot at once (rank-1 outer-product update)
+        m = A[k + 1:, k] / A[k, k]
+        A[k + 1:, k:] -= np.outer(m, A[k, k:])
+        b[k + 1:] -= m * b[k]
 
     # Back substitution
     x = np.zeros(n)
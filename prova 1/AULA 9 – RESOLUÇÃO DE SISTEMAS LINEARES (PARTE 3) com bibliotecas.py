@@ -3,19 +3,30 @@ import numpy as np
 import matplotlib.pyplot as plt
 import time
 
+from analise_convergencia import analisar_convergencia, resolver_direto
+from matriz_esparsa import MatrizCSR, gauss_seidel_csr, gerar_sistema_esparso
+from metodos_iterativos import (bicgstab, coloracao, gauss_seidel_multicor, gmres, gradientes_conjugados,
+                                jacobi, sor)
+from monitor_convergencia import MonitorConvergencia
+
 # Funções auxiliares para geração de sistemas lineares aleatórios
-def gerar_sistema_linear(n, densidade=1.0):
+def gerar_sistema_linear(n, densidade=1.0, formato="densa", simetrica=False):
     """
     Gera um sistema linear Ax = b, onde A é uma matriz aleatória.
 
     Parâmetros:
         n (int): Dimensão do sistema.
         densidade (float): Proporção de elementos não nulos na matriz A (0 a 1).
+        formato (str): "densa" (ndarray) ou "csr" (MatrizCSR, gerada sem passar pela densa).
+        simetrica (bool): Gera A simétrica positiva definida (necessário para o CG).
 
     Retorno:
-        A (ndarray): Matriz A.
+        A (ndarray ou MatrizCSR): Matriz A.
         b (ndarray): Vetor b.
     """
+    if formato == "csr":
+        return gerar_sistema_esparso(n, densidade, simetrica=simetrica)
+
     A = np.random.rand(n, n)
     b = np.random.rand(n)
     
@@ -23,6 +34,9 @@ def gerar_sistema_linear(n, densidade=1.0):
         mascara = np.random.rand(n, n) < densidade
         A *= mascara
 
+    if simetrica:
+        A = (A + A.T) / 2
+
     # Garantir que a matriz A seja estritamente diagonal dominante
     for i in range(n):
         A[i, i] += np.sum(np.abs(A[i]))
@@ -30,63 +44,85 @@ def gerar_sistema_linear(n, densidade=1.0):
     return A, b
 
 # Implementação do método de Gauss-Jacobi
-def gauss_jacobi(A, b, x0, tol=1e-5, max_iter=1000):
+def gauss_jacobi(A, b, x0, tol=1e-5, max_iter=1000, verificar=False):
     """
     Resolve o sistema linear usando o método de Gauss-Jacobi.
 
+    A dominância diagonal forçada por gerar_sistema_linear não vale para dados quaisquer: com
+    verificar=True a matriz é analisada antes (dominância por linhas e colunas e raio espectral
+    estimado) e, se a iteração não puder convergir, o sistema é resolvido por LU.
+
     Parâmetros:
-        A (ndarray): Matriz do sistema.
+        A (ndarray ou MatrizCSR): Matriz do sistema (em CSR cada iteração custa O(nnz)).
         b (ndarray): Vetor do lado direito.
         x0 (ndarray): Aproximação inicial.
         tol (float): Tolerância para o critério de parada.
         max_iter (int): Número máximo de iterações.
+        verificar (bool): Faz a análise prévia de convergência (custa cerca de 10 iterações).
 
     Retorno:
-        x (ndarray): Solução aproximada.
-        iteracoes (int): Número de iterações realizadas.
+        resultado (ResultadoIterativo): Solução (resultado.x), iterações, motivo da parada
+                                        ("convergiu", "divergiu", "estagnou", "max_iter" ou "direto"),
+                                        taxa de contração e previsão de iterações restantes.
     """
-    n = len(b)
-    x = x0.copy()
-    for k in range(max_iter):
-        x_new = np.zeros_like(x)
-        for i in range(n):
-            x_new[i] = (b[i] - np.dot(A[i, :i], x[:i]) - np.dot(A[i, i+1:], x[i+1:])) / A[i, i]
-        
-        if np.linalg.norm(x_new - x, ord=np.inf) < tol:
-            return x_new, k + 1
-        x = x_new
-    return x, max_iter
+    if verificar:
+        diagnostico = analisar_convergencia(A, "jacobi")
+        if not diagnostico.convergente:
+            return resolver_direto(A, b, diagnostico)
+
+    # D⁻¹ e A - D são montados uma vez; cada iteração é um único produto matriz-vetor
+    return jacobi(A, b, x0, tol, max_iter)
 
 # Implementação do método de Gauss-Seidel
-def gauss_seidel(A, b, x0, tol=1e-5, max_iter=1000):
+def gauss_seidel(A, b, x0, tol=1e-5, max_iter=1000, ordenacao="natural", verificar=False):
     """
     Resolve o sistema linear usando o método de Gauss-Seidel.
 
+    Com verificar=True a matriz é analisada antes (dominância, critério de Sassenfeld e raio
+    espectral estimado) e, se a iteração não puder convergir, o sistema é resolvido por LU.
+
     Parâmetros:
-        A (ndarray): Matriz do sistema.
+        A (ndarray ou MatrizCSR): Matriz do sistema (em CSR cada iteração custa O(nnz)).
         b (ndarray): Vetor do lado direito.
         x0 (ndarray): Aproximação inicial.
         tol (float): Tolerância para o critério de parada.
         max_iter (int): Número máximo de iterações.
+        ordenacao (str): "natural" (linha por linha) ou "multicor" (cada cor de linhas
+                         independentes é atualizada de uma vez, de forma vetorizada).
+        verificar (bool): Faz a análise prévia de convergência (custa cerca de 10 iterações).
 
     Retorno:
-        x (ndarray): Solução aproximada.
-        iteracoes (int): Número de iterações realizadas.
+        resultado (ResultadoIterativo): Solução (resultado.x), iterações, motivo da parada
+                                        ("convergiu", "divergiu", "estagnou", "max_iter" ou "direto"),
+                                        taxa de contração e previsão de iterações restantes.
     """
+    if verificar:
+        diagnostico = analisar_convergencia(A, "seidel", ordenacao)
+        if not diagnostico.convergente:
+            return resolver_direto(A, b, diagnostico)
+
+    if ordenacao == "multicor":
+        return gauss_seidel_multicor(A, b, x0, tol, max_iter)
+    if isinstance(A, MatrizCSR):
+        return gauss_seidel_csr(A, b, x0, tol, max_iter)
+
     n = len(b)
     x = x0.copy()
+    monitor = MonitorConvergencia(tol, max_iter)
     for k in range(max_iter):
         x_old = x.copy()
         for i in range(n):
             x[i] = (b[i] - np.dot(A[i, :i], x[:i]) - np.dot(A[i, i+1:], x[i+1:])) / A[i, i]
         
-        if np.linalg.norm(x - x_old, ord=np.inf) < tol:
-            return x, k + 1
-    return x, max_iter
+        # Para ao convergir, mas também ao detectar divergência ou estagnação
+        motivo = monitor.registrar(np.linalg.norm(x - x_old, ord=np.inf))
+        if motivo:
+            return monitor.resultado(x, k + 1, motivo, "Gauss-Seidel")
+    return monitor.resultado(x, max_iter, None, "Gauss-Seidel")
 
 # Função para comparar os métodos
 
-def comparar_metodos(n_list, densidade, tol=1e-5):
+def comparar_metodos(n_list, densidade, tol=1e-5, formato="densa", simetrica=False):
     """
     Compara os métodos de solução de sistemas lineares.
 
@@ -94,36 +130,43 @@ def comparar_metodos(n_list, densidade, tol=1e-5):
         n_list (list): Lista de tamanhos do sistema.
         densidade (float): Proporção de elementos não nulos na matriz A (0 a 1).
         tol (float): Tolerância para o critério de parada.
+        formato (str): "densa" ou "csr" (esparso, permite n bem maiores).
+        simetrica (bool): Usa sistemas simétricos positivos definidos e inclui o CG
+                          e o PCG (pré-condicionadores Jacobi, SSOR e Cholesky incompleto).
 
     """
-    tempo_jacobi = []
-    tempo_seidel = []
-    iteracoes_jacobi = []
-    iteracoes_seidel = []
+    metodos = {
+        'Gauss-Jacobi': (gauss_jacobi, 'o'),
+        'Gauss-Seidel': (gauss_seidel, 's'),
+    }
+    if simetrica:
+        # O tempo do PCG inclui a construção do pré-condicionador
+        for nome, precondicionador, marcador in [('CG', None, '^'), ('PCG Jacobi', 'jacobi', 'v'),
+                                                 ('PCG SSOR', 'ssor', 'D'), ('PCG IC(0)', 'ic', 'x')]:
+            metodo = (lambda A, b, x0, tol, precondicionador=precondicionador:
+                      gradientes_conjugados(A, b, x0, tol, precondicionador=precondicionador))
+            metodos[nome] = (metodo, marcador)
+    tempos = {nome: [] for nome in metodos}
+    iteracoes = {nome: [] for nome in metodos}
 
     for n in n_list:
-        A, b = gerar_sistema_linear(n, densidade)
+        A, b = gerar_sistema_linear(n, densidade, formato, simetrica)
         x0 = np.zeros(n)
 
-        # Tempo e iterações para Gauss-Jacobi
-        start = time.time()
-        _, it_j = gauss_jacobi(A, b, x0, tol)
-        tempo_jacobi.append(time.time() - start)
-        iteracoes_jacobi.append(it_j)
-
-        # Tempo e iterações para Gauss-Seidel
-        start = time.time()
-        _, it_s = gauss_seidel(A, b, x0, tol)
-        tempo_seidel.append(time.time() - start)
-        iteracoes_seidel.append(it_s)
+        # Tempo e iterações de cada método
+        for nome, (metodo, _) in metodos.items():
+            start = time.time()
+            resultado = metodo(A, b, x0, tol)
+            tempos[nome].append(time.time() - start)
+            iteracoes[nome].append(resultado.iteracoes)
 
     # Plotar os gráficos
     plt.figure(figsize=(12, 6))
 
     # Gráfico de tempo de execução
     plt.subplot(1, 2, 1)
-    plt.plot(n_list, tempo_jacobi, label='Gauss-Jacobi', marker='o')
-    plt.plot(n_list, tempo_seidel, label='Gauss-Seidel', marker='s')
+    for nome, (_, marcador) in metodos.items():
+        plt.plot(n_list, tempos[nome], label=nome, marker=marcador)
     plt.xlabel('Tamanho do sistema (n)')
     plt.ylabel('Tempo de execução (s)')
     plt.title('Tempo de execução')
@@ -131,8 +174,8 @@ def comparar_metodos(n_list, densidade, tol=1e-5):
 
     # Gráfico de número de iterações
     plt.subplot(1, 2, 2)
-    plt.plot(n_list, iteracoes_jacobi, label='Gauss-Jacobi', marker='o')
-    plt.plot(n_list, iteracoes_seidel, label='Gauss-Seidel', marker='s')
+    for nome, (_, marcador) in metodos.items():
+        plt.plot(n_list, iteracoes[nome], label=nome, marker=marcador)
     plt.xlabel('Tamanho do sistema (n)')
     plt.ylabel('Número de iterações')
     plt.title('Número de iterações')
@@ -141,6 +184,209 @@ def comparar_metodos(n_list, densidade, tol=1e-5):
     plt.tight_layout()
     plt.show()
 
+# Função para comparar as ordenações do Gauss-Seidel
+
+def comparar_ordenacoes(n_list, densidade, tol=1e-5, formato="csr"):
+    """
+    Compara o Gauss-Seidel na ordem natural com o multicor (iterações e tempo).
+
+    Parâmetros:
+        n_list (list): Lista de tamanhos do sistema.
+        densidade (float): Proporção de elementos não nulos na matriz A (0 a 1).
+        tol (float): Tolerância para o critério de parada.
+        formato (str): "densa" ou "csr".
+    """
+    print(f"{'n':>8} {'cores':>6} {'it. natural':>12} {'t natural (s)':>14} {'it. multicor':>13} {'t multicor (s)':>15}")
+    for n in n_list:
+        A, b = gerar_sistema_linear(n, densidade, formato)
+        x0 = np.zeros(n)
+
+        start = time.time()
+        it_natural = gauss_seidel(A, b, x0, tol).iteracoes
+        tempo_natural = time.time() - start
+
+        # A coloração entra no tempo do multicor (é calculada uma vez e fica guardada)
+        start = time.time()
+        it_multicor = gauss_seidel(A, b, x0, tol, ordenacao="multicor").iteracoes
+        tempo_multicor = time.time() - start
+
+        print(f"{n:>8} {len(coloracao(A)):>6} {it_natural:>12} {tempo_natural:>14.4f} {it_multicor:>13} {tempo_multicor:>15.4f}")
+
+# Função para comparar o Gauss-Seidel com o SOR e o SSOR de omega automático
+
+def gerar_sistema_poisson(m):
+    """
+    Gera o sistema da equação de Poisson em uma grade m x m (laplaciano de 5 pontos), já em CSR,
+    com b aleatório (distribuição normal). A não é diagonal dominante em sentido estrito e o
+    Gauss-Seidel é lento (contração 1 - O(1/m²)), que é o caso em que o SOR faz diferença.
+
+    Parâmetros:
+        m (int): Pontos por lado da grade (n = m²).
+
+    Retorno:
+        A (MatrizCSR): Matriz A.
+        b (ndarray): Vetor b.
+    """
+    n = m * m
+    pontos = np.arange(n, dtype=np.int64)
+    i, j = pontos // m, pontos % m
+    linhas, colunas, valores = [pontos], [pontos], [np.full(n, 4.0)]
+    for di, dj in ((-1, 0), (0, -1), (0, 1), (1, 0)):
+        # Vizinhos dentro da grade (fora dela o valor de contorno é zero)
+        dentro = (i + di >= 0) & (i + di < m) & (j + dj >= 0) & (j + dj < m)
+        linhas.append(pontos[dentro])
+        colunas.append(pontos[dentro] + di * m + dj)
+        valores.append(np.full(dentro.sum(), -1.0))
+    linhas, colunas, valores = np.concatenate(linhas), np.concatenate(colunas), np.concatenate(valores)
+
+    ordem = np.argsort(linhas * n + colunas)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(linhas, minlength=n), out=indptr[1:])
+    return MatrizCSR(valores[ordem], colunas[ordem], indptr, (n, n)), np.random.randn(n)
+
+def comparar_relaxacao(n_list, densidade, tol=1e-5, formato="densa", max_iter=1000):
+    """
+    Compara o Gauss-Seidel (omega = 1) com o SOR e o SSOR com ajuste automático de omega.
+
+    Parâmetros:
+        n_list (list): Lista de tamanhos do sistema.
+        densidade (float): Proporção de elementos não nulos na matriz A (0 a 1).
+        tol (float): Tolerância para o critério de parada.
+        formato (str): "densa", "csr" ou "poisson" (gerar_sistema_poisson com m = √n; a
+                       densidade é ignorada).
+        max_iter (int): Número máximo de iterações de cada método.
+
+    Retorno:
+        historicos (dict): Para cada n, o histórico de omega do SOR e do SSOR.
+    """
+    historicos = {}
+    print(f"{'n':>6} {'it. GS':>7} {'t GS (s)':>9} {'it. SOR':>8} {'t SOR (s)':>10} {'omega SOR':>10} "
+          f"{'it. SSOR':>9} {'t SSOR (s)':>11} {'omega SSOR':>11}")
+    for n in n_list:
+        if formato == "poisson":
+            A, b = gerar_sistema_poisson(int(round(np.sqrt(n))))
+            n = len(b)
+        else:
+            A, b = gerar_sistema_linear(n, densidade, formato)
+        x0 = np.zeros(n)
+
+        start = time.time()
+        it_gs = gauss_seidel(A, b, x0, tol, max_iter, ordenacao="multicor").iteracoes
+        tempo_gs = time.time() - start
+
+        start = time.time()
+        resultado_sor = sor(A, b, x0, tol, max_iter)
+        it_sor, omegas_sor = resultado_sor.iteracoes, resultado_sor.extras["historico_omega"]
+        tempo_sor = time.time() - start
+
+        start = time.time()
+        resultado_ssor = sor(A, b, x0, tol, max_iter, simetrico=True)
+        it_ssor, omegas_ssor = resultado_ssor.iteracoes, resultado_ssor.extras["historico_omega"]
+        tempo_ssor = time.time() - start
+
+        historicos[n] = {"SOR": omegas_sor, "SSOR": omegas_ssor}
+        print(f"{n:>6} {it_gs:>7} {tempo_gs:>9.4f} {it_sor:>8} {tempo_sor:>10.4f} {max(omegas_sor):>10.3f} "
+              f"{it_ssor:>9} {tempo_ssor:>11.4f} {max(omegas_ssor):>11.3f}")
+    return historicos
+
+# Sistemas não simétricos e sem dominância diagonal: Jacobi x GMRES e BiCGSTAB
+
+def gerar_sistema_nao_dominante(n):
+    """
+    Gera um sistema Ax = b não simétrico e sem dominância diagonal (o Jacobi e o Gauss-Seidel
+    divergem), mas com os autovalores de A longe de zero (os métodos de Krylov convergem rápido).
+
+    Parâmetros:
+        n (int): Dimensão do sistema.
+
+    Retorno:
+        A (ndarray): Matriz A.
+        b (ndarray): Vetor b.
+    """
+    A = np.random.rand(n, n) + np.sqrt(n) * np.eye(n)
+    b = np.random.rand(n)
+    return A, b
+
+def operador_conveccao_difusao(n, peclet=50.0, dt=1e-5):
+    """
+    Operador de um passo implícito (Euler) da equação u_t = u'' - peclet·u', isto é,
+    I + dt·(-u'' + peclet·u'), em n pontos internos de [0, 1] (diferenças centradas).
+    É dado só como função v -> A v: a matriz, não simétrica, nunca é montada.
+
+    Parâmetros:
+        n (int): Número de pontos internos.
+        peclet (float): Intensidade da convecção.
+        dt (float): Passo de tempo.
+
+    Retorno:
+        matvec (function): Produto A v.
+    """
+    h = 1.0 / (n + 1)
+    diagonal = 1.0 + dt * 2.0 / h**2
+    inferior = dt * (-1.0 / h**2 - peclet / (2 * h))
+    superior = dt * (-1.0 / h**2 + peclet / (2 * h))
+
+    def matvec(v):
+        Av = diagonal * v
+        Av[1:] += inferior * v[:-1]
+        Av[:-1] += superior * v[1:]
+        return Av
+    return matvec
+
+def comparar_krylov(n_list, tol=1e-8):
+    """
+    Compara o Jacobi (com e sem a análise prévia, que desvia para LU) com o GMRES(30) e o
+    BiCGSTAB em sistemas sem dominância diagonal:
+    o exemplo 3x3 de metodo_iterativo_jacobi.py, matrizes aleatórias de gerar_sistema_nao_dominante
+    e o operador de convecção-difusão dado só como função (livre de matriz).
+
+    Parâmetros:
+        n_list (list): Lista de tamanhos dos sistemas aleatórios.
+        tol (float): Tolerância relativa para o resíduo.
+    """
+    sistemas = [("3x3 (metodo_iterativo_jacobi.py)",
+                 np.array([[3, -4, -6], [18, -21, -33], [12, -10, -22]], dtype=float),
+                 np.array([25, 141, 66], dtype=float))]
+    sistemas += [(f"aleatório n={n}", *gerar_sistema_nao_dominante(n)) for n in n_list]
+    sistemas += [("convecção-difusão n=1000 (matvec)", operador_conveccao_difusao(1000), np.ones(1000))]
+
+    print(f"{'sistema':>34} {'método':>13} {'iterações':>10} {'tempo (s)':>10} {'resíduo relativo':>17} {'parada':>10}")
+    for nome, A, b in sistemas:
+        matvec = A if callable(A) else A.__matmul__
+        x0 = np.zeros(len(b))
+        metodos = [("GMRES", gmres), ("BiCGSTAB", bicgstab)]
+        if not callable(A):
+            # O monitor interrompe o Jacobi assim que a divergência aparece; com a análise prévia
+            # ele nem começa e o sistema vai direto para a LU
+            metodos[:0] = [("Jacobi", gauss_jacobi),
+                           ("Jacobi verif.", lambda A, b, x0, tol: gauss_jacobi(A, b, x0, tol, verificar=True))]
+        for nome_metodo, metodo in metodos:
+            start = time.time()
+            resultado = metodo(A, b, x0, tol)
+            tempo = time.time() - start
+            residuo = np.linalg.norm(b - matvec(resultado.x)) / np.linalg.norm(b)
+            print(f"{nome:>34} {nome_metodo:>13} {resultado.iteracoes:>10} {tempo:>10.4f} {residuo:>17.2e} "
+                  f"{resultado.motivo:>10}")
+
 # Exemplo de uso
 n_list = [10, 100, 500, 1000]
 comparar_metodos(n_list, densidade=0.5)
+
+# Sistemas simétricos positivos definidos: Jacobi e Seidel x CG e PCG
+comparar_metodos(n_list, densidade=0.5, simetrica=True)
+
+# Sistemas não simétricos sem dominância diagonal: Jacobi x GMRES e BiCGSTAB
+comparar_krylov([100, 500, 1000])
+
+# Gauss-Seidel x SOR/SSOR com omega ajustado durante a execução (mesmos tamanhos)
+historicos_omega = comparar_relaxacao(n_list, densidade=0.5)
+
+# O mesmo na equação de Poisson (grades 10x10 a 40x40) com b aleatório: o Gauss-Seidel precisa de
+# milhares de iterações e o SOR, com omega estimado pela relação de Young, de algumas centenas
+historicos_poisson = comparar_relaxacao([100, 400, 900, 1600], densidade=None, formato="poisson", max_iter=10000)
+
+# Sistemas esparsos em CSR: o custo por iteração é O(nnz), e não O(n²)
+comparar_metodos([1000, 10000, 100000], densidade=1e-4, formato="csr")
+
+# Gauss-Seidel natural x multicor em sistemas esparsos (poucas cores, cada uma vetorizada)
+comparar_ordenacoes([1000, 10000, 100000], densidade=1e-4)
@@ -0,0 +1,208 @@
+# Análise prévia da convergência de Jacobi e Gauss-Seidel e solução direta (LU) como alternativa
+import math
+
+import numpy as np
+
+from matriz_esparsa import MatrizCSR
+from metodos_iterativos import MotorGaussSeidelMulticor, MotorJacobi
+from monitor_convergencia import ResultadoIterativo
+
+
+class DiagnosticoConvergencia:
+    """
+    Resultado da análise de uma matriz antes de iterar.
+
+    Atributos:
+        metodo (str): "jacobi" ou "seidel".
+        dominancia_linhas (bool): A é estritamente diagonal dominante por linhas.
+        dominancia_colunas (bool): A é estritamente diagonal dominante por colunas.
+        sassenfeld (float): Maior beta do critério de Sassenfeld (None se não foi calculado).
+        raio_espectral (float): Estimativa do raio espectral da matriz de iteração pelo método das
+                                potências (None se não foi calculada).
+        garantida (bool): Algum critério suficiente (dominância ou Sassenfeld) garante a convergência.
+        convergente (bool): A convergência é garantida ou o raio espectral estimado é menor que 1.
+    """
+
+    __slots__ = ("metodo", "dominancia_linhas", "dominancia_colunas", "sassenfeld", "raio_espectral",
+                 "garantida", "convergente")
+
+    def __init__(self, metodo, dominancia_linhas, dominancia_colunas, sassenfeld, raio_espectral):
+        self.metodo = metodo
+        self.dominancia_linhas = dominancia_linhas
+        self.dominancia_colunas = dominancia_colunas
+        self.sassenfeld = sassenfeld
+        self.raio_espectral = raio_espectral
+        self.garantida = dominancia_linhas or dominancia_colunas or (sassenfeld is not None and sassenfeld < 1)
+        self.convergente = self.garantida or (raio_espectral is not None and raio_espectral < 1)
+
+    def __repr__(self):
+        texto = f"{self.metodo}: dominância por linhas = {self.dominancia_linhas}, por colunas = {self.dominancia_colunas}"
+        if self.sassenfeld is not None:
+            texto += f", Sassenfeld = {self.sassenfeld:.4f}"
+        if self.raio_espectral is not None:
+            texto += f", raio espectral estimado = {self.raio_espectral:.4f}"
+        return texto + f", convergente = {self.convergente}"
+
+
+def _modulos_fora_da_diagonal(A, D):
+    """
+    Somas dos módulos fora da diagonal, por linha e por coluna.
+    """
+    if isinstance(A, MatrizCSR):
+        modulos = np.abs(A.data)
+        linhas = np.bincount(A.linhas, weights=modulos, minlength=A.shape[0])
+        colunas = np.bincount(A.indices, weights=modulos, minlength=A.shape[1])
+    else:
+        modulos = np.abs(A)
+        linhas, colunas = modulos.sum(axis=1), modulos.sum(axis=0)
+    return linhas - np.abs(D), colunas - np.abs(D)
+
+
+def sassenfeld(A):
+    """
+    Critério de Sassenfeld: beta_i = (sum_{j<i} |a_ij| beta_j + sum_{j>i} |a_ij|) / |a_ii|.
+    Se o maior beta for menor que 1, o Gauss-Seidel (na ordem natural) converge.
+
+    Parâmetros:
+        A (ndarray ou MatrizCSR): Matriz do sistema (diagonal sem zeros).
+
+    Retorno:
+        beta (float): O maior beta_i.
+    """
+    n = A.shape[0]
+    beta = np.zeros(n)
+    if isinstance(A, MatrizCSR):
+        D = np.abs(A.diagonal())
+        # Com beta_j = 1 nas colunas j >= i, cada linha é um único produto com o vetor [beta, 1, 1, ...]
+        pesos = np.ones(n)
+        for i in range(n):
+            inicio, fim = A.indptr[i], A.indptr[i + 1]
+            soma = np.abs(A.data[inicio:fim]) @ pesos[A.indices[inicio:fim]] - D[i]
+            beta[i] = pesos[i] = soma / D[i]
+    else:
+        modulos = np.abs(A)
+        D = np.diag(modulos)
+        acima = np.triu(modulos, 1).sum(axis=1)
+        for i in range(n):
+            beta[i] = (modulos[i, :i] @ beta[:i] + acima[i]) / D[i]
+    return beta.max()
+
+
+def _varredura_natural(A, D, x):
+    """
+    Uma varredura de Gauss-Seidel na ordem natural com b = 0 (x <- matriz de iteração · x), alterando x.
+    """
+    if isinstance(A, MatrizCSR):
+        for i in range(len(x)):
+            inicio, fim = A.indptr[i], A.indptr[i + 1]
+            x[i] -= (A.data[inicio:fim] @ x[A.indices[inicio:fim]]) / D[i]
+    else:
+        for i in range(len(x)):
+            x[i] -= (A[i] @ x) / D[i]
+    return x
+
+
+def raio_espectral(iteracao, n, passos=10, rng=None):
+    """
+    Estima o raio espectral de uma matriz de iteração pelo método das potências.
+
+    Usa a média geométrica dos fatores de crescimento da segunda metade dos passos, que também
+    funciona quando o autovalor dominante é complexo (a norma oscila de um passo para o outro).
+
+    Parâmetros:
+        iteracao (function): Recebe v e retorna M v (pode alterar v).
+        n (int): Dimensão.
+        passos (int): Número de produtos M v.
+        rng (np.random.Generator): Gerador do vetor inicial (opcional).
+
+    Retorno:
+        raio (float): Estimativa de rho(M).
+    """
+    rng = rng or np.random.default_rng(0)
+    v = rng.random(n) - 0.5
+    v /= np.linalg.norm(v)
+    logs = []
+    for _ in range(passos):
+        v = iteracao(v)
+        norma = np.linalg.norm(v)
+        if norma == 0 or not np.isfinite(norma):
+            return 0.0 if norma == 0 else math.inf
+        logs.append(math.log(norma))
+        v /= norma
+    return math.exp(np.mean(logs[len(logs) // 2:]))
+
+
+def analisar_convergencia(A, metodo="jacobi", ordenacao="natural", passos=10, completa=False):
+    """
+    Análise barata, antes de iterar, da convergência do Jacobi ou do Gauss-Seidel: dominância
+    diagonal por linhas e por colunas, critério de Sassenfeld (Seidel na ordem natural) e
+    estimativa do raio espectral da matriz de iteração com alguns passos do método das potências.
+
+    Os critérios são testados do mais barato para o mais caro e a análise para no primeiro que
+    garante a convergência: a dominância custa O(nnz); o Sassenfeld e o raio espectral custam
+    uma e cerca de `passos` iterações do próprio método (completa=True calcula todos).
+
+    Parâmetros:
+        A (ndarray ou MatrizCSR): Matriz do sistema.
+        metodo (str): "jacobi" ou "seidel".
+        ordenacao (str): Ordenação do Gauss-Seidel: "natural" ou "multicor".
+        passos (int): Passos do método das potências.
+        completa (bool): Calcula todos os critérios, mesmo com a convergência já garantida.
+
+    Retorno:
+        diagnostico (DiagnosticoConvergencia): Resultado da análise.
+    """
+    if not isinstance(A, MatrizCSR):
+        A = np.asarray(A, dtype=float)
+    D = A.diagonal()
+    n = len(D)
+    if np.any(D == 0):
+        # Sem a diagonal completa nenhum dos dois métodos pode ser aplicado
+        return DiagnosticoConvergencia(metodo, False, False, None, math.inf)
+
+    fora_linhas, fora_colunas = _modulos_fora_da_diagonal(A, D)
+    dominancia_linhas = bool(np.all(np.abs(D) > fora_linhas))
+    dominancia_colunas = bool(np.all(np.abs(D) > fora_colunas))
+    dominante = dominancia_linhas or dominancia_colunas
+
+    # O critério de Sassenfeld vale para o Gauss-Seidel na ordem natural
+    beta = None
+    if metodo == "seidel" and ordenacao == "natural" and (completa or not dominante):
+        beta = sassenfeld(A)
+    if not completa and (dominante or (beta is not None and beta < 1)):
+        return DiagnosticoConvergencia(metodo, dominancia_linhas, dominancia_colunas, beta, None)
+
+    if metodo == "jacobi":
+        motor = MotorJacobi(A)
+        zeros = np.zeros(n)
+        iteracao = lambda v: motor.passo(zeros, v, np.empty(n))
+    elif ordenacao == "multicor":
+        motor = MotorGaussSeidelMulticor(A)
+        zeros = np.zeros(n)
+        iteracao = lambda v: (motor.varredura(zeros, v), v)[1]
+    else:
+        iteracao = lambda v: _varredura_natural(A, D, v)
+
+    return DiagnosticoConvergencia(metodo, dominancia_linhas, dominancia_colunas, beta,
+                                   raio_espectral(iteracao, n, passos))
+
+
+def resolver_direto(A, b, diagnostico=None):
+    """
+    Resolve Ax = b por fatoração LU com pivotamento parcial (np.linalg.solve, LAPACK), para os
+    sistemas em que a análise indica que a iteração não converge. Uma MatrizCSR é convertida
+    para densa, o que só é viável para n moderado.
+
+    Parâmetros:
+        A (ndarray ou MatrizCSR): Matriz do sistema.
+        b (ndarray): Vetor do lado direito.
+        diagnostico (DiagnosticoConvergencia): Análise que motivou a solução direta (opcional).
+
+    Retorno:
+        resultado (ResultadoIterativo): Solução com motivo "direto", 0 iterações e o diagnóstico
+                                        em resultado.extras["diagnostico"].
+    """
+    if isinstance(A, MatrizCSR):
+        A = A.densa()
+    x = np.linalg.solve(A, b)
+    return ResultadoIterativo(x, 0, "direto", [], None, 0, "LU", {"diagnostico": diagnostico})
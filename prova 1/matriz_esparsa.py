@@ -0,0 +1,187 @@
+# Matriz esparsa no formato CSR (Compressed Sparse Row) e Gauss-Seidel sobre ela
+# (o método de Jacobi, para matrizes densas e CSR, está em metodos_iterativos.py)
+import numpy as np
+
+from monitor_convergencia import MonitorConvergencia
+
+
+class MatrizCSR:
+    """
+    Matriz esparsa guardada por linhas, só com os elementos não nulos.
+
+    Atributos:
+        data (ndarray): Valores não nulos, linha após linha.
+        indices (ndarray): Coluna de cada valor de data.
+        indptr (ndarray): Os valores da linha i estão em data[indptr[i]:indptr[i+1]].
+        shape (tuple): Dimensão (n, m) da matriz.
+    """
+
+    __slots__ = ("data", "indices", "indptr", "shape", "_linhas")
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = tuple(shape)
+        self._linhas = None
+
+    @classmethod
+    def de_densa(cls, A):
+        """
+        Converte uma matriz densa (ndarray) para CSR.
+        """
+        A = np.asarray(A, dtype=float)
+        linhas, colunas = np.nonzero(A)
+        indptr = np.zeros(A.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(linhas, minlength=A.shape[0]), out=indptr[1:])
+        return cls(A[linhas, colunas], colunas, indptr, A.shape)
+
+    @property
+    def nnz(self):
+        """Número de elementos não nulos guardados."""
+        return len(self.data)
+
+    @property
+    def linhas(self):
+        """Linha de cada valor de data (calculada uma vez e guardada)."""
+        if self._linhas is None:
+            self._linhas = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return self._linhas
+
+    def densa(self):
+        """
+        Retorna a matriz como ndarray denso (só para conferência em matrizes pequenas).
+        """
+        A = np.zeros(self.shape)
+        A[self.linhas, self.indices] = self.data
+        return A
+
+    def __matmul__(self, x):
+        """
+        Produto matriz-vetor A @ x em O(nnz).
+        """
+        return np.bincount(self.linhas, weights=self.data * x[self.indices], minlength=self.shape[0])
+
+    def diagonal(self):
+        """
+        Retorna o vetor com a diagonal principal (zeros onde ela não foi guardada).
+        """
+        d = np.zeros(min(self.shape))
+        na_diagonal = self.indices == self.linhas
+        d[self.linhas[na_diagonal]] = self.data[na_diagonal]
+        return d
+
+    def sem_diagonal(self):
+        """
+        Retorna uma nova MatrizCSR com os mesmos elementos, exceto os da diagonal principal.
+        """
+        fora = self.indices != self.linhas
+        indptr = np.zeros(self.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.linhas[fora], minlength=self.shape[0]), out=indptr[1:])
+        return MatrizCSR(self.data[fora], self.indices[fora], indptr, self.shape)
+
+    def submatriz_linhas(self, linhas):
+        """
+        Retorna uma nova MatrizCSR só com as linhas escolhidas (na ordem dada), com as mesmas colunas.
+        """
+        linhas = np.asarray(linhas, dtype=np.int64)
+        inicio = self.indptr[linhas]
+        contagem = self.indptr[linhas + 1] - inicio
+        indptr = np.zeros(len(linhas) + 1, dtype=np.int64)
+        np.cumsum(contagem, out=indptr[1:])
+        # Posição em data de cada elemento copiado: início da linha original + deslocamento dentro dela
+        posicoes = np.arange(indptr[-1]) - np.repeat(indptr[:-1] - inicio, contagem)
+        return MatrizCSR(self.data[posicoes], self.indices[posicoes], indptr, (len(linhas), self.shape[1]))
+
+    def transposta(self):
+        """
+        Retorna a transposta, também em CSR.
+        """
+        ordem = np.argsort(self.indices, kind="stable")
+        indptr = np.zeros(self.shape[1] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=self.shape[1]), out=indptr[1:])
+        return MatrizCSR(self.data[ordem], self.linhas[ordem], indptr, self.shape[::-1])
+
+
+def gerar_sistema_esparso(n, densidade, rng=None, simetrica=False):
+    """
+    Gera um sistema linear Ax = b esparso e estritamente diagonal dominante, já em CSR,
+    sem montar a matriz densa (memória e tempo O(nnz), servindo para n = 10**6).
+
+    Parâmetros:
+        n (int): Dimensão do sistema.
+        densidade (float): Proporção de elementos não nulos fora da diagonal (0 a 1).
+        rng (np.random.Generator): Gerador de números aleatórios (opcional).
+        simetrica (bool): Gera A simétrica (e, com a diagonal dominante positiva, positiva definida).
+
+    Retorno:
+        A (MatrizCSR): Matriz A.
+        b (ndarray): Vetor b.
+    """
+    rng = rng or np.random.default_rng()
+
+    # Quantidade de elementos fora da diagonal em cada linha e as suas colunas (pulando a diagonal)
+    por_linha = rng.binomial(n - 1, densidade / 2 if simetrica else densidade, size=n)
+    linhas = np.repeat(np.arange(n, dtype=np.int64), por_linha)
+    colunas = rng.integers(0, n - 1, size=len(linhas), dtype=np.int64)
+    colunas += colunas >= linhas
+    chaves = linhas * n + colunas
+    if simetrica:
+        # Cada posição (i, j) fora da diagonal aparece também como (j, i)
+        chaves = np.concatenate([chaves, colunas * n + linhas])
+
+    # Junta as posições da diagonal, ordena por (linha, coluna) e descarta posições repetidas
+    chaves = np.sort(np.concatenate([chaves, np.arange(n, dtype=np.int64) * (n + 1)]))
+    chaves = chaves[np.concatenate([[True], chaves[1:] != chaves[:-1]])]
+    linhas, colunas = chaves // n, chaves % n
+    valores = rng.random(len(chaves))
+    if simetrica:
+        # Abaixo da diagonal, copia o valor da posição transposta (achada por busca binária)
+        inferior = linhas > colunas
+        valores[inferior] = valores[np.searchsorted(chaves, colunas[inferior] * n + linhas[inferior])]
+
+    # Diagonal maior que a soma dos módulos do resto da linha (um elemento por linha, em ordem)
+    na_diagonal = linhas == colunas
+    soma_fora = np.bincount(linhas[~na_diagonal], weights=valores[~na_diagonal], minlength=n)
+    valores[na_diagonal] = soma_fora + rng.random(n) + 1e-3
+
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(linhas, minlength=n), out=indptr[1:])
+
+    A = MatrizCSR(valores, colunas, indptr, (n, n))
+    b = rng.random(n)
+    return A, b
+
+
+def gauss_seidel_csr(A, b, x0, tol=1e-5, max_iter=1000):
+    """
+    Método de Gauss-Seidel para A em CSR: cada iteração percorre só os não nulos, O(nnz).
+
+    Parâmetros:
+        A (MatrizCSR): Matriz do sistema.
+        b (ndarray): Vetor do lado direito.
+        x0 (ndarray): Aproximação inicial.
+        tol (float): Tolerância para o critério de parada.
+        max_iter (int): Número máximo de iterações.
+
+    Retorno:
+        resultado (ResultadoIterativo): Solução, iterações, motivo da parada e histórico das variações.
+    """
+    n = len(b)
+    D = A.diagonal()
+    data, indices, indptr = A.data, A.indices, A.indptr
+    x = x0.copy()
+    monitor = MonitorConvergencia(tol, max_iter)
+    for k in range(max_iter):
+        maior_passo = 0.0
+        for i in range(n):
+            inicio, fim = indptr[i], indptr[i + 1]
+            # Linha i inteira (com a diagonal) aplicada em x: x[i] += (b[i] - A[i, :] x) / A[i, i]
+            passo = (b[i] - data[inicio:fim] @ x[indices[inicio:fim]]) / D[i]
+            x[i] += passo
+            maior_passo = max(maior_passo, abs(passo))
+
+        motivo = monitor.registrar(maior_passo)
+        if motivo:
+            return monitor.resultado(x, k + 1, motivo, "Gauss-Seidel")
+    return monitor.resultado(x, max_iter, None, "Gauss-Seidel")
@@ -0,0 +1,758 @@
+# Métodos iterativos para sistemas lineares Ax = b (matrizes densas ou MatrizCSR)
+import hashlib
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+from matriz_esparsa import MatrizCSR
+from monitor_convergencia import MonitorConvergencia
+
+
+def operador(A):
+    """
+    Retorna a função v -> A v usada pelos métodos que só acessam A por produtos (livres de matriz).
+
+    Parâmetros:
+        A (ndarray, MatrizCSR ou função): Matriz do sistema, ou a própria função matvec(v).
+
+    Retorno:
+        matvec (function): Função que recebe v e retorna A v.
+    """
+    if callable(A) and not isinstance(A, (np.ndarray, MatrizCSR)):
+        return A
+    return A.__matmul__
+
+
+class MotorJacobi:
+    """
+    Iteração de Jacobi pela separação A = D + R: x_novo = D⁻¹ (b - R x).
+
+    D⁻¹ e R são montados uma única vez; cada iteração é um único produto matriz-vetor
+    escrito em um de dois vetores pré-alocados, que se alternam (sem alocar a cada iteração).
+
+    Atributos:
+        D_inv (ndarray): Inverso da diagonal de A.
+        R (ndarray ou MatrizCSR): A sem a diagonal principal.
+    """
+
+    def __init__(self, A):
+        if isinstance(A, MatrizCSR):
+            D = A.diagonal()
+            self.R = A.sem_diagonal()
+        else:
+            A = np.asarray(A, dtype=float)
+            D = np.diag(A).copy()
+            self.R = A.copy()
+            np.fill_diagonal(self.R, 0.0)
+        if np.any(D == 0):
+            raise ValueError("A diagonal de A tem elementos nulos: o método de Jacobi não se aplica.")
+        self.D_inv = 1.0 / D
+
+    def passo(self, b, x, saida):
+        """
+        Calcula uma iteração de Jacobi a partir de x, escrevendo o resultado em saida.
+
+        Parâmetros:
+            b (ndarray): Vetor do lado direito.
+            x (ndarray): Aproximação atual (não é alterada).
+            saida (ndarray): Vetor onde a nova aproximação é escrita.
+
+        Retorno:
+            saida (ndarray): A nova aproximação.
+        """
+        if isinstance(self.R, MatrizCSR):
+            saida[:] = self.R @ x
+        else:
+            np.dot(self.R, x, out=saida)
+        np.subtract(b, saida, out=saida)
+        np.multiply(saida, self.D_inv, out=saida)
+        return saida
+
+    def resolver(self, b, x0, tol=1e-5, max_iter=1000):
+        """
+        Itera até que a maior variação entre duas iterações fique abaixo de tol.
+
+        Parâmetros:
+            b (ndarray): Vetor do lado direito.
+            x0 (ndarray): Aproximação inicial.
+            tol (float): Tolerância para o critério de parada.
+            max_iter (int): Número máximo de iterações.
+
+        Retorno:
+            resultado (ResultadoIterativo): Solução, iterações, motivo da parada e histórico das variações.
+        """
+        b = np.asarray(b, dtype=float)
+        x = np.array(x0, dtype=float)
+        x_novo = np.empty_like(x)
+        diferenca = np.empty_like(x)
+        monitor = MonitorConvergencia(tol, max_iter)
+        for k in range(max_iter):
+            self.passo(b, x, x_novo)
+            np.subtract(x_novo, x, out=diferenca)
+            np.abs(diferenca, out=diferenca)
+            # Troca os papéis dos dois vetores: o novo vira o atual
+            x, x_novo = x_novo, x
+            motivo = monitor.registrar(diferenca.max())
+            if motivo:
+                return monitor.resultado(x, k + 1, motivo, "Jacobi")
+        return monitor.resultado(x, max_iter, None, "Jacobi")
+
+
+def jacobi(A, b, x0, tol=1e-5, max_iter=1000):
+    """
+    Método de Gauss-Jacobi vetorizado (A densa ou MatrizCSR).
+
+    Parâmetros:
+        A (ndarray ou MatrizCSR): Matriz do sistema.
+        b (ndarray): Vetor do lado direito.
+        x0 (ndarray): Aproximação inicial.
+        tol (float): Tolerância para o critério de parada.
+        max_iter (int): Número máximo de iterações.
+
+    Retorno:
+        resultado (ResultadoIterativo): Ver MotorJacobi.resolver.
+    """
+    return MotorJacobi(A).resolver(b, x0, tol, max_iter)
+
+
+# Colorações já calculadas, indexadas pelo padrão de esparsidade (não pelos valores) da matriz.
+# Só as _MAX_CORES usadas mais recentemente ficam guardadas (cada uma ocupa O(n) inteiros)
+_CACHE_CORES = OrderedDict()
+_MAX_CORES = 8
+
+
+def coloracao(A):
+    """
+    Colore o grafo do padrão de esparsidade de A: i e j são vizinhos se A[i, j] ≠ 0 ou A[j, i] ≠ 0.
+    Linhas da mesma cor não dependem umas das outras e podem ser atualizadas juntas no Gauss-Seidel.
+
+    A coloração (gulosa, na ordem natural das linhas) é calculada uma vez por padrão
+    de esparsidade e guardada; matrizes com o mesmo padrão reaproveitam o resultado.
+    O cache guarda os _MAX_CORES padrões usados mais recentemente e descarta o mais antigo.
+
+    Parâmetros:
+        A (ndarray ou MatrizCSR): Matriz quadrada.
+
+    Retorno:
+        cores (list of ndarray): Índices das linhas de cada cor, em ordem crescente.
+    """
+    if not isinstance(A, MatrizCSR):
+        A = MatrizCSR.de_densa(A)
+    chave = hashlib.blake2b(A.indptr.tobytes() + A.indices.tobytes(), digest_size=16).digest()
+    if chave in _CACHE_CORES:
+        _CACHE_CORES.move_to_end(chave)
+        return _CACHE_CORES[chave]
+
+    # Vizinhança simétrica: linha i de A mais coluna i de A
+    At = A.transposta()
+    n = A.shape[0]
+    ptr, viz = A.indptr.tolist(), A.indices.tolist()
+    ptr_t, viz_t = At.indptr.tolist(), At.indices.tolist()
+
+    cor = [-1] * n
+    for i in range(n):
+        usadas = {cor[j] for j in viz[ptr[i]:ptr[i + 1]]}
+        usadas.update(cor[j] for j in viz_t[ptr_t[i]:ptr_t[i + 1]])
+        c = 0
+        while c in usadas:
+            c += 1
+        cor[i] = c
+
+    cor = np.array(cor)
+    ordem = np.argsort(cor, kind="stable")
+    cores = np.split(ordem, np.cumsum(np.bincount(cor))[:-1])
+    _CACHE_CORES[chave] = cores
+    if len(_CACHE_CORES) > _MAX_CORES:
+        _CACHE_CORES.popitem(last=False)
+    return cores
+
+
+class MotorGaussSeidelMulticor:
+    """
+    Gauss-Seidel com ordenação multicor: as linhas de uma mesma cor são independentes entre si,
+    então cada cor é atualizada de uma vez, com um produto matriz-vetor, já usando os valores
+    novos das cores anteriores. Com duas cores (malhas, matrizes tridiagonais) é o "red-black".
+
+    Atributos:
+        cores (list of ndarray): Linhas de cada cor (ver coloracao).
+        D_inv (ndarray): Inverso da diagonal de A.
+        blocos (list): Para cada cor, as linhas de A sem a diagonal (ndarray ou MatrizCSR).
+    """
+
+    def __init__(self, A):
+        jacobi = MotorJacobi(A)
+        self.D_inv = jacobi.D_inv
+        self.cores = coloracao(A)
+        if isinstance(jacobi.R, MatrizCSR):
+            self.blocos = [jacobi.R.submatriz_linhas(linhas) for linhas in self.cores]
+        else:
+            self.blocos = [jacobi.R[linhas] for linhas in self.cores]
+
+    def varredura(self, b, x, omega=1.0, reversa=False):
+        """
+        Faz uma iteração completa (todas as cores), alterando x.
+
+        Parâmetros:
+            b (ndarray): Vetor do lado direito.
+            x (ndarray): Aproximação atual (é atualizada).
+            omega (float): Fator de relaxação (1 = Gauss-Seidel, entre 1 e 2 = sobre-relaxação).
+            reversa (bool): Percorre as cores da última para a primeira (meia iteração do SSOR).
+
+        Retorno:
+            maior_passo (float): Maior variação de uma componente de x nesta iteração.
+        """
+        maior_passo = 0.0
+        ordem = zip(self.cores[::-1], self.blocos[::-1]) if reversa else zip(self.cores, self.blocos)
+        for linhas, bloco in ordem:
+            passo = (b[linhas] - bloco @ x) * self.D_inv[linhas] - x[linhas]
+            if omega != 1.0:
+                passo *= omega
+            maior_passo = max(maior_passo, np.abs(passo).max())
+            x[linhas] += passo
+        return maior_passo
+
+    def resolver(self, b, x0, tol=1e-5, max_iter=1000):
+        """
+        Itera até que a maior variação entre duas iterações fique abaixo de tol.
+
+        Parâmetros:
+            b (ndarray): Vetor do lado direito.
+            x0 (ndarray): Aproximação inicial.
+            tol (float): Tolerância para o critério de parada.
+            max_iter (int): Número máximo de iterações.
+
+        Retorno:
+            resultado (ResultadoIterativo): Solução, iterações, motivo da parada e histórico das variações.
+        """
+        b = np.asarray(b, dtype=float)
+        x = np.array(x0, dtype=float)
+        monitor = MonitorConvergencia(tol, max_iter)
+        for k in range(max_iter):
+            motivo = monitor.registrar(self.varredura(b, x))
+            if motivo:
+                return monitor.resultado(x, k + 1, motivo, "Gauss-Seidel multicor")
+        return monitor.resultado(x, max_iter, None, "Gauss-Seidel multicor")
+
+
+def gauss_seidel_multicor(A, b, x0, tol=1e-5, max_iter=1000):
+    """
+    Método de Gauss-Seidel com ordenação multicor (A densa ou MatrizCSR).
+
+    Parâmetros:
+        A (ndarray ou MatrizCSR): Matriz do sistema.
+        b (ndarray): Vetor do lado direito.
+        x0 (ndarray): Aproximação inicial.
+        tol (float): Tolerância para o critério de parada.
+        max_iter (int): Número máximo de iterações.
+
+    Retorno:
+        resultado (ResultadoIterativo): Ver MotorGaussSeidelMulticor.resolver.
+    """
+    return MotorGaussSeidelMulticor(A).resolver(b, x0, tol, max_iter)
+
+
+def omega_otimo(rho_jacobi, simetrico=False):
+    """
+    Fator de relaxação ótimo a partir do raio espectral da matriz de iteração de Jacobi
+    (fórmula de Young para o SOR; estimativa usual para o SSOR).
+
+    Parâmetros:
+        rho_jacobi (float): Raio espectral de D⁻¹ (A - D), entre 0 e 1.
+        simetrico (bool): True para o SSOR.
+
+    Retorno:
+        omega (float): Fator de relaxação, entre 1 e 2.
+    """
+    if simetrico:
+        return 2.0 / (1.0 + np.sqrt(2.0 * (1.0 - rho_jacobi)))
+    return 2.0 / (1.0 + np.sqrt(1.0 - rho_jacobi ** 2))
+
+
+def sor(A, b, x0, tol=1e-5, max_iter=1000, omega=None, simetrico=False, janela=6):
+    """
+    Método SOR (ou SSOR, com simetrico=True) na ordenação multicor (A densa ou MatrizCSR).
+
+    Com omega=None o fator é ajustado durante a execução. As primeiras iterações são de
+    Gauss-Seidel (omega = 1) e a razão entre passos consecutivos mede a contração observada.
+    Quando `janela` razões seguidas ficam estáveis, a contração lambda dá uma estimativa do raio
+    espectral de Jacobi pela relação de Young, (lambda + omega - 1)² = lambda omega² mu², e omega
+    passa para o ótimo dessa estimativa. Com o omega novo o processo se repete: enquanto o
+    autovalor dominante é real (lambda > omega - 1), omega ainda está abaixo do ótimo e a nova
+    estimativa de mu é melhor que a anterior.
+
+    Cada troca é testada: se a nova contração estável não for coerente com a relação de Young e
+    ficar pior que a do Gauss-Seidel, ou se, passado o tempo característico do omega anterior, o
+    passo não tiver caído, omega volta ao valor anterior e o teto dos próximos ajustes cai para o
+    meio do caminho até o rejeitado (o ajuste continua, só que mais perto do omega que funcionou).
+    É o que acontece com o SSOR em duas cores, em que a varredura reversa repete a última cor e
+    omega > 1 não ganha nada do Gauss-Seidel (ele é mais útil como pré-condicionador), e com
+    matrizes não consistentemente ordenadas, em que omega > 1 pode divergir.
+
+    Parâmetros:
+        A (ndarray ou MatrizCSR): Matriz do sistema.
+        b (ndarray): Vetor do lado direito.
+        x0 (ndarray): Aproximação inicial.
+        tol (float): Tolerância para o critério de parada.
+        max_iter (int): Número máximo de iterações.
+        omega (float): Fator de relaxação fixo (None = ajuste automático).
+        simetrico (bool): True para o SSOR (varredura direta seguida da reversa).
+        janela (int): Número de razões consecutivas estáveis exigidas antes de ajustar omega.
+
+    Retorno:
+        resultado (ResultadoIterativo): Solução, iterações, motivo da parada e histórico das variações;
+                                        resultado.extras["historico_omega"] tem o omega de cada iteração.
+    """
+    motor = MotorGaussSeidelMulticor(A)
+    b = np.asarray(b, dtype=float)
+    x = np.array(x0, dtype=float)
+
+    adaptativo = omega is None
+    omega = 1.0 if adaptativo else omega
+    teto = 2.0
+    razoes = []
+    contracao_gs = None
+    passo_anterior = None
+    troca = None
+    historico_omega = []
+    metodo = "SSOR" if simetrico else "SOR"
+    monitor = MonitorConvergencia(tol, max_iter)
+
+    for k in range(max_iter):
+        passo = motor.varredura(b, x, omega)
+        if simetrico:
+            passo = max(passo, motor.varredura(b, x, omega, reversa=True))
+        historico_omega.append(omega)
+        motivo = monitor.registrar(passo)
+        if motivo:
+            return monitor.resultado(x, k + 1, motivo, metodo, historico_omega=historico_omega)
+
+        if adaptativo and passo_anterior:
+            razoes.append(passo / passo_anterior)
+            recentes = razoes[-janela:]
+            # Estável: a variação das razões é pequena perto da distância 1 - razão
+            estavel = (len(recentes) == janela and max(recentes) < 1
+                       and max(recentes) - min(recentes) < 0.1 * (1 - max(recentes)))
+            contracao = math.exp(np.mean(np.log(recentes))) if estavel else None
+
+            # Relação de Young: com autovalor dominante real (lambda > omega - 1) dá mu, o raio
+            # espectral de Jacobi; no SSOR, só a contração do Gauss-Seidel (cerca de mu²) serve
+            mu = None
+            if estavel:
+                if omega == 1.0 and contracao_gs is None:
+                    contracao_gs = contracao
+                if simetrico:
+                    mu = math.sqrt(contracao) if omega == 1.0 else None
+                elif contracao > omega - 1:
+                    mu = (contracao + omega - 1) / (omega * math.sqrt(contracao))
+                if mu is not None and mu >= 1:
+                    mu = None
+
+            if troca is not None:
+                iteracoes_na_troca, passo_na_troca, omega_anterior, contracao_anterior = troca
+                # Logo após a troca o passo cresce por várias iterações (transiente do SOR); se
+                # passado o tempo característico do omega anterior ele não caiu, o omega novo é pior
+                longo = k - iteracoes_na_troca >= max(4 * janela, 1 / (1 - contracao_anterior))
+                if estavel:
+                    # Contração estável coerente com a relação de Young: omega ainda está abaixo do
+                    # ótimo e a estimativa melhora; sem coerência, ela deve ao menos vencer o Gauss-Seidel
+                    pior = contracao >= contracao_gs and mu is None
+                else:
+                    pior = longo and passo >= passo_na_troca
+                if pior:
+                    teto, omega = (omega + omega_anterior) / 2, omega_anterior
+                    monitor.reiniciar_referencia()
+                    razoes, mu, troca = [], None, None
+                elif estavel or longo:
+                    troca = None
+
+            if mu is not None:
+                novo = omega_otimo(mu, simetrico)
+                if omega + 1e-3 * (2 - omega) < novo < teto:
+                    troca = (k, passo, omega, contracao)
+                    omega = novo
+                    # O transiente da troca não é divergência nem estagnação
+                    monitor.reiniciar_referencia()
+                    razoes = []
+        passo_anterior = passo
+
+    return monitor.resultado(x, max_iter, None, metodo, historico_omega=historico_omega)
+
+
+class PrecondJacobi:
+    """
+    Pré-condicionador de Jacobi (diagonal): M = D, aplicar(r) = D⁻¹ r.
+    """
+
+    def __init__(self, A):
+        D = A.diagonal() if isinstance(A, MatrizCSR) else np.diag(A)
+        self.D_inv = 1.0 / D
+
+    def aplicar(self, r):
+        return r * self.D_inv
+
+
+class PrecondSSOR:
+    """
+    Pré-condicionador SSOR: aplicar(r) é uma iteração do SSOR (varredura direta e reversa,
+    na ordenação multicor) sobre A z = r partindo de z = 0. Para A simétrica o operador
+    resultante é simétrico e positivo definido, como o CG exige.
+    """
+
+    def __init__(self, A, omega=1.0):
+        self.motor = MotorGaussSeidelMulticor(A)
+        self.omega = omega
+
+    def aplicar(self, r):
+        z = np.zeros_like(r)
+        self.motor.varredura(r, z, self.omega)
+        self.motor.varredura(r, z, self.omega, reversa=True)
+        return z
+
+
+class PrecondCholeskyIncompleto:
+    """
+    Pré-condicionador de Cholesky incompleto sem preenchimento, IC(0): A ≈ L Lᵀ com L restrito
+    ao padrão de esparsidade da parte triangular inferior de A; aplicar(r) resolve L Lᵀ z = r.
+
+    Se a fatoração encontrar um pivô não positivo (possível fora das M-matrizes), ela é
+    refeita com a diagonal aumentada em alfa·diag(A), com alfa crescendo de 10 em 10.
+
+    Atributos:
+        alfa (float): Aumento relativo da diagonal usado na fatoração (0 se não foi preciso).
+    """
+
+    def __init__(self, A):
+        self.esparsa = isinstance(A, MatrizCSR)
+        alfa = 0.0
+        while True:
+            try:
+                if self.esparsa:
+                    self._fatorar_csr(A, alfa)
+                else:
+                    self._fatorar_densa(np.asarray(A, dtype=float), alfa)
+                break
+            except ValueError:
+                if alfa > 1.0:
+                    raise
+                alfa = 1e-3 if alfa == 0.0 else 10 * alfa
+        self.alfa = alfa
+
+    def _fatorar_densa(self, A, alfa):
+        # Cholesky à direita com atualizações de posto 1 mascaradas pelo padrão de A,
+        # feitas só nas linhas em que a coluna k tem elementos não nulos
+        L = np.tril(A)
+        L[np.diag_indices_from(L)] *= 1.0 + alfa
+        padrao = L != 0
+        for k in range(len(L)):
+            if L[k, k] <= 0:
+                raise ValueError("Pivô não positivo no Cholesky incompleto.")
+            L[k, k] = np.sqrt(L[k, k])
+            abaixo = k + 1 + np.flatnonzero(L[k+1:, k])
+            L[abaixo, k] /= L[k, k]
+            bloco = np.ix_(abaixo, abaixo)
+            L[bloco] -= np.outer(L[abaixo, k], L[abaixo, k]) * padrao[bloco]
+        self.L = L
+        self.Lt = L.T.copy()
+
+    def _fatorar_csr(self, A, alfa):
+        # Linha por linha: L[i, k] = (A[i, k] - Σ_j<k L[i, j] L[k, j]) / L[k, k], só onde A[i, k] ≠ 0
+        n = A.shape[0]
+        indptr, indices, data = A.indptr.tolist(), A.indices.tolist(), A.data.tolist()
+        linhas_L = []
+        diagonal = [0.0] * n
+        for i in range(n):
+            linha = {}
+            a_ii = 0.0
+            for p in range(indptr[i], indptr[i + 1]):
+                j = indices[p]
+                if j < i:
+                    linha[j] = data[p]
+                elif j == i:
+                    a_ii = data[p] * (1.0 + alfa)
+            for k in sorted(linha):
+                linha_k = linhas_L[k]
+                soma = sum(v * linha_k[j] for j, v in linha.items() if j < k and j in linha_k)
+                linha[k] = (linha[k] - soma) / diagonal[k]
+            pivo = a_ii - sum(v * v for v in linha.values())
+            if pivo <= 0:
+                raise ValueError("Pivô não positivo no Cholesky incompleto.")
+            diagonal[i] = pivo ** 0.5
+            linhas_L.append(linha)
+
+        # L (sem a diagonal) em CSR por linhas e sua transposta, para as duas substituições
+        contagem = [len(linha) for linha in linhas_L]
+        indptr_L = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(contagem, out=indptr_L[1:])
+        colunas = [j for linha in linhas_L for j in sorted(linha)]
+        valores = [linha[j] for linha in linhas_L for j in sorted(linha)]
+        L = MatrizCSR(valores, colunas, indptr_L, (n, n))
+        self._L = (L.indptr.tolist(), L.indices.tolist(), L.data.tolist())
+        Lt = L.transposta()
+        self._Lt = (Lt.indptr.tolist(), Lt.indices.tolist(), Lt.data.tolist())
+        self._diagonal = diagonal
+
+    def aplicar(self, r):
+        n = len(r)
+        if not self.esparsa:
+            L, Lt = self.L, self.Lt
+            y = np.empty(n)
+            for i in range(n):
+                y[i] = (r[i] - L[i, :i] @ y[:i]) / L[i, i]
+            z = np.empty(n)
+            for i in range(n - 1, -1, -1):
+                z[i] = (y[i] - Lt[i, i+1:] @ z[i+1:]) / Lt[i, i]
+            return z
+
+        diagonal = self._diagonal
+        indptr, indices, data = self._L
+        y = r.tolist()
+        for i in range(n):
+            soma = y[i]
+            for p in range(indptr[i], indptr[i + 1]):
+                soma -= data[p] * y[indices[p]]
+            y[i] = soma / diagonal[i]
+        indptr, indices, data = self._Lt
+        for i in range(n - 1, -1, -1):
+            soma = y[i]
+            for p in range(indptr[i], indptr[i + 1]):
+                soma -= data[p] * y[indices[p]]
+            y[i] = soma / diagonal[i]
+        return np.array(y)
+
+
+# Pré-condicionadores disponíveis pelo nome em gradientes_conjugados
+PRECONDICIONADORES = {
+    "jacobi": PrecondJacobi,
+    "ssor": PrecondSSOR,
+    "ic": PrecondCholeskyIncompleto,
+}
+
+
+def _aplicar_precondicionador(A, precondicionador):
+    """
+    Retorna a função r -> M⁻¹ r a partir de None (identidade), de um nome de PRECONDICIONADORES
+    (construído a partir de A, que então precisa ser uma matriz) ou de um objeto com aplicar(r).
+    Um nome fora de PRECONDICIONADORES levanta ValueError.
+    """
+    if precondicionador is None:
+        return np.copy
+    if isinstance(precondicionador, str):
+        if precondicionador not in PRECONDICIONADORES:
+            raise ValueError(f"Pré-condicionador desconhecido: {precondicionador!r}. "
+                             f"Use um de {sorted(PRECONDICIONADORES)}.")
+        precondicionador = PRECONDICIONADORES[precondicionador](A)
+    return precondicionador.aplicar
+
+
+def _sistema_homogeneo(x, tol, max_iter, metodo):
+    """
+    Resultado para b = 0, em que a solução (A invertível) é x = 0 e o limite relativo tol·‖b‖ = 0
+    nunca seria atingido.
+    """
+    monitor = MonitorConvergencia(tol, max_iter)
+    monitor.registrar(0.0)
+    return monitor.resultado(np.zeros_like(x), 0, "convergiu", metodo)
+
+
+def gradientes_conjugados(A, b, x0, tol=1e-5, max_iter=1000, precondicionador=None):
+    """
+    Método dos Gradientes Conjugados (CG), com pré-condicionamento opcional (PCG), para A
+    simétrica e positiva definida (densa ou MatrizCSR). O número de iterações cresce com √κ(A),
+    e não com κ(A) como no Jacobi e no Gauss-Seidel.
+
+    Parâmetros:
+        A (ndarray, MatrizCSR ou função): Matriz simétrica positiva definida (ou matvec, ver operador).
+        b (ndarray): Vetor do lado direito.
+        x0 (ndarray): Aproximação inicial.
+        tol (float): Para quando ‖b - Ax‖₂ < tol·‖b‖₂ (com b = 0 retorna x = 0 sem iterar).
+        max_iter (int): Número máximo de iterações.
+        precondicionador: None, um nome de PRECONDICIONADORES ("jacobi", "ssor", "ic")
+                          ou um objeto com o método aplicar(r) que retorna M⁻¹ r.
+
+    Retorno:
+        resultado (ResultadoIterativo): Solução, iterações, motivo da parada e histórico
+                                        de ‖b - Ax‖₂ (no início e após cada iteração).
+    """
+    matvec = operador(A)
+    aplicar = _aplicar_precondicionador(A, precondicionador)
+
+    b = np.asarray(b, dtype=float)
+    x = np.array(x0, dtype=float)
+    metodo = "CG" if precondicionador is None else "PCG"
+    if not b.any():
+        return _sistema_homogeneo(x, tol, max_iter, metodo)
+    r = b - matvec(x)
+    z = aplicar(r)
+    p = z.copy()
+    rz = r @ z
+    monitor = MonitorConvergencia(tol, max_iter, np.linalg.norm(b))
+    if monitor.registrar(np.linalg.norm(r)) == "convergiu":
+        return monitor.resultado(x, 0, "convergiu", metodo)
+
+    for k in range(max_iter):
+        Ap = matvec(p)
+        alfa = rz / (p @ Ap)
+        x += alfa * p
+        r -= alfa * Ap
+        motivo = monitor.registrar(np.linalg.norm(r))
+        if motivo:
+            return monitor.resultado(x, k + 1, motivo, metodo)
+
+        z = aplicar(r)
+        rz_novo = r @ z
+        p *= rz_novo / rz
+        p += z
+        rz = rz_novo
+    return monitor.resultado(x, max_iter, None, metodo)
+
+
+def gmres(A, b, x0, tol=1e-5, max_iter=1000, reinicio=30, precondicionador=None):
+    """
+    GMRES com reinício a cada `reinicio` iterações, GMRES(m), para A qualquer (não simétrica,
+    sem dominância diagonal). A só é usada por meio de produtos A v, então A pode ser a
+    própria função matvec. O pré-condicionador, se houver, é aplicado à direita (A M⁻¹ u = b).
+
+    Em cada ciclo, a base de Krylov é ortonormalizada por Arnoldi (Gram-Schmidt modificado) e as
+    rotações de Givens dão a norma do resíduo a cada iteração, sem produtos extras.
+
+    Parâmetros:
+        A (ndarray, MatrizCSR ou função): Matriz do sistema ou matvec(v).
+        b (ndarray): Vetor do lado direito.
+        x0 (ndarray): Aproximação inicial.
+        tol (float): Para quando ‖b - Ax‖₂ < tol·‖b‖₂ (com b = 0 retorna x = 0 sem iterar).
+        max_iter (int): Número máximo de iterações (produtos A v) somando todos os ciclos.
+        reinicio (int): Dimensão máxima da base de Krylov antes de reiniciar.
+        precondicionador: Como em gradientes_conjugados.
+
+    Retorno:
+        resultado (ResultadoIterativo): Solução, iterações, motivo da parada e histórico
+                                        de ‖b - Ax‖₂ (no início e após cada iteração).
+    """
+    matvec = operador(A)
+    aplicar = _aplicar_precondicionador(A, precondicionador)
+
+    b = np.asarray(b, dtype=float)
+    x = np.array(x0, dtype=float)
+    if not b.any():
+        return _sistema_homogeneo(x, tol, max_iter, "GMRES")
+    n = len(b)
+    monitor = MonitorConvergencia(tol, max_iter, np.linalg.norm(b))
+    r = b - matvec(x)
+    beta = np.linalg.norm(r)
+    if monitor.registrar(beta) == "convergiu":
+        return monitor.resultado(x, 0, "convergiu", "GMRES")
+
+    k = 0
+    while k < max_iter:
+        m = min(reinicio, max_iter - k, n)
+        V = np.zeros((m + 1, n))  # Base de Krylov, um vetor por linha
+        H = np.zeros((m + 1, m))  # Matriz de Hessenberg de Arnoldi
+        cossenos, senos = np.zeros(m), np.zeros(m)
+        g = np.zeros(m + 1)  # Q^T (beta e1): g[j+1] é o resíduo após a iteração j
+        V[0] = r / beta
+        g[0] = beta
+
+        for j in range(m):
+            w = matvec(aplicar(V[j]))
+            for i in range(j + 1):
+                H[i, j] = w @ V[i]
+                w -= H[i, j] * V[i]
+            H[j + 1, j] = np.linalg.norm(w)
+            if H[j + 1, j] > 0:
+                V[j + 1] = w / H[j + 1, j]
+
+            # Rotações anteriores aplicadas à nova coluna e nova rotação que anula H[j+1, j]
+            for i in range(j):
+                H[i, j], H[i + 1, j] = (cossenos[i] * H[i, j] + senos[i] * H[i + 1, j],
+                                        -senos[i] * H[i, j] + cossenos[i] * H[i + 1, j])
+            raio = np.hypot(H[j, j], H[j + 1, j])
+            cossenos[j], senos[j] = H[j, j] / raio, H[j + 1, j] / raio
+            H[j, j], H[j + 1, j] = raio, 0.0
+            g[j + 1] = -senos[j] * g[j]
+            g[j] *= cossenos[j]
+
+            k += 1
+            motivo = monitor.registrar(abs(g[j + 1]))
+            if motivo or H[j, j] == 0 or j == m - 1:
+                break
+
+        # x += M⁻¹ V^T y, com y da solução do sistema triangular R y = g
+        y = np.zeros(j + 1)
+        for i in range(j, -1, -1):
+            y[i] = (g[i] - H[i, i+1:j+1] @ y[i+1:]) / H[i, i]
+        x += aplicar(V[:j + 1].T @ y)
+        if motivo:
+            return monitor.resultado(x, k, motivo, "GMRES")
+
+        # Reinício: resíduo verdadeiro (corrige o acúmulo de erros de arredondamento)
+        r = b - matvec(x)
+        beta = np.linalg.norm(r)
+        if beta == 0:
+            return monitor.resultado(x, k, "convergiu", "GMRES")
+    return monitor.resultado(x, k, None, "GMRES")
+
+
+def bicgstab(A, b, x0, tol=1e-5, max_iter=1000, precondicionador=None):
+    """
+    Método BiCGSTAB (gradiente biconjugado estabilizado) para A qualquer, com dois produtos
+    A v por iteração e memória constante (ao contrário do GMRES, não guarda uma base).
+    A pode ser a própria função matvec; o pré-condicionador é aplicado à direita.
+
+    Parâmetros:
+        A (ndarray, MatrizCSR ou função): Matriz do sistema ou matvec(v).
+        b (ndarray): Vetor do lado direito.
+        x0 (ndarray): Aproximação inicial.
+        tol (float): Para quando ‖b - Ax‖₂ < tol·‖b‖₂ (com b = 0 retorna x = 0 sem iterar).
+        max_iter (int): Número máximo de iterações.
+        precondicionador: Como em gradientes_conjugados.
+
+    Retorno:
+        resultado (ResultadoIterativo): Solução, iterações, motivo da parada e histórico
+                                        de ‖b - Ax‖₂ (no início e após cada iteração).
+
+    Levanta:
+        ArithmeticError: Se o método sofrer uma quebra (rho ou omega nulos).
+    """
+    matvec = operador(A)
+    aplicar = _aplicar_precondicionador(A, precondicionador)
+
+    b = np.asarray(b, dtype=float)
+    x = np.array(x0, dtype=float)
+    if not b.any():
+        return _sistema_homogeneo(x, tol, max_iter, "BiCGSTAB")
+    r = b - matvec(x)
+    r_sombra = r.copy()  # Vetor fixo da biortogonalização
+    monitor = MonitorConvergencia(tol, max_iter, np.linalg.norm(b))
+    if monitor.registrar(np.linalg.norm(r)) == "convergiu":
+        return monitor.resultado(x, 0, "convergiu", "BiCGSTAB")
+
+    rho = alfa = omega = 1.0
+    v = np.zeros_like(r)
+    p = np.zeros_like(r)
+    for k in range(max_iter):
+        rho_novo = r_sombra @ r
+        if rho_novo == 0 or omega == 0:
+            raise ArithmeticError("Quebra do BiCGSTAB (rho ou omega nulo).")
+        p = r + (rho_novo / rho) * (alfa / omega) * (p - omega * v)
+        rho = rho_novo
+
+        p_chapeu = aplicar(p)
+        v = matvec(p_chapeu)
+        alfa = rho / (r_sombra @ v)
+        s = r - alfa * v
+        if np.linalg.norm(s) < monitor.limite:
+            # Meia iteração já basta: o resíduo s é o da nova aproximação
+            x += alfa * p_chapeu
+            monitor.registrar(np.linalg.norm(s))
+            return monitor.resultado(x, k + 1, "convergiu", "BiCGSTAB")
+
+        s_chapeu = aplicar(s)
+        t = matvec(s_chapeu)
+        omega = (t @ s) / (t @ t)
+        x += alfa * p_chapeu + omega * s_chapeu
+        r = s - omega * t
+        motivo = monitor.registrar(np.linalg.norm(r))
+        if motivo:
+            return monitor.resultado(x, k + 1, motivo, "BiCGSTAB")
+    return monitor.resultado(x, max_iter, None, "BiCGSTAB")